@@ -0,0 +1,260 @@
+import hashlib
+from dataclasses import dataclass, fields
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable
+
+from flask import Blueprint, current_app, jsonify, make_response, request, url_for
+from main import (
+    animal_repo,
+    adopter_repo,
+    reservation_repo,
+    adoption_repo,
+    table_version_repo,
+    timeline_service
+)
+from infrastructure.repositories.animal_repo import _load_temperament
+from domain.people.adopter import Adopter
+
+api = Blueprint("api", __name__, url_prefix="/api/v1")
+
+# -------------------------- RESOURCES --------------------------
+
+@dataclass(frozen=True, slots=True)
+class Field:
+    """Campo exposto pela API: coluna de origem e conversão opcional do valor armazenado."""
+    column: str
+    encode: Callable[[Any], Any] | None = None
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _extra(key: str) -> Field:
+    """Campo armazenado em extra_data (ex.: needs_walk, exclusivo de cães)."""
+    return Field("extra_data", lambda extra: (extra or {}).get(key))
+
+
+@dataclass(frozen=True, slots=True)
+class Resource:
+    """
+    Coleção exposta pela API.
+
+    Os campos pedidos em ``fields=`` são convertidos nas colunas
+    correspondentes, e somente elas são lidas do banco
+    (BaseRepository.list_page_columns / get_columns).
+    """
+    repo: Any
+    fields: dict[str, Field]
+
+    @property
+    def tables(self) -> tuple[str, ...]:
+        return (self.repo.model_class.__tablename__,)
+
+    def parse_fields(self, raw: str | None) -> list[str]:
+        """
+        Interpreta o parâmetro ``fields`` (nomes separados por vírgula).
+
+        Raises:
+            ValueError: Caso algum campo não exista no recurso.
+        """
+        if not raw:
+            return list(self.fields)
+
+        names = list(dict.fromkeys(name.strip() for name in raw.split(",") if name.strip()))
+        invalid = [name for name in names if name not in self.fields]
+
+        if invalid:
+            raise ValueError(f"Campos inválidos: {', '.join(invalid)}")
+
+        return names
+
+    def columns(self, names: list[str]) -> list[str]:
+        return list(dict.fromkeys(self.fields[name].column for name in names))
+
+    def encode(self, row: dict, names: list[str]) -> dict:
+        item = {}
+
+        for name in names:
+            field = self.fields[name]
+            value = row[field.column]
+            item[name] = field.encode(value) if field.encode else value
+
+        return item
+
+
+RESOURCES = {
+    "animals": Resource(animal_repo, {
+        "id": Field("id"),
+        "species": Field("species"),
+        "breed": Field("breed"),
+        "name": Field("name"),
+        "gender": Field("gender"),
+        "age_months": Field("age_months"),
+        "size": Field("size"),
+        "temperament": Field("temperament", _load_temperament),
+        "status": Field("status"),
+        "timestamp": Field("timestamp", _isoformat),
+        "needs_walk": _extra("needs_walk"),
+        "is_hypoallergenic": _extra("is_hypoallergenic"),
+    }),
+    "adopters": Resource(adopter_repo, {
+        "id": Field("id"),
+        "name": Field("name"),
+        "age": Field("age"),
+        "housing_type": Field("housing_type"),
+        "usable_area": Field("usable_area"),
+        "has_pet_experience": Field("has_pet_experience"),
+        "has_children_at_home": Field("has_children_at_home"),
+        "has_other_animals": Field("has_other_animals"),
+        "timestamp": Field("timestamp", _isoformat),
+    }),
+    "reservations": Resource(reservation_repo, {
+        "id": Field("id"),
+        "animal_id": Field("animal_id"),
+        "adopter_id": Field("adopter_id"),
+        "compatibility_rate": Field("compatibility_rate"),
+        "is_canceled": Field("is_canceled"),
+        "timestamp": Field("timestamp", _isoformat),
+    }),
+    "adoptions": Resource(adoption_repo, {
+        "id": Field("id"),
+        "animal_id": Field("animal_id"),
+        "adopter_id": Field("adopter_id"),
+        "fee": Field("fee"),
+        "timestamp": Field("timestamp", _isoformat),
+    }),
+}
+
+# -------------------------- RESPONSES --------------------------
+
+def _conditional(tables: tuple[str, ...], build: Callable[[], Any]):
+    """
+    Resposta JSON com ETag forte.
+
+    Assim como em http_cached, o ETag é derivado dos contadores de alteração
+    das tabelas lidas pela rota (TableVersionRepository, uma única consulta),
+    da rota e dos seus parâmetros. Quando o cliente envia o ETag atual em
+    If-None-Match, a resposta 304 Not Modified é devolvida sem consultar os
+    dados nem montar o conteúdo.
+
+    Args:
+        tables (tuple[str, ...]): Tabelas das quais o conteúdo depende.
+        build (Callable[[], Any]): Função que monta o conteúdo JSON (ou uma
+            resposta de erro, que é devolvida sem ETag).
+    """
+    versions, _ = table_version_repo.read(tables)
+    key = (
+        request.endpoint,
+        tuple(sorted(request.view_args.items())),
+        tuple(sorted(request.args.items(multi=True))),
+        versions
+    )
+    etag = hashlib.sha1(repr(key).encode()).hexdigest()
+
+    if request.if_none_match.contains_weak(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = make_response(build())
+
+        if response.status_code != 200:
+            return response
+
+    response.set_etag(etag)
+    return response
+
+
+def _error(message: str, status: int):
+    return jsonify(error=message), status
+
+# -------------------------- COLLECTIONS --------------------------
+
+@api.route("/<any(animals, adopters, reservations, adoptions):name>")
+def list_resource(name: str):
+    """
+    Lista uma coleção com paginação por cursor.
+
+    Query params:
+        after (int): Cursor retornado em ``next_after`` pela página anterior.
+        limit (int): Quantidade de registros da página.
+        fields (str): Campos a serem retornados, separados por vírgula.
+    """
+    resource = RESOURCES[name]
+
+    try:
+        names = resource.parse_fields(request.args.get("fields"))
+    except ValueError as e:
+        return _error(str(e), 400)
+
+    def build() -> dict:
+        rows, next_after = resource.repo.list_page_columns(
+            resource.columns(names),
+            after_id=request.args.get("after", type=int),
+            limit=request.args.get("limit", type=int)
+        )
+
+        next_url = None
+        if next_after is not None:
+            # to_dict(flat=False) preserva parâmetros repetidos
+            next_url = url_for(
+                ".list_resource", name=name, **{**request.args.to_dict(flat=False), "after": next_after}
+            )
+
+        return {
+            "items": [resource.encode(row, names) for row in rows],
+            "next_after": next_after,
+            "next": next_url,
+        }
+
+    return _conditional(resource.tables, build)
+
+
+@api.route("/<any(animals, adopters, reservations, adoptions):name>/<int:id>")
+def get_resource(name: str, id: int):
+    """Retorna um único registro. Aceita o mesmo parâmetro ``fields`` das coleções."""
+    resource = RESOURCES[name]
+
+    try:
+        names = resource.parse_fields(request.args.get("fields"))
+    except ValueError as e:
+        return _error(str(e), 400)
+
+    def build():
+        row = resource.repo.get_columns(id, resource.columns(names))
+
+        if row is None:
+            return _error("Registro não encontrado.", 404)
+
+        return resource.encode(row, names)
+
+    return _conditional(resource.tables, build)
+
+# -------------------------- TIMELINE --------------------------
+
+def _encode_event_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Adopter):
+        return {"id": value.id, "name": value.name}
+    return value
+
+
+@api.route("/animals/<int:animal_id>/timeline")
+def animal_timeline(animal_id: int):
+    """Linha do tempo do animal (vacinas, treinamentos, quarentenas, adoções e devoluções)."""
+    def build():
+        if animal_repo.get_columns(animal_id, ["id"]) is None:
+            return _error("Animal não encontrado.", 404)
+
+        events = timeline_service.build_animal_timeline(animal_id=animal_id)
+
+        return {"items": [
+            {f.name: _encode_event_value(getattr(event, f.name)) for f in fields(event)}
+            for event in events
+        ]}
+
+    # Mesmas tabelas da página HTML da linha do tempo
+    return _conditional(("animals", "events", "adoptions", "adoption_returns", "adopters"), build)
@@ -0,0 +1,173 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cache, wraps
+from typing import Callable, Hashable
+
+from flask import current_app, make_response, request
+from werkzeug.http import is_resource_modified
+
+from config import settings, SettingsSnapshot
+from main import table_version_repo
+
+# -------------------------- PAGE CACHE --------------------------
+
+@dataclass(frozen=True, slots=True)
+class CachedPage:
+    """Corpo já renderizado de uma página e seu tipo de conteúdo."""
+    body: bytes
+    mimetype: str
+
+
+class PageCache:
+    """
+    Cache LRU de páginas renderizadas.
+
+    As chaves incluem as versões das tabelas de que a página depende
+    (TableVersionRepository), de modo que uma escrita nunca precisa remover
+    entradas: a página passa a ser procurada por outra chave e a antiga sai
+    do cache pelo descarte LRU.
+
+    O tamanho máximo vem de ``http_cache.page_cache_size`` no settings.json e
+    é reaplicado quando a configuração é recarregada; 0 desativa o cache de
+    páginas, mantendo apenas o validador HTTP (ETag).
+
+    Attributes:
+        max_size (int): Quantidade máxima de páginas armazenadas.
+        hits (int): Páginas servidas a partir do cache.
+        misses (int): Páginas que precisaram ser renderizadas.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__pages = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def load_settings(self, snapshot: SettingsSnapshot) -> None:
+        """
+        Aplica o tamanho máximo da configuração informada, descartando as
+        páginas menos usadas que excederem o novo limite.
+
+        Args:
+            snapshot (SettingsSnapshot): Configuração a ser aplicada.
+        """
+        with self.__lock:
+            self.max_size = int(snapshot.http_cache["page_cache_size"])
+            self.__evict()
+
+    def get(self, key: Hashable) -> CachedPage | None:
+        with self.__lock:
+            page = self.__pages.get(key)
+
+            if page is None:
+                self.misses += 1
+                return None
+
+            self.__pages.move_to_end(key)
+            self.hits += 1
+            return page
+
+    def put(self, key: Hashable, page: CachedPage) -> None:
+        with self.__lock:
+            if self.max_size <= 0:
+                return
+
+            self.__pages[key] = page
+            self.__pages.move_to_end(key)
+            self.__evict()
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__pages.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.__pages)
+
+    def __evict(self) -> None:
+        while len(self.__pages) > max(self.max_size, 0):
+            self.__pages.popitem(last=False)
+
+
+page_cache = PageCache(int(settings.http_cache["page_cache_size"]))
+settings.on_change(page_cache.load_settings)
+
+# -------------------------- DECORATOR --------------------------
+
+@cache
+def _release(root_path: str, template_folder: str) -> str:
+    """
+    Identifica a versão dos templates (data de modificação dos arquivos), para
+    que uma atualização da aplicação invalide os ETags já enviados aos clientes.
+    """
+    mtimes = sorted(
+        (entry.name, entry.stat().st_mtime_ns)
+        for entry in os.scandir(os.path.join(root_path, template_folder))
+        if entry.is_file()
+    )
+    return hashlib.sha1(repr(mtimes).encode()).hexdigest()
+
+
+def http_cached(*tables: str) -> Callable:
+    """
+    Aplica cache HTTP a uma página que depende apenas das tabelas informadas
+    e dos parâmetros da requisição.
+
+    A cada requisição, os contadores de alteração das tabelas são lidos em
+    uma única consulta e, junto com a rota e seus parâmetros, formam o ETag
+    da página. Se o cliente já possui a versão atual (If-None-Match), a
+    resposta é 304 Not Modified, sem consultar os dados nem renderizar o
+    template. Last-Modified não é enviado: com resolução de segundos, duas
+    escritas no mesmo segundo fariam If-Modified-Since aceitar uma página
+    desatualizada. Caso contrário, a página é servida do PageCache ou renderizada
+    e armazenada nele (apenas respostas 200).
+
+    Quando ``http_cache.enabled`` é falso no settings.json, a view é
+    executada normalmente, sem cabeçalhos de cache.
+
+    Args:
+        *tables (str): Tabelas cujos dados são exibidos pela página.
+    """
+    def decorator(view: Callable) -> Callable:
+        @wraps(view)
+        def wrapper(**kwargs):
+            if not settings.http_cache["enabled"]:
+                return view(**kwargs)
+
+            versions, _ = table_version_repo.read(tables)
+            key = (
+                request.endpoint,
+                tuple(sorted(request.args.items(multi=True))),
+                tuple(sorted(kwargs.items())),
+                versions,
+                _release(current_app.root_path, current_app.template_folder)
+            )
+            etag = hashlib.sha1(repr(key).encode()).hexdigest()
+
+            if not is_resource_modified(request.environ, etag=etag):
+                response = current_app.response_class(status=304)
+            else:
+                page = page_cache.get(key)
+
+                if page is not None:
+                    response = current_app.response_class(page.body, mimetype=page.mimetype)
+                else:
+                    response = make_response(view(**kwargs))
+
+                    if response.status_code != 200:
+                        return response
+
+                    page_cache.put(key, CachedPage(response.get_data(), response.mimetype))
+
+            response.set_etag(etag)
+            response.cache_control.no_cache = True
+            return response
+
+        return wrapper
+
+    return decorator
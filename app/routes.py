@@ -1,35 +1,86 @@
-import json
 from flask import render_template, redirect, url_for, request, Response
 from main import(
-    app,
     animal_service,
     adopter_service,
     reservation_service,
     adoption_service,
     timeline_service,
-    contract_service
+    contract_service,
+    recommendation_service
 )
+from config import settings
+from app.http_cache import http_cached
 
-with open("settings.json", "r", encoding="utf-8") as f:
-    settings = json.load(f)
+# Rotas declaradas com @route, registradas em cada aplicação criada por
+# create_app (o endpoint de cada rota é o nome da função, como em app.route)
+_routes = []
 
-minimum_age =  settings["policies"]["minimum_adopter_age"]
+def route(rule: str, **options):
+    def decorator(view):
+        _routes.append((rule, view, options))
+        return view
+    return decorator
 
-@app.route("/")
+def register_routes(app) -> None:
+    """Registra as rotas deste módulo na aplicação informada."""
+    for rule, view, options in _routes:
+        app.add_url_rule(rule, view_func=view, **options)
+
+@route("/")
 def homepage():
     return render_template("index.html")
 
 # -------------------------- ANIMALS --------------------------
-@app.route("/animals", methods=["GET"])
+@route("/animals", methods=["GET"])
+@http_cached("animals")
 def animals_list():
-    animals = animal_service.list_animals()
-    return render_template("animals_list.html", animals=animals)
+    page = animal_service.list_animals(
+        after_id=request.args.get("after", type=int),
+        limit=request.args.get("limit", type=int)
+    )
+    return render_template(
+        "animals_list.html",
+        animals=page["items"],
+        next_after=page["next_after"],
+        limit=request.args.get("limit", type=int)
+    )
+
+@route("/animals/search", methods=["GET"])
+@http_cached("animals")
+def animals_search():
+    text = request.args.get("q", "").strip()
+    filters = {facet: request.args.getlist(facet) for facet in animal_service.search_facets()}
 
-@app.route("/animals/new")
+    try:
+        result = animal_service.search_animals(
+            text=text,
+            filters=filters,
+            after_id=request.args.get("after", type=int),
+            limit=request.args.get("limit", type=int)
+        )
+    except ValueError as e:
+        return render_template(
+            "error.html",
+            err_msg=str(e)
+        )
+
+    return render_template(
+        "animals_search.html",
+        animals=result["items"],
+        next_after=result["next_after"],
+        total=result["total"],
+        facets=result["facets"],
+        approximate=result["approximate"],
+        text=text,
+        filters=filters,
+        limit=request.args.get("limit", type=int)
+    )
+
+@route("/animals/new")
 def animal_registration():
     return render_template("animal_registration.html")
 
-@app.route("/animals/save", methods=["POST"])
+@route("/animals/save", methods=["POST"])
 def save_animal():
     was_saved = animal_service.create_animal(form_data=request.form)
 
@@ -41,18 +92,18 @@ def save_animal():
 
     return redirect(url_for("animals_list"))
 
-@app.route("/animals/<int:id>/details")
+@route("/animals/<int:id>/details")
 def animal_details(id):
     animal = animal_service.get_animal(id)
     return render_template("animal_details.html", animal=animal)
 
-@app.route("/animals/<int:id>/details/change-status/<string:status>")
+@route("/animals/<int:id>/details/change-status/<string:status>")
 def change_animal_status(id, status):
     animal_service.change_status(id, status)
     return redirect(url_for("animal_details", id=id))
 
 # VACCINE
-@app.route("/animals/<int:animal_id>/vaccine/new")
+@route("/animals/<int:animal_id>/vaccine/new")
 def vaccine_registration(animal_id):
     animal = animal_service.prepare_vaccine_form(animal_id)
     return render_template(
@@ -60,7 +111,7 @@ def vaccine_registration(animal_id):
         animal=animal
     )
 
-@app.route("/animals/<int:animal_id>/vaccine/save", methods=["POST"])
+@route("/animals/<int:animal_id>/vaccine/save", methods=["POST"])
 def save_vaccine(animal_id):
     animal_service.register_vaccine(
         animal_id=animal_id,
@@ -69,7 +120,7 @@ def save_vaccine(animal_id):
     return redirect(url_for("animal_details", id=animal_id))
 
 # TRAINING
-@app.route("/animals/<int:animal_id>/training/new")
+@route("/animals/<int:animal_id>/training/new")
 def training_registration(animal_id):
     animal = animal_service.prepare_training_form(animal_id)
     return render_template(
@@ -77,7 +128,7 @@ def training_registration(animal_id):
         animal=animal
     )
 
-@app.route("/animals/<int:animal_id>/training/save", methods=["POST"])
+@route("/animals/<int:animal_id>/training/save", methods=["POST"])
 def save_training(animal_id):
     animal_service.register_training(
         animal_id=animal_id,
@@ -86,7 +137,8 @@ def save_training(animal_id):
     return redirect(url_for("animal_details", id=animal_id))
 
 # TIMELINE
-@app.route("/animals/<animal_id>/details/timeline")
+@route("/animals/<int:animal_id>/details/timeline")
+@http_cached("animals", "events", "adoptions", "adoption_returns", "adopters")
 def animal_timeline(animal_id):
     animal = animal_service.get_animal(animal_id)
 
@@ -98,13 +150,36 @@ def animal_timeline(animal_id):
         events=events
     )
 
-@app.route("/animals/<int:animal_id>/edit", methods=["GET"])
+# RECOMMENDATIONS
+@route("/animals/<int:animal_id>/recommendations")
+def animal_recommendations(animal_id):
+    try:
+        animal = animal_service.get_animal(animal_id)
+
+        recommendations = recommendation_service.top_adopters_for(
+            animal_id=animal_id,
+            k=request.args.get("k", type=int)
+        )
+
+    except ValueError as e:
+        return render_template(
+            "error.html",
+            err_msg=str(e)
+        )
+
+    return render_template(
+        "animal_recommendations.html",
+        animal=animal,
+        recommendations=recommendations
+    )
+
+@route("/animals/<int:animal_id>/edit", methods=["GET"])
 def edit_animal(animal_id):
     animal = animal_service.get_by_id(animal_id)
     return render_template("animal_edit.html", animal=animal)
 
 
-@app.route("/animals/update", methods=["POST"])
+@route("/animals/update", methods=["POST"])
 def update_animal():
     data = request.form
     animal_id = int(data.get("animal_id"))
@@ -122,19 +197,28 @@ def update_animal():
     return redirect(url_for("animals_list"))
 
 # -------------------------- ADOPTERS --------------------------
-@app.route("/adopters", methods=["GET"])
+@route("/adopters", methods=["GET"])
+@http_cached("adopters")
 def adopters_list():
-    adopters = adopter_service.list_adopters()
-    return render_template("adopters_list.html", adopters=adopters)
+    page = adopter_service.list_adopters(
+        after_id=request.args.get("after", type=int),
+        limit=request.args.get("limit", type=int)
+    )
+    return render_template(
+        "adopters_list.html",
+        adopters=page["items"],
+        next_after=page["next_after"],
+        limit=request.args.get("limit", type=int)
+    )
 
-@app.route("/adopters/new")
+@route("/adopters/new")
 def adopter_registration():
     return render_template(
         "adopter_registration.html",
-        minimum_age=minimum_age
+        minimum_age=settings.minimum_adopter_age
     )
 
-@app.route("/adopters/save", methods=["POST"])
+@route("/adopters/save", methods=["POST"])
 def save_adopter():
     try:
         adopter_service.register_adopter(request.form)
@@ -147,7 +231,29 @@ def save_adopter():
         )
     
 
-@app.route("/adopters/<int:adopter_id>/edit", methods=["GET"])
+@route("/adopters/<int:adopter_id>/recommendations")
+def adopter_recommendations(adopter_id):
+    try:
+        adopter = adopter_service.get_by_id(adopter_id)
+
+        recommendations = recommendation_service.top_animals_for(
+            adopter_id=adopter_id,
+            k=request.args.get("k", type=int)
+        )
+
+    except ValueError as e:
+        return render_template(
+            "error.html",
+            err_msg=str(e)
+        )
+
+    return render_template(
+        "adopter_recommendations.html",
+        adopter=adopter,
+        recommendations=recommendations
+    )
+
+@route("/adopters/<int:adopter_id>/edit", methods=["GET"])
 def edit_adopter(adopter_id):
     form_data = request.form.to_dict()
 
@@ -162,7 +268,7 @@ def edit_adopter(adopter_id):
     return redirect(url_for("adopters_list"))
 
 
-@app.route("/adopters/<int:adopter_id>/update", methods=["POST"])
+@route("/adopters/<int:adopter_id>/update", methods=["POST"])
 def update_adopter(adopter_id):
     form_data = request.form.to_dict()
 
@@ -186,7 +292,7 @@ def update_adopter(adopter_id):
     return redirect(url_for("adopters_list"))
 
 # -------------------------- RESERVATION --------------------------
-@app.route("/reservations")
+@route("/reservations")
 def adoption_reservation_list():
     queues = reservation_service.list_reservations()
     return render_template(
@@ -195,11 +301,11 @@ def adoption_reservation_list():
         ongoing_queues=queues["ongoing"]
     )
 
-@app.route("/reservations/new")
+@route("/reservations/new")
 def adoption_reservation():
     id_args = reservation_service.prepare_reservation_form(
-        animal_id=request.args.get("animal_id"),
-        adopter_id=request.args.get("adopter_id")
+        animal_id=request.args.get("animal_id", type=int),
+        adopter_id=request.args.get("adopter_id", type=int)
     )
 
     return render_template(
@@ -207,7 +313,7 @@ def adoption_reservation():
         **id_args
     )
 
-@app.route("/reservations/save", methods=["POST"])
+@route("/reservations/save", methods=["POST"])
 def save_adoption_reservation():
     try:
         reservation_service.create_reservation(
@@ -222,14 +328,14 @@ def save_adoption_reservation():
             err_msg=str(e)
         )
 
-@app.route("/reservations/confirm")
+@route("/reservations/confirm")
 def confirm_adoption():
     reservation_service.confirm_adoption(
         reservation_id=int(request.args.get("id"))
     )
     return redirect(url_for("adoption_reservation_list"))
 
-@app.route("/reservations/cancel")
+@route("/reservations/cancel")
 def cancel_reservation():
     reservation_service.cancel_reservation(
         reservation_id=int(request.args.get("id"))
@@ -237,7 +343,8 @@ def cancel_reservation():
     return redirect(url_for("adoption_reservation_list"))
 
 # -------------------------- ADOPTION --------------------------
-@app.route("/adoptions")
+@route("/adoptions")
+@http_cached("adoptions", "adoption_returns", "animals", "adopters")
 def adoptions_list():
     data = adoption_service.list_adoptions()
 
@@ -247,7 +354,7 @@ def adoptions_list():
         adoption_returns=data["returned"]
     )
 
-@app.route("/adoptions/returns/new")
+@route("/adoptions/returns/new")
 def adoption_return_registration():
     animal = adoption_service.prepare_return_form(
         animal_id=int(request.args.get("animal_id"))
@@ -257,7 +364,7 @@ def adoption_return_registration():
         animal=animal
     )
 
-@app.route("/adoptions/returns/save", methods=["POST"])
+@route("/adoptions/returns/save", methods=["POST"])
 def save_adoption_return():
     adoption_service.register_return(
         animal_id=int(request.form["animal_id"]),
@@ -270,7 +377,7 @@ def save_adoption_return():
         )
     )
 
-@app.route("/adoptions/<int:adoption_id>/contract")
+@route("/adoptions/<int:adoption_id>/contract")
 def adoption_contract(adoption_id):
 
     contract_text = contract_service.generate_contract(adoption_id)
@@ -281,7 +388,7 @@ def adoption_contract(adoption_id):
         contract=contract_text
     )
 
-@app.route("/adoptions/<int:adoption_id>/contract/download")
+@route("/adoptions/<int:adoption_id>/contract/download")
 def download_adoption_contract(adoption_id):
 
     contract_text = contract_service.generate_contract(adoption_id)
@@ -0,0 +1,8 @@
+"""
+Benchmarks do sistema de adoção.
+
+Cada módulo é um script independente e deve ser executado a partir da raiz
+do projeto (por causa do settings.json), por exemplo:
+
+    python -m benchmarks.bench_iter_all
+"""
@@ -0,0 +1,81 @@
+"""
+Mede o tempo da atribuição global de filas expiradas (AssignmentService.solve)
+sobre lances esparsos e compara o resultado com a escolha gulosa de
+ReservationService.finalize_queue (primeiro da fila de cada animal).
+
+Os lances são gerados em memória: cada adotante reserva alguns animais,
+com preferência por uma parcela "popular" do abrigo, o que faz o mesmo
+adotante liderar várias filas.
+
+Uso:
+    python -m benchmarks.bench_assignment
+"""
+import time
+import numpy as np
+
+from benchmarks.utils import print_table
+from services.assignment_service import AssignmentService
+
+N_ANIMALS = 10_000
+N_ADOPTERS = 10_000
+BIDS_PER_ADOPTER = 10
+SEED = 42
+
+
+def generate_bids(rng) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Gera lances (animal, adotante, taxa) únicos por par."""
+    popularity = 1 / np.arange(1, N_ANIMALS + 1) ** 0.8
+    popularity /= popularity.sum()
+
+    animal_ids = rng.choice(N_ANIMALS, size=N_ADOPTERS * BIDS_PER_ADOPTER, p=popularity) + 1
+    adopter_ids = np.repeat(np.arange(1, N_ADOPTERS + 1), BIDS_PER_ADOPTER)
+
+    pairs = np.unique(np.stack([animal_ids, adopter_ids], axis=1), axis=0)
+    rates = np.round(rng.uniform(30, 100, size=len(pairs)), 2)
+
+    return pairs[:, 0], pairs[:, 1], rates
+
+
+def summarize(adopter_ids, rates, winners) -> list:
+    served = np.unique(adopter_ids[winners], return_counts=True)[1]
+    return [
+        len(winners),
+        len(served),
+        int((served > 1).sum()),
+        f"{rates[winners].sum():.0f}",
+    ]
+
+
+def main() -> None:
+    rng = np.random.default_rng(SEED)
+    animal_ids, adopter_ids, rates = generate_bids(rng)
+    service = AssignmentService(reservation_repo=None)
+
+    start = time.perf_counter()
+    greedy = service.solve(animal_ids, adopter_ids, rates, max_per_adopter=None)
+    greedy_ms = (time.perf_counter() - start) * 1000
+
+    rows = [["guloso (finalize_queue)", *summarize(adopter_ids, rates, greedy), f"{greedy_ms:.0f}"]]
+
+    for limit in (1, 2):
+        start = time.perf_counter()
+        winners = service.solve(animal_ids, adopter_ids, rates, max_per_adopter=limit)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        rows.append([
+            f"global (até {limit} por adotante)",
+            *summarize(adopter_ids, rates, winners),
+            f"{elapsed_ms:.0f}"
+        ])
+
+    print(
+        f"{len(np.unique(animal_ids))} filas, {N_ADOPTERS} adotantes, "
+        f"{len(rates)} lances"
+    )
+    print_table(
+        ["estratégia", "animais", "adotantes", "adotantes c/ >1", "compat. total", "ms"],
+        rows
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Mede a memória ocupada por 100 mil entidades de domínio com __slots__ e
+com o layout anterior, em que cada instância carregava um __dict__ (e os
+mixins criavam as listas de vacinas e treinamentos em toda instância).
+
+O layout anterior é reproduzido com classes simples que recebem, na mesma
+ordem dos construtores originais, os mesmos atributos de instância. Os
+valores (strings, enums, datas) são compartilhados entre as instâncias, de
+modo que a medição (tracemalloc) reflete apenas o custo de cada objeto.
+
+Uso:
+    python -m benchmarks.bench_domain_memory
+"""
+import gc
+import tracemalloc
+from datetime import datetime
+
+from benchmarks.utils import print_table
+from domain.animals.cat import Cat
+from domain.animals.dog import Dog
+from domain.animals.animal import Species, Gender, Size
+from domain.enums.animal_status import AnimalStatus
+from domain.people.adopter import Adopter, HousingType
+from domain.adoptions.reservation_queue import ReservationQueue
+from domain.events.animal_events import VaccineEvent
+
+N = 100_000
+NOW = datetime(2024, 1, 1)
+
+ANIMAL = dict(
+    breed="Vira-lata", name="Rex", gender=Gender.MALE, age_months=12, size=Size.MEDIUM,
+    temperament=["Calmo", "Sociável"], status=AnimalStatus.AVAILABLE, id=1, timestamp=NOW
+)
+ADOPTER = dict(
+    name="Alice", age=30, housing_type=HousingType.HOUSE, usable_area=80.0,
+    has_pet_experience=True, has_children_at_home=False, has_other_animals=False,
+    id=1, timestamp=NOW
+)
+RESERVATION = dict(
+    animal_id=1, adopter_id=1, compatibility_rate=80.0, is_canceled=False, id=1, timestamp=NOW
+)
+EVENT = dict(id=1, animal_id=1, timestamp=NOW, vaccine_name="V8", veterinarian="Dra. Ana")
+
+# ---- Layout anterior (atributos no __dict__) ----
+
+def field_name(attr: str) -> str:
+    """Nome do argumento correspondente a um atributo privado (ex.: _Dog__needs_walk)."""
+    return attr.split("__")[-1].lstrip("_")
+
+
+def legacy_factory(name: str, attributes: list[str], eager_lists: tuple[str, ...] = (), flags=()):
+    """
+    Cria uma fábrica de objetos com __dict__ contendo os atributos informados,
+    mais as listas vazias e os indicadores que os mixins atribuíam por instância.
+    """
+    cls = type(f"Legacy{name}", (), {})
+
+    def build(values: dict):
+        obj = cls()
+        for attr in attributes:
+            setattr(obj, attr, values[field_name(attr)])
+        for attr in eager_lists:
+            setattr(obj, attr, [])
+        for attr in flags:
+            setattr(obj, attr, True)
+        return obj
+
+    return build
+
+
+ANIMAL_ATTRS = [
+    "_species", "_breed", "_name", "_gender", "_age_months",
+    "_size", "_temperament", "_status", "_id", "_timestamp"
+]
+
+CASES = [
+    (
+        "Dog",
+        lambda values: Dog.from_row(**values),
+        legacy_factory(
+            "Dog", ANIMAL_ATTRS + ["_Dog__needs_walk"],
+            eager_lists=("_vaccines", "_trainings"), flags=("is_vaccineable", "is_trainable")
+        ),
+        dict(ANIMAL, species=Species.DOG, needs_walk=True),
+    ),
+    (
+        "Cat",
+        lambda values: Cat.from_row(**values),
+        legacy_factory(
+            "Cat", ANIMAL_ATTRS + ["_Cat__is_hypoallergenic"],
+            eager_lists=("_vaccines",), flags=("is_vaccineable",)
+        ),
+        dict(ANIMAL, species=Species.CAT, is_hypoallergenic=False),
+    ),
+    (
+        "Adopter",
+        lambda values: Adopter.from_row(**values),
+        legacy_factory("Adopter", [
+            "_name", "_Adopter__age", "_id", "_timestamp", "_Adopter__housing_type",
+            "_Adopter__usable_area", "_Adopter__has_pet_experience",
+            "_Adopter__has_children_at_home", "_Adopter__has_other_animals"
+        ]),
+        ADOPTER,
+    ),
+    (
+        "ReservationQueue",
+        lambda values: ReservationQueue.from_row(**values),
+        legacy_factory("ReservationQueue", [
+            "_ReservationQueue__animal_id", "_ReservationQueue__adopter_id",
+            "_ReservationQueue__compatibility_rate", "_ReservationQueue__is_canceled",
+            "_ReservationQueue__id", "_ReservationQueue__timestamp"
+        ]),
+        RESERVATION,
+    ),
+    (
+        "VaccineEvent",
+        lambda values: VaccineEvent(**values),
+        legacy_factory(
+            "VaccineEvent", ["id", "animal_id", "timestamp", "vaccine_name", "veterinarian"],
+            flags=("event_type",)
+        ),
+        EVENT,
+    ),
+]
+
+
+def measure(build) -> int:
+    """Bytes alocados para manter N objetos vivos (sem contar a lista que os guarda)."""
+    gc.collect()
+    objects = [None] * N
+
+    tracemalloc.start()
+    for i in range(N):
+        objects[i] = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del objects
+    return size
+
+
+def main() -> None:
+    rows = []
+    for name, slotted, legacy, values in CASES:
+        # Cada animal possui a própria lista de temperamentos, nos dois layouts
+        if "temperament" in values:
+            fresh = lambda: dict(values, temperament=list(values["temperament"]))
+        else:
+            fresh = lambda: values
+
+        before = measure(lambda: legacy(fresh()))
+        after = measure(lambda: slotted(fresh()))
+        rows.append([
+            name,
+            f"{before / 2**20:.1f} MiB",
+            f"{after / 2**20:.1f} MiB",
+            f"{before / N:.0f} B",
+            f"{after / N:.0f} B",
+            f"{1 - after / before:.0%}",
+        ])
+
+    print(f"{N} instâncias por entidade")
+    print_table(
+        ["entidade", "__dict__", "__slots__", "B/obj antes", "B/obj depois", "redução"],
+        rows
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Mede requisições por segundo das páginas de listagem (/animals e /adopters)
+com e sem o cache HTTP (app/http_cache.py):
+
+    - desativado: consulta e renderização a cada requisição;
+    - validador: ETag, sem cache de páginas;
+    - cache de páginas: corpo servido do PageCache;
+    - 304: o cliente revalida com If-None-Match e não recebe o corpo.
+
+A aplicação é criada por create_app sobre um banco temporário, populado
+diretamente (TableVersionRepository.bump registra a carga), sem o agendador
+de expiração.
+
+Uso:
+    python -m benchmarks.bench_http_cache
+"""
+import json
+import random
+import time
+from dataclasses import replace
+from datetime import datetime
+from types import MappingProxyType
+from sqlalchemy import insert
+
+from benchmarks.utils import temp_database, print_table
+from config import settings
+from infrastructure.database.db_connection import Session
+from main import create_app, table_version_repo
+from app.http_cache import page_cache
+from infrastructure.db_models.animal_model import AnimalModel
+from infrastructure.db_models.adopter_model import AdopterModel
+
+N_ROWS = 50_000
+DURATION = 2.0
+PAGES = ["/animals?limit=50", "/adopters?limit=50"]
+TEMPERAMENTS = [["Calmo"], ["Brincalhão", "Sociável"], ["Medroso"], ["Agitado", "Protetor"]]
+
+
+def populate(session) -> None:
+    rng = random.Random(21)
+    now = datetime(2024, 1, 1)
+
+    session.execute(insert(AnimalModel), [
+        dict(
+            species=rng.choice(["CAT", "DOG"]), breed="Vira-lata", name=f"Animal {i}",
+            gender=rng.choice(["MALE", "FEMALE"]), age_months=rng.randint(1, 150),
+            size=rng.choice(["SMALL", "MEDIUM", "LARGE"]),
+            temperament=json.dumps(rng.choice(TEMPERAMENTS)),
+            status="AVAILABLE", timestamp=now, extra_data={"needs_walk": True}
+        )
+        for i in range(N_ROWS)
+    ])
+    session.execute(insert(AdopterModel), [
+        dict(
+            name=f"Adotante {i}", age=rng.randint(18, 80), housing_type="HOUSE",
+            usable_area=80.0, has_pet_experience=True, has_children_at_home=False,
+            has_other_animals=False, timestamp=now
+        )
+        for i in range(N_ROWS)
+    ])
+    session.commit()
+    table_version_repo.bump("animals", "adopters")
+
+
+def configure(enabled: bool, page_cache_size: int) -> None:
+    settings.current = replace(settings.current, http_cache=MappingProxyType({
+        "enabled": enabled, "page_cache_size": page_cache_size
+    }))
+    page_cache.load_settings(settings.current)
+    page_cache.clear()
+
+
+def requests_per_second(client, url: str, headers: dict | None = None) -> float:
+    client.get(url, headers=headers)  # aquece o cache
+
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        response = client.get(url, headers=headers)
+        assert response.status_code in (200, 304)
+        count += 1
+
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    original = settings.current
+    # Mantém a configuração do benchmark mesmo que o settings.json seja alterado
+    settings.CHECK_INTERVAL = float("inf")
+
+    with temp_database(dict(settings.storage_profile)) as (engine, _):
+        client = create_app(engine=engine, start_scheduler=False).test_client()
+        populate(Session())
+
+        rows = []
+
+        for url in PAGES:
+            configure(enabled=False, page_cache_size=0)
+            baseline = requests_per_second(client, url)
+
+            configure(enabled=True, page_cache_size=0)
+            validators = requests_per_second(client, url)
+
+            configure(enabled=True, page_cache_size=256)
+            cached = requests_per_second(client, url)
+
+            etag = client.get(url).headers["ETag"]
+            not_modified = requests_per_second(client, url, {"If-None-Match": etag})
+
+            rows.append([url] + [
+                f"{rps:,.0f} ({rps / baseline:.1f}x)"
+                for rps in (baseline, validators, cached, not_modified)
+            ])
+
+        Session.remove()
+
+    settings.current = original
+
+    print(f"{N_ROWS} animais e adotantes; requisições por segundo ({DURATION:.0f} s por caso)")
+    print_table(["página", "desativado", "validadores", "cache de páginas", "304"], rows)
+
+
+if __name__ == "__main__":
+    main()
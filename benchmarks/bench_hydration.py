@@ -0,0 +1,128 @@
+"""
+Compara o custo por linha da reconstrução de entidades a partir do banco:
+construtor com validação (setters, json.loads por linha) versus from_row.
+
+Os modelos são carregados uma única vez, de modo que o tempo medido
+corresponde apenas à conversão modelo -> entidade de domínio.
+
+Uso:
+    python -m benchmarks.bench_hydration
+"""
+import json
+import random
+import timeit
+from datetime import datetime
+from sqlalchemy import insert
+
+from benchmarks.utils import temp_database, print_table
+from infrastructure.db_models.animal_model import AnimalModel
+from infrastructure.db_models.adopter_model import AdopterModel
+from infrastructure.db_models.reservation_queue_model import ReservationQueueModel
+from infrastructure.repositories import (
+    AnimalRepository, AdopterRepository, ReservationQueueRepository
+)
+from domain.animals.cat import Cat
+from domain.animals.dog import Dog
+from domain.animals.animal import Species, Gender, Size
+from domain.enums.animal_status import AnimalStatus
+from domain.people.adopter import Adopter, HousingType
+from domain.adoptions.reservation_queue import ReservationQueue
+
+N_ROWS = 20_000
+REPEAT = 5
+TEMPERAMENTS = [["Calmo"], ["Brincalhão", "Sociável"], ["Medroso"], ["Agitado", "Protetor"]]
+
+
+def populate(session) -> None:
+    rng = random.Random(16)
+    now = datetime(2024, 1, 1)
+
+    session.execute(insert(AnimalModel), [
+        dict(
+            species=rng.choice(["CAT", "DOG"]), breed="Vira-lata", name=f"Animal {i}",
+            gender=rng.choice(["MALE", "FEMALE"]), age_months=rng.randint(1, 150),
+            size=rng.choice(["SMALL", "MEDIUM", "LARGE"]),
+            temperament=json.dumps(rng.choice(TEMPERAMENTS)),
+            status="AVAILABLE", timestamp=now, extra_data={"needs_walk": True}
+        )
+        for i in range(N_ROWS)
+    ])
+    session.execute(insert(AdopterModel), [
+        dict(
+            name=f"Adotante {i}", age=rng.randint(18, 80), housing_type="HOUSE",
+            usable_area=80.0, has_pet_experience=True, has_children_at_home=False,
+            has_other_animals=False, timestamp=now
+        )
+        for i in range(N_ROWS)
+    ])
+    session.execute(insert(ReservationQueueModel), [
+        dict(
+            animal_id=i + 1, adopter_id=i + 1, compatibility_rate=rng.uniform(0, 100),
+            is_canceled=False, timestamp=now
+        )
+        for i in range(N_ROWS)
+    ])
+    session.commit()
+
+# ---- Conversões com validação (comportamento anterior) ----
+
+def validated_animal(model: AnimalModel) -> Cat | Dog:
+    species = Species[model.species]
+    extra_data = model.extra_data or {}
+    args = dict(
+        id=model.id, species=species, breed=model.breed, name=model.name,
+        gender=Gender[model.gender], age_months=model.age_months, size=Size[model.size],
+        temperament=json.loads(model.temperament), status=AnimalStatus[model.status],
+        timestamp=model.timestamp
+    )
+    if species == Species.CAT:
+        return Cat(**args, is_hypoallergenic=extra_data.get("is_hypoallergenic", False))
+    return Dog(**args, needs_walk=extra_data.get("needs_walk", False))
+
+
+def validated_adopter(model: AdopterModel) -> Adopter:
+    return Adopter(
+        id=model.id, name=model.name, age=model.age,
+        housing_type=HousingType[model.housing_type], usable_area=model.usable_area,
+        has_pet_experience=model.has_pet_experience,
+        has_children_at_home=model.has_children_at_home,
+        has_other_animals=model.has_other_animals, timestamp=model.timestamp
+    )
+
+
+def validated_reservation(model: ReservationQueueModel) -> ReservationQueue:
+    return ReservationQueue(**{c.name: getattr(model, c.name) for c in model.__table__.columns})
+
+
+def per_row_us(convert, models) -> float:
+    seconds = min(timeit.repeat(lambda: [convert(m) for m in models], number=1, repeat=REPEAT))
+    return seconds / len(models) * 1e6
+
+
+def main() -> None:
+    with temp_database() as (_, Session):
+        session = Session()
+        populate(session)
+
+        cases = [
+            ("Animal", AnimalModel, validated_animal, AnimalRepository(session)),
+            ("Adopter", AdopterModel, validated_adopter, AdopterRepository(session)),
+            ("ReservationQueue", ReservationQueueModel, validated_reservation,
+             ReservationQueueRepository(session)),
+        ]
+
+        rows = []
+        for name, model_class, validated, repo in cases:
+            models = session.query(model_class).all()
+            before = per_row_us(validated, models)
+            after = per_row_us(repo._to_domain, models)
+            rows.append([name, f"{before:.2f} µs", f"{after:.2f} µs", f"{before / after:.1f}x"])
+
+        session.close()
+
+    print(f"{N_ROWS} linhas por entidade (melhor de {REPEAT} execuções)")
+    print_table(["entidade", "construtor", "from_row", "ganho"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Compara o pico de memória de list_all e iter_all ao percorrer a tabela de eventos.
+
+O pico é medido com tracemalloc (bytes alocados pelo Python), em um
+processo separado para cada cenário, junto com o pico de RSS do processo.
+
+Uso:
+    python -m benchmarks.bench_iter_all
+"""
+import resource
+import subprocess
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+
+from benchmarks.utils import temp_database, print_table
+from infrastructure.db_models.animal_model import AnimalModel
+from infrastructure.db_models.event_model import EventModel
+from infrastructure.repositories import EventRepository
+
+ROW_COUNTS = [10_000, 40_000, 160_000]
+CHUNK_SIZE = 1000
+
+
+def populate(session, n_events: int) -> None:
+    now = datetime(2024, 1, 1)
+    session.execute(insert(AnimalModel), [dict(
+        species="DOG", breed="Vira-lata", name="Rex", gender="MALE", age_months=12,
+        size="MEDIUM", temperament="[]", status="AVAILABLE", timestamp=now, extra_data={}
+    )])
+
+    batch = 20_000
+    for start in range(0, n_events, batch):
+        session.execute(insert(EventModel), [
+            dict(
+                animal_id=1,
+                event_type="VACCINE",
+                timestamp=now + timedelta(seconds=i),
+                extra_data={"vaccine_name": f"Vacina {i}", "veterinarian": "Dra. Ana"}
+            )
+            for i in range(start, min(start + batch, n_events))
+        ])
+    session.commit()
+
+
+def run_scenario(mode: str, n_events: int) -> None:
+    with temp_database() as (_, Session):
+        session = Session()
+        populate(session, n_events)
+        session.close()
+
+        session = Session()
+        repo = EventRepository(session)
+
+        tracemalloc.start()
+        if mode == "list_all":
+            count = len(repo.list_all())
+        else:
+            count = sum(1 for _ in repo.iter_all(chunk_size=CHUNK_SIZE))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(count, peak, rss)
+
+
+def main() -> None:
+    rows = []
+    for n_events in ROW_COUNTS:
+        row = [n_events]
+        for mode in ("list_all", "iter_all"):
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_iter_all", mode, str(n_events)],
+                capture_output=True, text=True, check=True
+            ).stdout.split()
+            _, peak, rss = map(int, out)
+            row += [f"{peak / 2**20:.1f} MiB", f"{rss / 1024:.1f} MiB"]
+        rows.append(row)
+
+    print_table(
+        ["eventos", "list_all pico", "list_all RSS", "iter_all pico", "iter_all RSS"],
+        rows
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        run_scenario(sys.argv[1], int(sys.argv[2]))
+    else:
+        main()
@@ -0,0 +1,97 @@
+"""
+Mede a busca de animais (AnimalRepository.search e facet_counts) em um
+catálogo de 500 mil animais: primeira página de resultados e contagens de
+facetas, para buscas só por facetas e por textos de diferentes
+seletividades.
+
+A carga é feita com os triggers de busca ativos (índice FTS5 e
+animal_facet_counts mantidos a cada inserção); o tempo da carga também é
+exibido.
+
+Uso:
+    python -m benchmarks.bench_search
+"""
+import json
+import random
+import time
+from datetime import datetime
+from sqlalchemy import insert
+
+from benchmarks.utils import temp_database, print_table
+from config import settings
+from infrastructure.db_models.animal_model import AnimalModel
+from infrastructure.repositories import AnimalRepository
+
+N_ROWS = 500_000
+BATCH_SIZE = 50_000
+REPEAT = 20
+
+NAMES = ["Rex", "Thor", "Luna", "Mel", "Bob", "Nina", "Toby", "Max", "Bela", "Fred"]
+BREEDS = ["Vira-lata", "Poodle", "Siamês", "Persa", "Labrador", "Beagle", "Pug", "Maine Coon"]
+TEMPERAMENTS = ["Calmo", "Brincalhão", "Sociável", "Medroso", "Agitado", "Protetor", "Arisco", "Dócil"]
+STATUSES = ["AVAILABLE", "RESERVED", "ADOPTED", "QUARANTINE", "UNADOPTABLE"]
+
+CASES = [
+    ("sem filtros", None, {}),
+    ("facetas", None, {"species": ["CAT"], "status": ["AVAILABLE"], "age_group": ["young_pet"]}),
+    ("nome (raro)", "rex 4242", {}),
+    ("nome + facetas", "luna", {"species": ["DOG"], "size": ["SMALL"]}),
+    ("raça (~3%)", "poodle calmo", {"status": ["AVAILABLE"]}),
+    ("raça (~12%)", "poodle", {}),
+]
+
+
+def populate(session) -> None:
+    rng = random.Random(24)
+    now = datetime(2024, 1, 1)
+
+    for start in range(0, N_ROWS, BATCH_SIZE):
+        session.execute(insert(AnimalModel), [
+            dict(
+                species=rng.choice(["CAT", "DOG"]), breed=rng.choice(BREEDS),
+                name=f"{rng.choice(NAMES)} {i}", gender=rng.choice(["MALE", "FEMALE"]),
+                age_months=rng.randint(1, 150), size=rng.choice(["SMALL", "MEDIUM", "LARGE"]),
+                temperament=json.dumps(rng.sample(TEMPERAMENTS, 2)),
+                status=rng.choice(STATUSES), timestamp=now, extra_data={}
+            )
+            for i in range(start, min(start + BATCH_SIZE, N_ROWS))
+        ])
+    session.commit()
+
+
+def milliseconds(function) -> float:
+    function()  # aquece o cache de páginas do SQLite
+
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        function()
+
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+def main() -> None:
+    with temp_database(dict(settings.storage_profile)) as (_, session_factory):
+        session = session_factory()
+
+        start = time.perf_counter()
+        populate(session)
+        load_time = time.perf_counter() - start
+
+        repo = AnimalRepository(session)
+        rows = []
+
+        for label, text, filters in CASES:
+            total, _, approximate = repo.facet_counts(text, filters)
+            page = milliseconds(lambda: repo.search(text, filters))
+            facets = milliseconds(lambda: repo.facet_counts(text, filters))
+
+            rows.append([label, f"{total:,}{'+' if approximate else ''}", f"{page:.2f}", f"{facets:.2f}", f"{page + facets:.2f}"])
+
+        session.close()
+
+    print(f"{N_ROWS:,} animais carregados em {load_time:.1f} s (triggers de busca ativos)")
+    print_table(["busca", "encontrados", "página (ms)", "facetas (ms)", "total (ms)"], rows)
+
+
+if __name__ == "__main__":
+    main()
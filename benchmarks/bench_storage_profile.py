@@ -0,0 +1,89 @@
+"""
+Compara a vazão de criação de reservas com e sem o perfil de armazenamento
+do SQLite (database.storage_profile do settings.json).
+
+Cada reserva passa por ReservationService.create_reservation, que realiza
+um commit por reserva, de modo que o custo de fsync por transação domina.
+
+Uso:
+    python -m benchmarks.bench_storage_profile
+"""
+import time
+from datetime import datetime
+
+from benchmarks.utils import temp_database, print_table
+from infrastructure.database.db_connection import storage_profile
+from infrastructure.repositories import (
+    AnimalRepository, AdopterRepository, ReservationQueueRepository, AdoptionRepository
+)
+from services.reservation_service import ReservationService
+from domain.animals.dog import Dog
+from domain.people.adopter import Adopter
+from domain.enums.animal_enums import Species, Gender, Size
+from domain.enums.animal_status import AnimalStatus
+from domain.enums.adopter_enums import HousingType
+
+N_ANIMALS = 50
+N_ADOPTERS = 40
+
+
+def populate(session) -> None:
+    now = datetime.now()
+
+    AnimalRepository(session).save_many(
+        Dog(
+            species=Species.DOG, breed="Vira-lata", name=f"Rex {i}", gender=Gender.MALE,
+            age_months=12 + i, size=Size.MEDIUM, temperament=["Calmo"],
+            status=AnimalStatus.AVAILABLE, needs_walk=True, timestamp=now
+        )
+        for i in range(N_ANIMALS)
+    )
+    AdopterRepository(session).save_many(
+        Adopter(
+            name=f"Adotante {i}", age=20 + i, housing_type=HousingType.HOUSE,
+            usable_area=60, has_pet_experience=True, has_children_at_home=False,
+            has_other_animals=False, timestamp=now
+        )
+        for i in range(N_ADOPTERS)
+    )
+
+
+def run(profile: dict | None) -> float:
+    """Retorna a vazão (reservas por segundo) com o perfil informado."""
+    with temp_database(storage_profile=profile) as (_, Session):
+        session = Session()
+        populate(session)
+
+        service = ReservationService(
+            reservation_repo=ReservationQueueRepository(session),
+            animal_repo=AnimalRepository(session),
+            adopter_repo=AdopterRepository(session),
+            adoption_repo=AdoptionRepository(session)
+        )
+
+        start = time.perf_counter()
+        for animal_id in range(1, N_ANIMALS + 1):
+            for adopter_id in range(1, N_ADOPTERS + 1):
+                service.create_reservation(animal_id, adopter_id)
+        elapsed = time.perf_counter() - start
+
+        session.close()
+        return N_ANIMALS * N_ADOPTERS / elapsed
+
+
+def main() -> None:
+    default = run(None)
+    tuned = run({**storage_profile, "enabled": True})
+
+    print_table(
+        ["perfil", "reservas/s"],
+        [
+            ["padrão (rollback journal)", f"{default:.0f}"],
+            ["storage_profile (WAL)", f"{tuned:.0f}"],
+            ["ganho", f"{tuned / default:.2f}x"],
+        ]
+    )
+
+
+if __name__ == "__main__":
+    main()
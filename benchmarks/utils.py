@@ -0,0 +1,51 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure.database.db_connection import Base, apply_storage_profile
+from infrastructure.db_models import (
+    adopter_model,
+    animal_model,
+    adoption_model,
+    reservation_queue_model,
+    adoption_return_model,
+    event_model,
+    table_version_model,
+    animal_search_model,
+    reservation_queue_stats_model
+)
+
+@contextmanager
+def temp_database(storage_profile: dict | None = None):
+    """
+    Cria um banco SQLite temporário em disco com todas as tabelas do sistema.
+
+    Args:
+        storage_profile (dict | None): Perfil de PRAGMAs aplicado às conexões
+            (mesmo formato de ``database.storage_profile`` do settings.json).
+
+    Yields:
+        tuple[Engine, sessionmaker]: Engine e fábrica de sessões do banco temporário.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        if storage_profile:
+            apply_storage_profile(engine, storage_profile)
+        Base.metadata.create_all(bind=engine)
+        try:
+            yield engine, sessionmaker(bind=engine)
+        finally:
+            engine.dispose()
+
+
+def print_table(headers: list[str], rows: list[list]) -> None:
+    """Imprime uma tabela simples alinhada à direita."""
+    widths = [
+        max(len(str(h)), *(len(str(r[i])) for r in rows))
+        for i, h in enumerate(headers)
+    ]
+    print("  ".join(str(h).rjust(w) for h, w in zip(headers, widths)))
+    for row in rows:
+        print("  ".join(str(v).rjust(w) for v, w in zip(row, widths)))
@@ -0,0 +1,16 @@
+"""
+Configuração do sistema (settings.json).
+
+O arquivo é lido uma única vez, na importação, a partir do diretório de
+execução (raiz do projeto). Use ``settings`` para ler a configuração vigente
+e ``settings.on_change`` para reagir às recargas.
+"""
+from .settings import Settings, SettingsSnapshot
+
+settings = Settings()
+
+__all__ = [
+    "Settings",
+    "SettingsSnapshot",
+    "settings",
+]
@@ -0,0 +1,269 @@
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from datetime import timedelta
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+
+logger = logging.getLogger(__name__)
+
+def _freeze(value: Any) -> Any:
+    """Converte dicionários e listas do JSON em estruturas somente leitura."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class SettingsSnapshot:
+    """
+    Configuração vigente, já validada e pré-processada a partir do settings.json.
+
+    Instâncias são imutáveis: uma recarga produz um novo snapshot, que substitui
+    o anterior de uma só vez. Quem precisar de vários valores coerentes entre si
+    deve ler o snapshot uma única vez (``snapshot = settings.current``).
+
+    Attributes:
+        data (Mapping): Conteúdo completo do arquivo, somente leitura.
+        minimum_adopter_age (int): Idade mínima para adotantes.
+        reservation_duration_hours (float): Duração das filas de reserva, em horas.
+        reservation_duration (timedelta): Duração das filas de reserva.
+        max_animals_per_adopter (int | None): Limite de animais por adotante na
+            atribuição em lote; None remove o limite.
+        minimum_area (Mapping[str, float]): Área mínima por porte (nome do enum Size).
+        area_thresholds (tuple[float, ...]): Áreas mínimas distintas, em ordem crescente.
+        wary_temperaments (frozenset[str]): Temperamentos ariscos, normalizados
+            como em Animal.temperament.
+        adoption_fee (Mapping): Política de taxa de adoção.
+        compatibility_weights (Mapping[str, float]): Pesos dos critérios de compatibilidade.
+        compatibility_scores (Mapping): Pontuações base dos critérios de compatibilidade.
+        database_pool (Mapping): Configuração do pool de conexões.
+        storage_profile (Mapping): PRAGMAs de desempenho do SQLite.
+        entity_cache (Mapping): Cache de entidades dos repositórios (tamanho e TTL).
+        http_cache (Mapping): Cache HTTP das páginas (validadores e cache de páginas).
+    """
+    data: Mapping
+    minimum_adopter_age: int
+    reservation_duration_hours: float
+    reservation_duration: timedelta
+    max_animals_per_adopter: int | None
+    minimum_area: Mapping[str, float]
+    area_thresholds: tuple[float, ...]
+    wary_temperaments: frozenset[str]
+    adoption_fee: Mapping
+    compatibility_weights: Mapping[str, float]
+    compatibility_scores: Mapping
+    database_pool: Mapping
+    storage_profile: Mapping
+    entity_cache: Mapping
+    http_cache: Mapping
+
+    @classmethod
+    def compile(cls, data: dict) -> "SettingsSnapshot":
+        """
+        Valida o conteúdo do settings.json e pré-calcula as estruturas derivadas.
+
+        Args:
+            data (dict): Conteúdo do arquivo já decodificado.
+
+        Returns:
+            SettingsSnapshot: Configuração pronta para uso.
+
+        Raises:
+            KeyError: Caso alguma seção obrigatória esteja ausente.
+            ValueError: Caso algum valor seja inválido.
+        """
+        policies = data["policies"]
+        compatibility = data["compatibility"]
+        database = data["database"]
+        http_cache = data["http_cache"]
+
+        if int(http_cache["page_cache_size"]) < 0:
+            raise ValueError("page_cache_size não pode ser negativo.")
+
+        duration_hours = float(policies["reservation_duration_hours"])
+        if duration_hours <= 0:
+            raise ValueError("reservation_duration_hours deve ser maior que zero.")
+
+        minimum_area = {size: float(area) for size, area in policies["minimum_area"].items()}
+
+        return cls(
+            data=_freeze(data),
+            minimum_adopter_age=int(policies["minimum_adopter_age"]),
+            reservation_duration_hours=duration_hours,
+            reservation_duration=timedelta(hours=duration_hours),
+            max_animals_per_adopter=policies.get("max_animals_per_adopter"),
+            minimum_area=MappingProxyType(minimum_area),
+            area_thresholds=tuple(sorted(set(minimum_area.values()))),
+            wary_temperaments=frozenset(
+                item.strip().capitalize()
+                for item in policies["wary_animal_temperaments"]
+                if item.strip()
+            ),
+            adoption_fee=_freeze(policies["adoption_fee"]),
+            compatibility_weights=_freeze(compatibility["weights"]),
+            compatibility_scores=_freeze(compatibility["scores"]),
+            database_pool=_freeze(database["pool"]),
+            storage_profile=_freeze(database["storage_profile"]),
+            entity_cache=_freeze(database["entity_cache"]),
+            http_cache=_freeze(http_cache)
+        )
+
+
+class Settings:
+    """
+    Ponto único de acesso ao settings.json.
+
+    O arquivo é lido e processado uma única vez (SettingsSnapshot) e os
+    atributos do snapshot vigente podem ser lidos diretamente
+    (ex.: ``settings.wary_temperaments``).
+
+    A recarga é feita por refresh, que compara a data de modificação (mtime)
+    do arquivo, no máximo uma vez a cada CHECK_INTERVAL segundos. Quando o
+    arquivo muda, o novo snapshot substitui o anterior e as funções
+    registradas com on_change são chamadas para reconstruir as estruturas
+    que dependem da configuração. Um arquivo inválido é ignorado (e
+    registrado em log), mantendo a configuração anterior.
+
+    Attributes:
+        path (str): Caminho do arquivo de configuração.
+        current (SettingsSnapshot): Configuração vigente.
+        CHECK_INTERVAL (float): Intervalo mínimo, em segundos, entre verificações
+            do mtime em refresh.
+    """
+
+    CHECK_INTERVAL = 1.0
+
+    def __init__(self, path: str = "settings.json"):
+        self.path = path
+        self.__lock = threading.Lock()
+        self.__callbacks = []
+        self.__mtime = None
+        self.__checked_at = time.monotonic()
+        self.current = self.__read()
+
+    def __getattr__(self, name: str) -> Any:
+        # Chamado apenas para atributos que não pertencem à instância
+        if name == "current":
+            raise AttributeError(name)
+        return getattr(self.current, name)
+
+    # -------------------------- RELOAD --------------------------
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Recarrega a configuração caso o arquivo tenha sido modificado.
+
+        Args:
+            force (bool): Verifica o arquivo mesmo que CHECK_INTERVAL ainda
+                não tenha passado desde a última verificação.
+
+        Returns:
+            bool: True se uma nova configuração foi aplicada; False caso contrário.
+        """
+        now = time.monotonic()
+
+        if not force and now - self.__checked_at < self.CHECK_INTERVAL:
+            return False
+
+        self.__checked_at = now
+
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            logger.exception("Não foi possível verificar %s", self.path)
+            return False
+
+        if mtime == self.__mtime:
+            return False
+
+        try:
+            self.reload()
+        except (OSError, KeyError, TypeError, ValueError):
+            # Não tenta novamente até o arquivo ser modificado outra vez
+            self.__mtime = mtime
+            logger.exception("%s inválido; a configuração anterior foi mantida", self.path)
+            return False
+
+        return True
+
+    def reload(self) -> SettingsSnapshot:
+        """
+        Lê novamente o arquivo, aplica a nova configuração e notifica as
+        funções registradas com on_change.
+
+        Returns:
+            SettingsSnapshot: A configuração aplicada.
+
+        Raises:
+            OSError: Caso o arquivo não possa ser lido.
+            ValueError: Caso o arquivo não seja um JSON válido ou contenha valores inválidos.
+            KeyError: Caso alguma seção obrigatória esteja ausente.
+        """
+        with self.__lock:
+            snapshot = self.__read()
+            self.current = snapshot
+            callbacks = list(self.__callbacks)
+
+        dead = []
+
+        for ref in callbacks:
+            callback = ref()
+
+            if callback is None:
+                dead.append(ref)
+                continue
+
+            try:
+                callback(snapshot)
+            except Exception:
+                logger.exception("Falha ao aplicar a nova configuração em %r", callback)
+
+        if dead:
+            with self.__lock:
+                self.__callbacks = [ref for ref in self.__callbacks if ref not in dead]
+
+        return snapshot
+
+    def on_change(self, callback: Callable[[SettingsSnapshot], None]) -> Callable[[SettingsSnapshot], None]:
+        """
+        Registra uma função chamada com o novo snapshot após cada recarga.
+
+        Métodos de instância são referenciados fracamente: o registro não
+        impede que o objeto seja coletado e é descartado junto com ele.
+
+        Args:
+            callback (Callable[[SettingsSnapshot], None]): Função a ser registrada.
+
+        Returns:
+            Callable[[SettingsSnapshot], None]: A própria função (uso como decorador).
+        """
+        if inspect.ismethod(callback):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback
+
+        with self.__lock:
+            self.__callbacks.append(ref)
+
+        return callback
+
+    # -------------------------- HELPERS --------------------------
+
+    def __read(self) -> SettingsSnapshot:
+        """Lê e processa o arquivo, registrando o mtime correspondente."""
+        mtime = os.stat(self.path).st_mtime_ns
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        snapshot = SettingsSnapshot.compile(data)
+        self.__mtime = mtime
+        return snapshot
@@ -13,6 +13,9 @@ class Adoption:
         fee (float): Taxa cobrada pela adoção.
         timestamp (datetime | str): Data e hora da adoção.
     """
+
+    __slots__ = ("__id", "__timestamp", "__animal_id", "__adopter_id", "__fee")
+
     def __init__(
         self,
         animal_id: int,
@@ -27,6 +30,30 @@ class Adoption:
         self.__id = id
         self.__timestamp = timestamp
 
+    @classmethod
+    def from_row(
+        cls,
+        animal_id: int,
+        adopter_id: int,
+        fee: float,
+        id: int,
+        timestamp: datetime
+    ) -> "Adoption":
+        """
+        Reconstrói uma adoção a partir de dados já persistidos, sem passar pelos
+        setters de validação. Deve ser usado apenas com dados confiáveis.
+
+        Returns:
+            Adoption: Adoção reconstruída.
+        """
+        adoption = cls.__new__(cls)
+        adoption.__animal_id = animal_id
+        adoption.__adopter_id = adopter_id
+        adoption.__fee = fee
+        adoption.__id = id
+        adoption.__timestamp = timestamp
+        return adoption
+
     # -------------------------- PROPERTIES --------------------------
 
     # ---- ID ----
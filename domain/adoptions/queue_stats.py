@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from datetime import datetime
+from config import settings
+
+@dataclass(frozen=True, slots=True)
+class QueueStats:
+    """
+    Resumo da fila de reservas de um animal.
+
+    Attributes:
+        animal_id (int): Identificador do animal.
+        active_count (int): Quantidade de reservas ativas (não canceladas).
+        best_compatibility_rate (float | None): Maior taxa de compatibilidade
+            entre as reservas ativas; None se todas foram canceladas.
+        first_timestamp (datetime): Início da fila, isto é, o timestamp da
+            primeira reserva (inclusive canceladas).
+    """
+    animal_id: int
+    active_count: int
+    best_compatibility_rate: float | None
+    first_timestamp: datetime
+
+    @property
+    def deadline(self) -> datetime:
+        """Prazo da fila, segundo a duração vigente no settings.json."""
+        return self.first_timestamp + settings.reservation_duration
+
+    def is_expired(self, now: datetime | None = None) -> bool:
+        return (now or datetime.now()) >= self.deadline
@@ -1,10 +1,5 @@
-from datetime import datetime, timezone, timedelta
-import json
-
-with open("settings.json", "r", encoding="utf-8") as f:
-    settings = json.load(f)
-
-duration_hours = settings["policies"]["reservation_duration_hours"]
+from datetime import datetime, timezone
+from config import settings
 
 class ReservationQueue:
     """
@@ -20,6 +15,11 @@ class ReservationQueue:
         timestamp (datetime | str): Data e hora em que a intenção de reserva foi registrada.
     """
 
+    __slots__ = (
+        "__id", "__timestamp", "__animal_id", "__adopter_id",
+        "__compatibility_rate", "__is_canceled", "has_ended"
+    )
+
     def __init__(
         self,
         animal_id: int,
@@ -36,6 +36,32 @@ class ReservationQueue:
         self.__id = id
         self.__timestamp = timestamp 
 
+    @classmethod
+    def from_row(
+        cls,
+        animal_id: int,
+        adopter_id: int,
+        compatibility_rate: float,
+        is_canceled: bool,
+        id: int,
+        timestamp: datetime
+    ) -> "ReservationQueue":
+        """
+        Reconstrói uma reserva a partir de dados já persistidos, sem passar pelos
+        setters de validação. Deve ser usado apenas com dados confiáveis.
+
+        Returns:
+            ReservationQueue: Reserva reconstruída.
+        """
+        reservation = cls.__new__(cls)
+        reservation.__animal_id = animal_id
+        reservation.__adopter_id = adopter_id
+        reservation.__compatibility_rate = compatibility_rate
+        reservation.__is_canceled = is_canceled
+        reservation.__id = id
+        reservation.__timestamp = timestamp
+        return reservation
+
     def __lt__(self, rq: "ReservationQueue") -> bool:
         if self.compatibility_rate != rq.compatibility_rate:
             return self.compatibility_rate > rq.compatibility_rate
@@ -52,7 +78,7 @@ class ReservationQueue:
         Returns:
             bool: True se a reserva expirou, False caso contrário.
         """
-        expiration_time = self.timestamp + timedelta(hours=duration_hours)
+        expiration_time = self.timestamp + settings.reservation_duration
 
         if datetime.now(timezone.utc) >= expiration_time:
             self.has_ended = True
@@ -3,10 +3,7 @@ from datetime import datetime
 from domain.enums.animal_status import AnimalStatus
 from domain.enums.animal_enums import *
 from domain.exceptions import InvalidStatusTransitionError
-import json
-
-with open("settings.json", "r", encoding="utf-8") as f:
-    settings = json.load(f)
+from config import settings
 
 class Animal(ABC):
     """
@@ -23,6 +20,12 @@ class Animal(ABC):
         temperament (list[str]): Lista de características temperamentais.
         status (AnimalStatus): Estado atual do animal no sistema.
     """
+
+    __slots__ = (
+        "_id", "_timestamp", "_species", "_breed", "_name", "_gender",
+        "_age_months", "_size", "_temperament", "_status"
+    )
+
     def __init__(
         self,
         species: Species,
@@ -47,6 +50,56 @@ class Animal(ABC):
         self._id = id
         self._timestamp = timestamp
 
+    @classmethod
+    def from_row(
+        cls,
+        species: Species,
+        breed: str,
+        name: str,
+        gender: Gender,
+        age_months: int,
+        size: Size,
+        temperament: list[str],
+        status: AnimalStatus,
+        id: int,
+        timestamp: datetime
+    ) -> "Animal":
+        """
+        Reconstrói um animal a partir de dados já persistidos, sem passar pelos
+        setters de validação (tipos, normalização de texto e transição de status).
+
+        Deve ser usado apenas com dados confiáveis, gravados pelo próprio sistema
+        a partir de entidades já validadas; as subclasses estendem este método
+        com os seus atributos específicos.
+
+        Args:
+            species (Species): Espécie do animal.
+            breed (str): Raça, já normalizada.
+            name (str): Nome, já normalizado.
+            gender (Gender): Gênero do animal.
+            age_months (int): Idade em meses.
+            size (Size): Porte do animal.
+            temperament (list[str]): Temperamentos, já normalizados.
+            status (AnimalStatus): Status atual do animal.
+            id (int): Identificador do animal.
+            timestamp (datetime): Data e hora do registro.
+
+        Returns:
+            Animal: Instância da subclasse em que o método foi chamado.
+        """
+        animal = cls.__new__(cls)
+        animal._species = species
+        animal._breed = breed
+        animal._name = name
+        animal._gender = gender
+        animal._age_months = age_months
+        animal._size = size
+        animal._temperament = temperament
+        animal._status = status
+        animal._id = id
+        animal._timestamp = timestamp
+        return animal
+
 
     def __str__(self):
         return f"{self.name}, {self.species_format()} {self.breed}"
@@ -61,13 +114,7 @@ class Animal(ABC):
         
 
     def has_wary_temperament(self) -> bool:
-        wary_list = settings["policies"]["wary_animal_temperaments"]
-
-        for t in self.temperament:
-            if t in wary_list:
-                return True
-            
-        return False
+        return not settings.wary_temperaments.isdisjoint(self.temperament)
     
     # -------------------------- PROPERTIES --------------------------
 
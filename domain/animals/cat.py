@@ -7,6 +7,8 @@ class Cat(VaccinableMixin, Animal):
     """Gato com características específicas."""
     html_icon = "fa-solid fa-cat"
 
+    __slots__ = ("__is_hypoallergenic", *VaccinableMixin.INSTANCE_SLOTS)
+
     def __init__(self,
         species: Species,
         breed: str,
@@ -26,6 +28,17 @@ class Cat(VaccinableMixin, Animal):
         )
 
         self.is_hypoallergenic = is_hypoallergenic
+
+    @classmethod
+    @override
+    def from_row(cls, is_hypoallergenic: bool, **common) -> "Cat":
+        """
+        Reconstrói um gato a partir de dados já persistidos, sem validação.
+        Ver Animal.from_row.
+        """
+        cat = super().from_row(**common)
+        cat.__is_hypoallergenic = is_hypoallergenic
+        return cat
     
     # -------------------------- PROPERTIES --------------------------
 
@@ -9,6 +9,8 @@ class Dog(VaccinableMixin, TrainableMixin, Animal):
     """Cachorro com características específicas."""
     html_icon = "fa-solid fa-dog"
 
+    __slots__ = ("__needs_walk", *VaccinableMixin.INSTANCE_SLOTS, *TrainableMixin.INSTANCE_SLOTS)
+
     def __init__(self,
         species: Species,
         breed: str,
@@ -28,6 +30,17 @@ class Dog(VaccinableMixin, TrainableMixin, Animal):
         )
         self.needs_walk = needs_walk
 
+    @classmethod
+    @override
+    def from_row(cls, needs_walk: bool, **common) -> "Dog":
+        """
+        Reconstrói um cachorro a partir de dados já persistidos, sem validação.
+        Ver Animal.from_row.
+        """
+        dog = super().from_row(**common)
+        dog.__needs_walk = needs_walk
+        return dog
+
     # -------------------------- PROPERTIES --------------------------
 
     # ---- needs_walk ----
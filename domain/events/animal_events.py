@@ -3,7 +3,7 @@ from datetime import datetime
 from domain.enums.event_type import EventType
 from domain.people.adopter import Adopter
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     id: int 
     animal_id: int
@@ -23,7 +23,7 @@ class Event:
 
 # ---- Eventos específicos ----
 
-@dataclass
+@dataclass(slots=True)
 class TrainingEvent(Event):
     duration_min: int
     training_type: str
@@ -33,7 +33,7 @@ class TrainingEvent(Event):
     event_type: EventType = field(init=False, default=EventType.TRAINING)
 
 
-@dataclass
+@dataclass(slots=True)
 class VaccineEvent(Event):
     vaccine_name: str
     veterinarian: str
@@ -41,7 +41,7 @@ class VaccineEvent(Event):
     event_type: EventType = field(init=False, default=EventType.VACCINE)
 
 
-@dataclass
+@dataclass(slots=True)
 class AdoptionEvent(Event):
     adopter: Adopter
     fee: float
@@ -49,14 +49,14 @@ class AdoptionEvent(Event):
     event_type: EventType = field(init=False, default=EventType.ADOPTION)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReturnEvent(Event):
     adoption_id: int
     reason: str
 
     event_type: EventType = field(init=False, default=EventType.RETURN)
 
-@dataclass
+@dataclass(slots=True)
 class QuarentineEvent(Event):
 
     event_type: EventType = field(init=False, default=EventType.QUARENTINE)
\ No newline at end of file
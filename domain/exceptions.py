@@ -5,4 +5,11 @@ class PolicyNotMetError(Exception):
 class InvalidStatusTransitionError(Exception):
     """
     "Raised when the animal status transition is invalid.
-    """
\ No newline at end of file
+    """
+
+
+class ConcurrentUpdateError(Exception):
+    """
+    Raised when a record keeps being modified concurrently and the
+    optimistic update could not be applied after all retries.
+    """
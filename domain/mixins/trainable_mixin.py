@@ -2,11 +2,17 @@ from domain.events.animal_events import TrainingEvent
 
 class TrainableMixin:
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._trainings: list[TrainingEvent] = []
-        self.is_trainable = True
+    # Ver VaccinableMixin
+    __slots__ = ()
+    INSTANCE_SLOTS = ("_trainings",)
+
+    is_trainable = True
 
     @property
     def trainings(self) -> list[TrainingEvent]:
-        return self._trainings
\ No newline at end of file
+        # A lista é criada apenas no primeiro acesso
+        try:
+            return self._trainings
+        except AttributeError:
+            self._trainings = []
+            return self._trainings
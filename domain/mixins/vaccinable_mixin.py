@@ -2,12 +2,19 @@ from domain.events.animal_events import VaccineEvent
 
 class VaccinableMixin:
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._vaccines: list[VaccineEvent] = []
-        self.is_vaccineable = True
+    # O mixin não declara armazenamento próprio (dois mixins com __slots__ não
+    # vazios não podem ser combinados); as classes concretas incluem
+    # INSTANCE_SLOTS nos seus __slots__.
+    __slots__ = ()
+    INSTANCE_SLOTS = ("_vaccines",)
+
+    is_vaccineable = True
 
     @property
     def vaccines(self) -> list[VaccineEvent]:
-        return self._vaccines
-    
\ No newline at end of file
+        # A lista é criada apenas no primeiro acesso
+        try:
+            return self._vaccines
+        except AttributeError:
+            self._vaccines = []
+            return self._vaccines
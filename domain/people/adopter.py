@@ -2,12 +2,7 @@ from datetime import datetime
 from domain.people.person import Person
 from domain.enums.adopter_enums import HousingType
 from domain.exceptions import PolicyNotMetError
-import json
-
-with open("settings.json", "r", encoding="utf-8") as f:
-    settings = json.load(f)
-
-minimum_age =  settings["policies"]["minimum_adopter_age"]
+from config import settings
 
 class Adopter(Person):
     """Representa um adotante de animais no sistema.
@@ -21,6 +16,11 @@ class Adopter(Person):
         has_children_at_home (bool): Indica se há crianças na residência.
         has_other_animals (bool): Indica se já existem outros animais na casa.
     """
+
+    __slots__ = (
+        "__age", "__housing_type", "__usable_area",
+        "__has_pet_experience", "__has_children_at_home", "__has_other_animals"
+    )
     
     def __init__(
         self,
@@ -44,6 +44,41 @@ class Adopter(Person):
         self.has_children_at_home = has_children_at_home
         self.has_other_animals = has_other_animals
 
+    @classmethod
+    def from_row(
+        cls,
+        name: str,
+        age: int,
+        housing_type: HousingType,
+        usable_area: float,
+        has_pet_experience: bool,
+        has_children_at_home: bool,
+        has_other_animals: bool,
+        id: int,
+        timestamp: datetime
+    ) -> "Adopter":
+        """
+        Reconstrói um adotante a partir de dados já persistidos, sem passar
+        pelos setters de validação (tipos, idade mínima e normalização do nome).
+
+        Deve ser usado apenas com dados confiáveis, gravados pelo próprio sistema
+        a partir de entidades já validadas.
+
+        Returns:
+            Adopter: Adotante reconstruído.
+        """
+        adopter = cls.__new__(cls)
+        adopter._id = id
+        adopter._name = name
+        adopter._timestamp = timestamp
+        adopter.__age = age
+        adopter.__housing_type = housing_type
+        adopter.__usable_area = usable_area
+        adopter.__has_pet_experience = has_pet_experience
+        adopter.__has_children_at_home = has_children_at_home
+        adopter.__has_other_animals = has_other_animals
+        return adopter
+
     def age_group(self) -> str:
         if self.age < 18:
             return "young"
@@ -65,6 +100,8 @@ class Adopter(Person):
         if not isinstance(v, int):
             raise TypeError("age deve ser do tipo int.")
         
+        minimum_age = settings.minimum_adopter_age
+
         if v < minimum_age:
             raise PolicyNotMetError(f"A idade mínima para adotantes é {minimum_age} anos.")
         
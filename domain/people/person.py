@@ -11,6 +11,8 @@ class Person(ABC):
         timestamp (datetime | str): Data e hora do registro da pessoa.
     """
 
+    __slots__ = ("_id", "_timestamp", "_name", "_age")
+
     def __init__(
         self,
         name: str,
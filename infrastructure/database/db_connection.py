@@ -1,22 +1,146 @@
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.schema import CreateColumn
+from sqlalchemy.orm import sessionmaker, scoped_session, declarative_base
+from config import settings
+
+# O engine é criado na inicialização: alterações destas seções no
+# settings.json só têm efeito após reiniciar a aplicação.
+pool_settings = settings.database_pool
+storage_profile = settings.storage_profile
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(BASE_DIR, "database.db")
 
-engine = create_engine(f"sqlite:///{DB_PATH}", echo=False)
-Session = sessionmaker(bind=engine)
+engine = create_engine(
+    f"sqlite:///{DB_PATH}",
+    echo=False,
+    pool_size=pool_settings["pool_size"],
+    max_overflow=pool_settings["max_overflow"],
+    pool_timeout=pool_settings["pool_timeout"],
+    pool_recycle=pool_settings["pool_recycle"]
+)
+
+def apply_storage_profile(engine, profile: dict) -> None:
+    """
+    Registra no engine um evento ``connect`` que aplica os PRAGMAs de
+    desempenho do SQLite a cada nova conexão do pool.
+
+    O perfil permite, por exemplo, usar o journal em modo WAL (leitores não
+    bloqueiam escritores) com ``synchronous=NORMAL`` (sem fsync a cada commit),
+    além de ajustar mmap, cache de páginas, armazenamento temporário e o tempo
+    de espera por locks.
+
+    Args:
+        engine (Engine): Engine SQLAlchemy de um banco SQLite.
+        profile (dict): Configurações do perfil (seção
+            ``database.storage_profile`` do settings.json).
+
+    Raises:
+        ValueError: Caso algum valor textual do perfil não seja suportado.
+    """
+    if not profile.get("enabled", False):
+        return
+
+    journal_mode = profile["journal_mode"].upper()
+    synchronous = profile["synchronous"].upper()
+    temp_store = profile["temp_store"].upper()
+
+    if journal_mode not in {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}:
+        raise ValueError(f"journal_mode inválido: {journal_mode}")
+    if synchronous not in {"OFF", "NORMAL", "FULL", "EXTRA"}:
+        raise ValueError(f"synchronous inválido: {synchronous}")
+    if temp_store not in {"DEFAULT", "FILE", "MEMORY"}:
+        raise ValueError(f"temp_store inválido: {temp_store}")
+
+    pragmas = [
+        f"PRAGMA journal_mode={journal_mode}",
+        f"PRAGMA synchronous={synchronous}",
+        f"PRAGMA mmap_size={int(profile['mmap_size'])}",
+        f"PRAGMA cache_size={int(profile['cache_size'])}",
+        f"PRAGMA temp_store={temp_store}",
+        f"PRAGMA busy_timeout={int(profile['busy_timeout'])}",
+    ]
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+apply_storage_profile(engine, storage_profile)
+
+# Registro de sessões por thread: cada requisição utiliza a própria sessão
+# (e a própria conexão do pool), que deve ser liberada com Session.remove()
+# ao final da requisição.
+Session = scoped_session(sessionmaker(bind=engine))
 Base = declarative_base()
 
-def init_db():
-    """Cria todas as tabelas definidas pelos modelos ORM."""
+def migrate_indexes(bind) -> None:
+    """
+    Cria, em bancos já existentes, os índices declarados nos modelos ORM
+    que ainda não existirem.
+
+    ``create_all`` só cria os índices junto com tabelas novas; esta etapa
+    complementa bancos criados por versões anteriores. A operação é
+    idempotente: índices já existentes são ignorados.
+
+    Args:
+        bind (Engine): Engine do banco a ser migrado.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+
+def migrate_columns(bind) -> None:
+    """
+    Adiciona, em bancos já existentes, as colunas declaradas nos modelos ORM
+    que ainda não existirem nas tabelas.
+
+    ``create_all`` não altera tabelas existentes; esta etapa complementa
+    bancos criados por versões anteriores. Colunas obrigatórias precisam
+    declarar um ``server_default`` para preencher as linhas existentes.
+
+    Args:
+        bind (Engine): Engine do banco a ser migrado.
+    """
+    inspector = inspect(bind)
+
+    with bind.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+
+            for column in table.columns:
+                if column.name not in existing:
+                    ddl = CreateColumn(column).compile(dialect=bind.dialect)
+                    conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {ddl}")
+
+def init_db(bind=None):
+    """
+    Cria todas as tabelas definidas pelos modelos ORM e aplica as colunas e
+    os índices pendentes em bancos já existentes.
+
+    Args:
+        bind (Engine | None): Engine do banco a ser inicializado. None
+            utiliza o banco da aplicação.
+    """
     from infrastructure.db_models import(
         adopter_model,
         animal_model,
         adoption_model,
         reservation_queue_model,
         adoption_return_model,
-        event_model
+        event_model,
+        table_version_model,
+        animal_search_model,
+        reservation_queue_stats_model
     )
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    bind = bind if bind is not None else engine
+
+    Base.metadata.create_all(bind=bind)
+    migrate_columns(bind)
+    migrate_indexes(bind)
\ No newline at end of file
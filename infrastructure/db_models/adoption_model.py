@@ -1,5 +1,5 @@
 from sqlalchemy import(
-    UniqueConstraint, Column, Integer, Float, ForeignKey, DateTime, func
+    UniqueConstraint, Index, Column, Integer, Float, ForeignKey, DateTime, func
 )
 from sqlalchemy.orm import relationship
 from infrastructure.database.db_connection import Base
@@ -10,7 +10,9 @@ class AdoptionModel(Base):
     __table_args__ = (
         UniqueConstraint(
             "animal_id", "adopter_id", "timestamp"
-        ),  # Single-element tuple required by SQLAlchemy
+        ),
+        Index("ix_adoptions_animal_id_timestamp", "animal_id", "timestamp"),
+        Index("ix_adoptions_adopter_id", "adopter_id"),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
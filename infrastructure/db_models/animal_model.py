@@ -1,5 +1,5 @@
 from sqlalchemy import(
-    UniqueConstraint, Column, String, Integer, DateTime, func, JSON
+    UniqueConstraint, Index, Column, String, Integer, DateTime, func, JSON
 )
 from sqlalchemy.orm import relationship
 from infrastructure.database.db_connection import Base
@@ -12,7 +12,8 @@ class AnimalModel(Base):
             "species", "breed",
             "name", "gender",
             "age_months", "size"
-        ),  # Single-element tuple required by SQLAlchemy
+        ),
+        Index("ix_animals_status", "status"),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -25,6 +26,9 @@ class AnimalModel(Base):
     temperament = Column(String, nullable=False)
     status = Column(String, nullable=False)
     timestamp = Column(DateTime, nullable=False)
+
+    # Incrementada a cada mudança de status (compare-and-swap em AnimalRepository)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
     
     extra_data = Column(JSON, nullable=True, default={})
 
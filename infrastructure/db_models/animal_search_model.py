@@ -0,0 +1,140 @@
+from sqlalchemy import Column, String, Integer, event
+from infrastructure.database.db_connection import Base
+
+# Faixas etárias dos animais (mesmos limites de Animal.age_group): nome e
+# idade, em meses, a partir da qual a faixa seguinte começa (None = sem limite)
+AGE_GROUPS = (
+    ("young_pet", 12),
+    ("adult_pet", 80),
+    ("senior_pet", None),
+)
+
+def age_group_sql(column: str) -> str:
+    """Expressão SQL que calcula a faixa etária a partir da idade em meses."""
+    cases = " ".join(
+        f"WHEN {column} < {upper} THEN '{name}'" for name, upper in AGE_GROUPS if upper is not None
+    )
+    return f"CASE {cases} ELSE '{AGE_GROUPS[-1][0]}' END"
+
+class AnimalFacetCountModel(Base):
+    """
+    Quantidade de animais por combinação de espécie, porte, sexo, status e
+    faixa etária (no máximo algumas centenas de linhas).
+
+    Mantida por triggers na tabela animals, na mesma transação de cada
+    escrita, permite calcular as contagens de facetas da busca sem percorrer
+    todo o catálogo.
+    """
+    __tablename__ = "animal_facet_counts"
+
+    species = Column(String, primary_key=True)
+    size = Column(String, primary_key=True)
+    gender = Column(String, primary_key=True)
+    status = Column(String, primary_key=True)
+    age_group = Column(String, primary_key=True)
+    total = Column(Integer, nullable=False, default=0)
+
+# -------------------------- FULL-TEXT INDEX --------------------------
+
+# Índice FTS5 de conteúdo externo: armazena apenas os termos de name, breed
+# e temperament, sem duplicar os valores da tabela animals.
+# remove_diacritics permite buscar "brincalhao" por "Brincalhão"; os índices
+# de prefixo aceleram buscas por termos incompletos ("lab" -> "Labrador").
+FTS_TABLE = "animals_fts"
+FTS_PREFIXES = (2, 3)
+
+# Vocabulário do índice (fts5vocab), usado para expandir prefixos mais longos
+# que os de FTS_PREFIXES nos termos que de fato ocorrem (ver AnimalRepository)
+FTS_TERMS_TABLE = "animals_fts_terms"
+
+def _temperament_sql(column: str) -> str:
+    """
+    Termos indexados de temperament: a coluna guarda uma lista JSON com os
+    caracteres não ASCII escapados ("Brincalh\\u00e3o"), decodificada aqui.
+    Por isso o índice é sempre escrito explicitamente, e não pelo comando
+    'rebuild' do FTS5, que leria a coluna sem decodificá-la.
+    """
+    return f"(SELECT group_concat(value, ' ') FROM json_each({column}))"
+
+def _facet_upsert(row: str, delta: int) -> str:
+    return (
+        "INSERT INTO animal_facet_counts (species, size, gender, status, age_group, total) "
+        f"VALUES ({row}.species, {row}.size, {row}.gender, {row}.status, "
+        f"{age_group_sql(f'{row}.age_months')}, {delta}) "
+        "ON CONFLICT (species, size, gender, status, age_group) "
+        f"DO UPDATE SET total = total + ({delta});"
+    )
+
+def _fts_insert(row: str) -> str:
+    return (
+        f"INSERT INTO {FTS_TABLE} (rowid, name, breed, temperament) "
+        f"VALUES ({row}.id, {row}.name, {row}.breed, {_temperament_sql(f'{row}.temperament')});"
+    )
+
+def _fts_delete(row: str) -> str:
+    return (
+        f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}, rowid, name, breed, temperament) "
+        f"VALUES ('delete', {row}.id, {row}.name, {row}.breed, {_temperament_sql(f'{row}.temperament')});"
+    )
+
+SEARCH_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "name, breed, temperament, content='animals', content_rowid='id', "
+    f"tokenize='unicode61 remove_diacritics 2', prefix='{' '.join(map(str, FTS_PREFIXES))}')",
+
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TERMS_TABLE} USING fts5vocab({FTS_TABLE}, instance)",
+
+    "CREATE TRIGGER IF NOT EXISTS animals_search_insert AFTER INSERT ON animals BEGIN "
+    f"{_fts_insert('new')} {_facet_upsert('new', 1)} END",
+
+    "CREATE TRIGGER IF NOT EXISTS animals_search_delete AFTER DELETE ON animals BEGIN "
+    f"{_fts_delete('old')} {_facet_upsert('old', -1)} END",
+
+    # Mudanças de status (as escritas mais frequentes) não alteram o índice de texto
+    "CREATE TRIGGER IF NOT EXISTS animals_search_update_text "
+    "AFTER UPDATE OF name, breed, temperament ON animals BEGIN "
+    f"{_fts_delete('old')} {_fts_insert('new')} END",
+
+    "CREATE TRIGGER IF NOT EXISTS animals_search_update_facets "
+    "AFTER UPDATE OF species, size, gender, status, age_months ON animals BEGIN "
+    f"{_facet_upsert('old', -1)} {_facet_upsert('new', 1)} END",
+)
+
+def rebuild_search_index(connection) -> None:
+    """
+    Reconstrói o índice de texto e as contagens de facetas a partir da
+    tabela animals (ex.: após cargas feitas com os triggers desativados).
+
+    Args:
+        connection (Connection): Conexão com uma transação aberta.
+    """
+    connection.exec_driver_sql(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('delete-all')")
+    connection.exec_driver_sql(
+        f"INSERT INTO {FTS_TABLE} (rowid, name, breed, temperament) "
+        f"SELECT id, name, breed, {_temperament_sql('temperament')} FROM animals"
+    )
+    connection.exec_driver_sql("DELETE FROM animal_facet_counts")
+    connection.exec_driver_sql(
+        "INSERT INTO animal_facet_counts (species, size, gender, status, age_group, total) "
+        f"SELECT species, size, gender, status, {age_group_sql('age_months')} AS age_group, COUNT(*) "
+        "FROM animals GROUP BY species, size, gender, status, age_group"
+    )
+
+@event.listens_for(Base.metadata, "after_create")
+def create_search_index(target, connection, **kw) -> None:
+    """
+    Cria o índice de busca e os triggers que o mantêm sincronizado.
+
+    Executado ao final de cada ``create_all`` (inclusive em bancos já
+    existentes, no init_db); quando o índice ainda não existe, ele é
+    populado com os animais já cadastrados.
+    """
+    exists = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (FTS_TABLE,)
+    ).first()
+
+    for ddl in SEARCH_DDL:
+        connection.exec_driver_sql(ddl)
+
+    if exists is None:
+        rebuild_search_index(connection)
@@ -1,5 +1,5 @@
 from sqlalchemy import(
-    UniqueConstraint, Column, Integer, String, ForeignKey, DateTime, JSON
+    UniqueConstraint, Index, Column, Integer, String, ForeignKey, DateTime, JSON
 )
 from sqlalchemy.orm import relationship
 from infrastructure.database.db_connection import Base
@@ -10,7 +10,9 @@ class EventModel(Base):
     __table_args__ = (
         UniqueConstraint(
             "animal_id", "event_type", "timestamp"
-        ),  # Single-element tuple required by SQLAlchemy
+        ),
+        Index("ix_events_animal_id_timestamp", "animal_id", "timestamp"),
+        Index("ix_events_event_type_timestamp", "event_type", "timestamp"),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -1,5 +1,5 @@
 from sqlalchemy import(
-    UniqueConstraint, Column, Integer, Float, ForeignKey, DateTime, Boolean, func
+    UniqueConstraint, Index, Column, Integer, Float, ForeignKey, DateTime, Boolean, func
 )
 from sqlalchemy.orm import relationship
 from infrastructure.database.db_connection import Base
@@ -10,7 +10,9 @@ class ReservationQueueModel(Base):
     __table_args__ = (
         UniqueConstraint(
             "animal_id", "adopter_id",
-        ),  # Single-element tuple required by SQLAlchemy
+        ),
+        Index("ix_reservation_queue_animal_active", "animal_id", "is_canceled", "timestamp"),
+        Index("ix_reservation_queue_adopter_id", "adopter_id"),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -0,0 +1,153 @@
+from sqlalchemy import Index, Column, Integer, Float, ForeignKey, DateTime, event
+from infrastructure.database.db_connection import Base
+
+class ReservationQueueStatsModel(Base):
+    """
+    Estatísticas desnormalizadas da fila de reservas de cada animal: uma
+    linha por fila existente (animal com ao menos uma reserva, inclusive
+    canceladas).
+
+    Mantida por triggers na tabela reservation_queue, na mesma transação de
+    cada escrita, permite obter o tamanho, a maior compatibilidade e o
+    início de uma fila (e listar as filas expiradas) sem agregar as reservas.
+    O prazo da fila não é armazenado: depende da duração configurada no
+    settings.json, que pode mudar a qualquer momento (ver QueueStats.deadline).
+    """
+    __tablename__ = "reservation_queue_stats"
+
+    __table_args__ = (
+        Index("ix_reservation_queue_stats_first_timestamp", "first_timestamp"),
+    )
+
+    animal_id = Column(Integer, ForeignKey("animals.id", ondelete="CASCADE"), primary_key=True)
+    active_count = Column(Integer, nullable=False)
+    best_compatibility_rate = Column(Float, nullable=True)
+    first_timestamp = Column(DateTime, nullable=False)
+
+# -------------------------- TRIGGERS --------------------------
+
+# Agregação das reservas de uma fila. min(timestamp) compara os textos
+# gravados pelo SQLAlchemy ("AAAA-MM-DD HH:MM:SS.ffffff"), cuja ordem
+# alfabética é a ordem cronológica.
+_AGGREGATE = (
+    "SELECT animal_id, SUM(NOT is_canceled), "
+    "MAX(CASE WHEN NOT is_canceled THEN compatibility_rate END), MIN(timestamp) "
+    "FROM reservation_queue"
+)
+
+def _refresh(animal_id: str) -> str:
+    """
+    Recalcula a linha de uma fila a partir das suas reservas (a linha é
+    removida quando a fila deixa de ter reservas). O recálculo percorre
+    apenas as reservas do animal, pelo índice ix_reservation_queue_animal_active.
+    """
+    return (
+        f"DELETE FROM reservation_queue_stats WHERE animal_id = {animal_id}; "
+        "INSERT INTO reservation_queue_stats "
+        "(animal_id, active_count, best_compatibility_rate, first_timestamp) "
+        f"{_AGGREGATE} WHERE animal_id = {animal_id} GROUP BY animal_id;"
+    )
+
+def _increment(row: str) -> str:
+    """
+    Soma uma nova reserva à linha da sua fila, sem percorrer as demais. Em
+    SQLite, max() com vários argumentos retorna NULL se algum deles for NULL.
+    """
+    return (
+        "INSERT INTO reservation_queue_stats "
+        "(animal_id, active_count, best_compatibility_rate, first_timestamp) "
+        f"VALUES ({row}.animal_id, NOT {row}.is_canceled, "
+        f"CASE WHEN NOT {row}.is_canceled THEN {row}.compatibility_rate END, {row}.timestamp) "
+        "ON CONFLICT (animal_id) DO UPDATE SET "
+        "active_count = active_count + excluded.active_count, "
+        "best_compatibility_rate = coalesce("
+        "max(best_compatibility_rate, excluded.best_compatibility_rate), "
+        "best_compatibility_rate, excluded.best_compatibility_rate), "
+        "first_timestamp = min(first_timestamp, excluded.first_timestamp);"
+    )
+
+def _rescore(old: str, new: str) -> str:
+    """
+    Atualiza a maior compatibilidade de uma fila após a mudança da taxa de
+    uma reserva ativa: uma taxa maior que a atual é gravada diretamente, e a
+    fila só é percorrida quando a taxa que era a maior diminui.
+    """
+    return (
+        "UPDATE reservation_queue_stats "
+        f"SET best_compatibility_rate = {new}.compatibility_rate "
+        f"WHERE animal_id = {new}.animal_id AND best_compatibility_rate < {new}.compatibility_rate; "
+        "UPDATE reservation_queue_stats SET best_compatibility_rate = ("
+        "SELECT MAX(compatibility_rate) FROM reservation_queue "
+        f"WHERE animal_id = {new}.animal_id AND NOT is_canceled) "
+        f"WHERE animal_id = {new}.animal_id AND best_compatibility_rate = {old}.compatibility_rate "
+        f"AND {new}.compatibility_rate < {old}.compatibility_rate;"
+    )
+
+# Condição em que apenas a taxa de uma reserva ativa muda (ver _rescore)
+_RATE_ONLY = (
+    "old.animal_id = new.animal_id AND old.timestamp IS new.timestamp "
+    "AND old.is_canceled IS new.is_canceled"
+)
+
+QUEUE_STATS_DDL = (
+    "CREATE TRIGGER IF NOT EXISTS reservation_queue_stats_insert "
+    f"AFTER INSERT ON reservation_queue BEGIN {_increment('new')} END",
+
+    "CREATE TRIGGER IF NOT EXISTS reservation_queue_stats_delete "
+    f"AFTER DELETE ON reservation_queue BEGIN {_refresh('old.animal_id')} END",
+
+    # Recalcular as taxas (a escrita mais frequente, em lote) não percorre a
+    # fila na maioria das reservas; as demais mudanças refazem apenas a fila
+    # da própria reserva (a de origem só é refeita se a reserva mudar de animal)
+    "CREATE TRIGGER IF NOT EXISTS reservation_queue_stats_rate "
+    "AFTER UPDATE OF compatibility_rate ON reservation_queue "
+    f"WHEN {_RATE_ONLY} AND NOT new.is_canceled BEGIN {_rescore('old', 'new')} END",
+
+    "CREATE TRIGGER IF NOT EXISTS reservation_queue_stats_change "
+    "AFTER UPDATE OF animal_id, timestamp, is_canceled ON reservation_queue "
+    f"WHEN NOT ({_RATE_ONLY}) BEGIN {_refresh('new.animal_id')} END",
+
+    "CREATE TRIGGER IF NOT EXISTS reservation_queue_stats_move "
+    "AFTER UPDATE OF animal_id ON reservation_queue "
+    f"WHEN old.animal_id <> new.animal_id BEGIN {_refresh('old.animal_id')} END",
+)
+
+def queue_stats_from_scratch_sql() -> str:
+    """Consulta que recalcula as estatísticas de todas as filas a partir das reservas."""
+    return f"{_AGGREGATE} GROUP BY animal_id"
+
+def rebuild_queue_stats(connection) -> None:
+    """
+    Reconstrói a tabela reservation_queue_stats a partir das reservas
+    (ex.: após cargas feitas com os triggers desativados).
+
+    Args:
+        connection (Connection): Conexão com uma transação aberta.
+    """
+    connection.exec_driver_sql("DELETE FROM reservation_queue_stats")
+    connection.exec_driver_sql(
+        "INSERT INTO reservation_queue_stats "
+        "(animal_id, active_count, best_compatibility_rate, first_timestamp) "
+        f"{queue_stats_from_scratch_sql()}"
+    )
+
+@event.listens_for(Base.metadata, "after_create")
+def create_queue_stats_triggers(target, connection, **kw) -> None:
+    """
+    Cria os triggers que mantêm as estatísticas das filas.
+
+    Executado ao final de cada ``create_all`` (inclusive em bancos já
+    existentes, no init_db), depois que reservation_queue e
+    reservation_queue_stats existem; quando os triggers ainda não existem,
+    as estatísticas são calculadas para as reservas já cadastradas.
+    """
+    exists = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = ?",
+        ("reservation_queue_stats_insert",)
+    ).first()
+
+    for ddl in QUEUE_STATS_DDL:
+        connection.exec_driver_sql(ddl)
+
+    if exists is None:
+        rebuild_queue_stats(connection)
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from infrastructure.database.db_connection import Base
+
+class TableVersionModel(Base):
+    """
+    Contador de alterações de cada tabela, incrementado pelos repositórios
+    na mesma transação de cada escrita (BaseRepository._touch).
+
+    Permite que a camada web descubra, com uma única consulta, se os dados
+    exibidos por uma página mudaram (ETag / Last-Modified).
+    """
+    __tablename__ = "table_versions"
+
+    table_name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False)
@@ -4,6 +4,8 @@ from .adoption_repo import AdoptionRepository
 from .reservation_queue_repo import ReservationQueueRepository
 from .adoption_return_repo import AdoptionReturnRepository
 from .event_repo import EventRepository
+from .table_version_repo import TableVersionRepository
+from .entity_cache import EntityCache
 
 __all__ = [
     "AnimalRepository",
@@ -12,4 +14,6 @@ __all__ = [
     "ReservationQueueRepository",
     "AdoptionReturnRepository",
     "EventRepository",
+    "TableVersionRepository",
+    "EntityCache",
 ]
\ No newline at end of file
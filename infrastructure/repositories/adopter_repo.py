@@ -14,13 +14,16 @@ class AdopterRepository(BaseRepository):
         """
         Converte um objeto AdopterModel (SQLAlchemy) em uma entidade de domínio Adopter.
 
+        Os dados persistidos já foram validados na criação da entidade, por isso
+        a reconstrução utiliza from_row, que não repete a validação dos setters.
+
         Args:
             adopter_model (AdopterModel): Instância do modelo persistido no banco de dados.
 
         Returns:
             Adopter: Entidade de domínio correspondente.
         """
-        adopter = Adopter(
+        adopter = Adopter.from_row(
             id=adopter_model.id,
             name=adopter_model.name,
             age=adopter_model.age,
@@ -1,6 +1,18 @@
+from datetime import datetime
+from sqlalchemy.orm import joinedload
+
 from .base_repo import BaseRepository
+from .animal_repo import AnimalRepository
+from .adopter_repo import AdopterRepository
 from infrastructure.db_models.adoption_model import AdoptionModel
+from infrastructure.db_models.adoption_return_model import AdoptionReturnModel
+from infrastructure.db_models.animal_model import AnimalModel
+from infrastructure.db_models.adopter_model import AdopterModel
 from domain.adoptions.adoption import Adoption
+from domain.adoptions.adoption_return import AdoptionReturn
+from domain.animals.cat import Cat
+from domain.animals.dog import Dog
+from domain.people.adopter import Adopter
 
 class AdoptionRepository(BaseRepository):
 
@@ -8,6 +20,8 @@ class AdoptionRepository(BaseRepository):
     
     def __init__(self, session):
         super().__init__(session, model_class=AdoptionModel)
+        self.animal_mapper = AnimalRepository(session)
+        self.adopter_mapper = AdopterRepository(session)
 
     def get_latest_by_animal(self, animal_id: int) -> Adoption | None:
         """
@@ -34,6 +48,9 @@ class AdoptionRepository(BaseRepository):
         """
         Retorna todas as adoções (AdoptionModel) associadas a um animal específico.
 
+        O adotante e a devolução de cada adoção são carregados na mesma consulta
+        (eager loading), através dos relacionamentos ``adopter`` e ``adoption_return``.
+
         Args:
             animal_id (int): Identificador do animal cujas adoções
                 devem ser listadas.
@@ -44,7 +61,94 @@ class AdoptionRepository(BaseRepository):
         """
         return (
             self.session.query(AdoptionModel)
+            .options(
+                joinedload(AdoptionModel.adopter),
+                joinedload(AdoptionModel.adoption_return)
+            )
             .filter_by(animal_id=animal_id)
-            .order_by(AdoptionModel.timestamp)
+            .order_by(AdoptionModel.timestamp, AdoptionModel.id)
+            .all()
+        )
+
+    def list_history_by_animal(
+        self, animal_id: int
+    ) -> list[tuple[Adoption, Adopter, AdoptionReturn | None]]:
+        """
+        Retorna o histórico de adoções de um animal, com o adotante e a
+        devolução (quando houver) de cada adoção, em uma única consulta.
+
+        Args:
+            animal_id (int): Identificador do animal.
+
+        Returns:
+            list[tuple[Adoption, Adopter, AdoptionReturn | None]]: Lista de tuplas
+            (adoção, adotante, devolução) ordenada cronologicamente pela adoção.
+        """
+        adopters = {}
+        history = []
+
+        for model in self.list_by_animal(animal_id):
+            if model.adopter_id not in adopters:
+                adopters[model.adopter_id] = self.adopter_mapper._to_domain(model.adopter)
+
+            return_model = model.adoption_return
+            adoption_return = None
+
+            if return_model is not None:
+                adoption_return = AdoptionReturn(
+                    adoption_id=return_model.adoption_id,
+                    reason=return_model.reason,
+                    timestamp=return_model.timestamp
+                )
+
+            history.append((
+                self._to_domain(model),
+                adopters[model.adopter_id],
+                adoption_return
+            ))
+
+        return history
+
+    def list_with_parties(self) -> list[tuple[Adoption, Cat | Dog, Adopter, datetime | None]]:
+        """
+        Retorna todas as adoções juntamente com o animal, o adotante e a data
+        de devolução (quando houver), utilizando uma única consulta.
+
+        A tabela de devoluções é unida por LEFT OUTER JOIN, de modo que adoções
+        sem devolução são retornadas com a data de devolução igual a None.
+        Cada animal e cada adotante é convertido para entidade de domínio
+        apenas uma vez, mesmo que apareça em várias adoções.
+
+        Returns:
+            list[tuple[Adoption, Cat | Dog, Adopter, datetime | None]]: Lista de
+            tuplas (adoção, animal, adotante, data da devolução) ordenada por ID.
+        """
+        rows = (
+            self.session
+            .query(AdoptionModel, AnimalModel, AdopterModel, AdoptionReturnModel.timestamp)
+            .join(AnimalModel, AdoptionModel.animal_id == AnimalModel.id)
+            .join(AdopterModel, AdoptionModel.adopter_id == AdopterModel.id)
+            .outerjoin(AdoptionReturnModel, AdoptionReturnModel.adoption_id == AdoptionModel.id)
+            .order_by(AdoptionModel.id)
             .all()
         )
+
+        animals = {}
+        adopters = {}
+        result = []
+
+        for adoption_model, animal_model, adopter_model, return_timestamp in rows:
+            if animal_model.id not in animals:
+                animals[animal_model.id] = self.animal_mapper._to_domain(animal_model)
+
+            if adopter_model.id not in adopters:
+                adopters[adopter_model.id] = self.adopter_mapper._to_domain(adopter_model)
+
+            result.append((
+                self._to_domain(adoption_model),
+                animals[animal_model.id],
+                adopters[adopter_model.id],
+                return_timestamp
+            ))
+
+        return result
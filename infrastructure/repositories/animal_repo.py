@@ -1,18 +1,76 @@
 import json
+import re
+import unicodedata
 
 from .base_repo import BaseRepository
-from typing import override
+from functools import lru_cache
+from typing import Iterable, override
+from sqlalchemy import select, update, case, func, and_, true, table, column, bindparam, text
+from sqlalchemy.exc import OperationalError
 
 from domain.animals.animal import Species, Gender, Size
 from domain.enums.animal_status import AnimalStatus
 
 from infrastructure.db_models.animal_model import AnimalModel
+from infrastructure.db_models.animal_search_model import (
+    AnimalFacetCountModel, AGE_GROUPS, FTS_TABLE, FTS_PREFIXES, FTS_TERMS_TABLE,
+    age_group_sql, rebuild_search_index
+)
 from domain.animals.cat import Cat
 from domain.animals.dog import Dog
 
-from domain.exceptions import InvalidStatusTransitionError
+from domain.exceptions import InvalidStatusTransitionError, ConcurrentUpdateError
+
+@lru_cache(maxsize=4096)
+def _load_temperament(raw: str) -> tuple[str, ...]:
+    """
+    Decodifica a coluna temperament (lista JSON). Como poucos valores distintos
+    se repetem entre os animais, cada valor é decodificado uma única vez.
+    """
+    return tuple(json.loads(raw))
+
+def _fold(term: str) -> str:
+    """Normaliza um termo como o tokenizador do índice (minúsculas, sem acentos)."""
+    return "".join(
+        char for char in unicodedata.normalize("NFKD", term.lower()) if not unicodedata.combining(char)
+    )
 
 class AnimalRepository(BaseRepository):
+    """
+    Attributes:
+        FACETS (dict[str, tuple[str, ...]]): Facetas da busca (search e
+            facet_counts) e os valores possíveis de cada uma, como armazenados
+            no banco.
+        FACET_COUNT_LIMIT (int): Quantidade máxima de animais encontrados por
+            texto agregados por facet_counts; acima dela, as contagens são
+            aproximadas.
+        PREFIX_EXPANSION_LIMIT (int): Quantidade máxima de termos do índice
+            em que um prefixo buscado é expandido.
+    """
+
+    FACET_COUNT_LIMIT = 2_000
+    PREFIX_EXPANSION_LIMIT = 8
+
+    FACETS = {
+        "species": tuple(species.value for species in Species),
+        "size": tuple(size.value for size in Size),
+        "gender": tuple(gender.value for gender in Gender),
+        "status": tuple(status.value for status in AnimalStatus),
+        "age_group": tuple(name for name, _ in AGE_GROUPS),
+    }
+
+    # Tabela virtual FTS5 (animal_search_model); a coluna oculta com o nome da
+    # tabela recebe o operador MATCH
+    __fts = table(FTS_TABLE, column("rowid"), column(FTS_TABLE))
+    __fts_terms = table(FTS_TERMS_TABLE, column("term"))
+
+    # Consultas da busca, montadas uma única vez para cada combinação de
+    # texto e facetas filtradas (os valores são passados como parâmetros)
+    __search_statements = {}
+    __facet_statements = {}
+
+    # Colunas gravadas apenas sob compare-and-swap (compare_and_set_status)
+    __STATUS_COLUMNS = frozenset({"id", "status", "version"})
 
     def __init__(self, session):
         super().__init__(session, AnimalModel)
@@ -23,6 +81,9 @@ class AnimalRepository(BaseRepository):
         Converte um objeto AnimalModel (SQLAlchemy) em uma entidade de domínio
         correspondente (Cat ou Dog).
 
+        Os dados persistidos já foram validados na criação da entidade, por isso
+        a reconstrução utiliza from_row, que não repete a validação dos setters.
+
         Args:
             animal_model (AnimalModel): Instância do modelo persistido no banco.
 
@@ -42,18 +103,18 @@ class AnimalRepository(BaseRepository):
             gender=Gender[animal_model.gender],         # Enum
             age_months=animal_model.age_months,
             size=Size[animal_model.size],               # Enum
-            temperament=json.loads(animal_model.temperament),
+            temperament=list(_load_temperament(animal_model.temperament)),
             status=AnimalStatus[animal_model.status],   # Enum
             timestamp=animal_model.timestamp,
         )
 
         if species == Species.CAT:   
-            animal = Cat(
+            animal = Cat.from_row(
                 **common_args,
                 is_hypoallergenic=extra_data.get("is_hypoallergenic", False)
             )
         else:
-            animal = Dog(
+            animal = Dog.from_row(
                 **common_args,
                 needs_walk=extra_data.get("needs_walk", False)
             )
@@ -110,25 +171,466 @@ class AnimalRepository(BaseRepository):
 
         return [self._to_domain(model) for model in models]
 
+    def list_reservable_features(self) -> list[tuple[int, Size, str, tuple[str, ...]]]:
+        """
+        Retorna apenas as características usadas no cálculo de compatibilidade
+        dos animais reserváveis, sem construir modelos nem entidades de domínio.
+
+        A faixa etária é calculada no banco (mesmos limites de Animal.age_group).
+
+        Returns:
+            list[tuple[int, Size, str, tuple[str, ...]]]: Tuplas (id, porte,
+            faixa etária, temperamento), ordenadas por id.
+        """
+        reservable = [
+            AnimalStatus.AVAILABLE.value,
+            AnimalStatus.RESERVED.value,
+        ]
+        rows = self.session.execute(
+            select(
+                AnimalModel.id,
+                AnimalModel.size,
+                text(age_group_sql("animals.age_months")),
+                AnimalModel.temperament
+            )
+            .where(AnimalModel.status.in_(reservable))
+            .order_by(AnimalModel.id)
+        ).all()
+
+        return [
+            (id, Size[size], age_group, _load_temperament(temperament))
+            for id, size, age_group, temperament in rows
+        ]
+
+    def get_status_version(self, id: int) -> tuple[AnimalStatus, int] | None:
+        """
+        Lê diretamente do banco o status e a versão atuais de um animal,
+        ignorando instâncias possivelmente desatualizadas da sessão.
+
+        Args:
+            id (int): Identificador do animal.
+
+        Returns:
+            tuple[AnimalStatus, int] | None: Status e versão do animal;
+            None caso o animal não exista.
+        """
+        row = self.session.execute(
+            select(AnimalModel.status, AnimalModel.version).where(AnimalModel.id == id)
+        ).one_or_none()
+
+        if row is None:
+            return None
+
+        return AnimalStatus[row.status], row.version
+
+    def compare_and_set_status(
+        self,
+        id: int,
+        expected_version: int,
+        new_status: AnimalStatus,
+        commit: bool = True
+    ) -> bool:
+        """
+        Aplica um novo status somente se a versão do animal ainda for a esperada
+        (compare-and-swap), incrementando a versão.
+
+        Com ``commit=False`` a alteração permanece na transação corrente, o que
+        permite usá-la como primeira escrita de uma operação maior: a partir daí
+        nenhuma outra transação consegue alterar o animal até o commit. Nesse
+        caso, cabe a quem confirma a transação remover o animal do cache
+        (``_evict``).
+
+        Args:
+            id (int): Identificador do animal.
+            expected_version (int): Versão lida antes da alteração.
+            new_status (AnimalStatus): Novo status a ser aplicado.
+            commit (bool): Se a transação deve ser confirmada em caso de sucesso.
+
+        Returns:
+            bool: True se a versão conferiu e o status foi aplicado;
+            False caso o animal tenha sido alterado por outra transação.
+        """
+        result = self.session.execute(
+            update(AnimalModel)
+            .where(AnimalModel.id == id, AnimalModel.version == expected_version)
+            .values(status=new_status.value, version=AnimalModel.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+
+        if result.rowcount != 1:
+            return False
+
+        self._touch()
+
+        if commit:
+            self.session.commit()
+            self._evict(id)
+        return True
 
     def update_status(self, id: int, new_status: AnimalStatus) -> None:
         """
         Atualiza apenas o status de um animal, garantindo que a transição de estado
         seja válida conforme as regras definidas em AnimalStatus.
 
+        A transição é validada contra o status lido do banco e aplicada com
+        compare-and-swap sobre a versão do animal; se outra transação alterar o
+        animal nesse intervalo, a leitura e a validação são repetidas, com
+        recuo exponencial entre as tentativas.
+
         Args:
             id (int): Identificador do animal.
             new_status (AnimalStatus): Novo status a ser aplicado.
 
         Raises:
+            ValueError: Caso o animal não exista.
             InvalidStatusTransitionError: Caso a transição seja inválida.
+            ConcurrentUpdateError: Caso o animal continue sendo alterado
+                concorrentemente após todas as tentativas.
+        """
+        for attempt in range(self.MAX_RETRIES):
+            status_version = self.get_status_version(id)
+
+            if status_version is None:
+                raise ValueError("Animal não encontrado.")
+
+            current, version = status_version
+
+            if not AnimalStatus.is_valid_transition(current, new_status):
+                raise InvalidStatusTransitionError(f"Transição inválida! {current} -> {new_status}")
+
+            try:
+                if self.compare_and_set_status(id, version, new_status):
+                    return
+            except OperationalError:    # Banco bloqueado por outro escritor
+                pass
+
+            self.session.rollback()
+            self._backoff(attempt)
+
+        raise ConcurrentUpdateError(f"Não foi possível atualizar o status do animal {id}.")
+
+    @override
+    def update(self, animal: Cat | Dog) -> bool:
         """
-        animal_model = self.session.get(AnimalModel, id)
+        Atualiza os dados cadastrais de um animal existente.
 
-        current = AnimalStatus[animal_model.status]
+        O status e a sua versão não são gravados: a entidade pode ter sido lida
+        antes de uma reserva ou adoção concorrente (ou vir do cache), e gravá-los
+        desfaria a transição. Mudanças de status passam apenas por
+        update_status / compare_and_set_status.
 
-        if AnimalStatus.is_valid_transition(current, new_status):
-            animal_model.status = new_status.value
+        Args:
+            animal (Cat | Dog): Entidade com os dados atualizados.
+
+        Returns:
+            bool: True se o animal existir e for atualizado;
+            False caso contrário.
+        """
+        model = self._to_model(animal)
+        values = {
+            column.key: getattr(model, column.key)
+            for column in AnimalModel.__table__.columns
+            if column.key not in self.__STATUS_COLUMNS
+        }
+
+        result = self.session.execute(
+            update(AnimalModel)
+            .where(AnimalModel.id == animal.id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+        if result.rowcount != 1:
+            self.session.rollback()
+            return False
+
+        self._touch()
+        self.session.commit()
+
+        self._evict(animal.id)
+        return True
+
+    # -------------------------- SEARCH --------------------------
+
+    def search(
+        self,
+        text: str | None = None,
+        filters: dict[str, Iterable[str]] | None = None,
+        after_id: int | None = None,
+        limit: int | None = None
+    ) -> tuple[list[Cat | Dog], int | None]:
+        """
+        Busca animais por texto (nome, raça e temperamento) e por facetas,
+        com paginação por cursor (keyset) na ordem dos identificadores.
+
+        O texto é resolvido pelo índice FTS5, percorrido na ordem dos
+        identificadores: a página é lida sem ordenar nem pontuar todos os
+        resultados, de modo que o custo depende do tamanho da página e não da
+        quantidade de animais encontrados.
+
+        Args:
+            text (str | None): Palavras buscadas (prefixos); todas precisam
+                ocorrer. None ou vazio busca apenas pelas facetas.
+            filters (dict[str, Iterable[str]] | None): Valores aceitos para
+                cada faceta de FACETS (qualquer um deles); as facetas são
+                combinadas entre si.
+            after_id (int | None): Identificador do último animal da página
+                anterior. None retorna a primeira página.
+            limit (int | None): Quantidade de animais da página, limitada a
+                MAX_PAGE_SIZE. None utiliza PAGE_SIZE.
+
+        Returns:
+            tuple[list[Cat | Dog], int | None]: Animais da página e o cursor da
+            próxima página, ou None caso esta seja a última.
 
+        Raises:
+            ValueError: Caso alguma faceta ou valor não exista.
+        """
+        limit = self.PAGE_SIZE if limit is None else max(1, min(limit, self.MAX_PAGE_SIZE))
+        query = self.__match_query(text)
+        filters = self.__validate_filters(filters)
+
+        key = (query is not None, frozenset(filters))
+        if key not in self.__search_statements:
+            self.__search_statements[key] = self.__search_statement(*key)
+
+        # Um registro extra indica se existe uma próxima página
+        rows = self.session.execute(self.__search_statements[key], {
+            **self.__filter_params(filters),
+            "match": query,
+            "after_id": after_id or 0,
+            "limit": limit + 1
+        }).all()
+
+        next_after = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_after = rows[-1].id
+
+        return [self._to_domain(row) for row in rows], next_after
+
+    def facet_counts(
+        self,
+        text: str | None = None,
+        filters: dict[str, Iterable[str]] | None = None
+    ) -> tuple[int, dict[str, dict[str, int]], bool]:
+        """
+        Calcula, em uma única consulta de agregação, a quantidade de animais
+        encontrados e as contagens de cada valor de faceta.
+
+        A contagem de um valor considera os filtros das demais facetas, mas
+        não o da própria faceta, indicando quantos resultados haveria ao
+        escolher esse valor no lugar (ou além) dos já selecionados.
+
+        Sem texto, as contagens são somadas em animal_facet_counts (mantida
+        por triggers), sem percorrer o catálogo; com texto, os animais
+        encontrados pelo índice FTS5 são agregados, com custo proporcional à
+        quantidade encontrada. Para que textos abrangentes (ex.: uma raça
+        comum) não percorram boa parte do catálogo, no máximo
+        FACET_COUNT_LIMIT animais encontrados (os de menor ID) são agregados;
+        ao atingir o limite, as contagens são marcadas como aproximadas (são
+        limites inferiores).
+
+        Args:
+            text (str | None): Palavras buscadas, como em search.
+            filters (dict[str, Iterable[str]] | None): Filtros, como em search.
+
+        Returns:
+            tuple[int, dict[str, dict[str, int]], bool]: Quantidade de animais
+            que atendem a todos os filtros, as contagens (faceta -> valor ->
+            quantidade) e se elas são aproximadas.
+
+        Raises:
+            ValueError: Caso alguma faceta ou valor não exista.
+        """
+        query = self.__match_query(text)
+        filters = self.__validate_filters(filters)
+
+        key = (query is not None, frozenset(filters))
+        if key not in self.__facet_statements:
+            self.__facet_statements[key] = self.__facet_statement(*key)
+
+        total, *counts = self.session.execute(
+            self.__facet_statements[key],
+            {**self.__filter_params(filters), "match": query, "facet_limit": self.FACET_COUNT_LIMIT}
+        ).one()
+
+        approximate = False
+        if query is not None:
+            *counts, matched = counts
+            approximate = matched >= self.FACET_COUNT_LIMIT
+
+        facets = {facet: {} for facet in self.FACETS}
+        values = ((facet, value) for facet, values in self.FACETS.items() for value in values)
+
+        for (facet, value), amount in zip(values, counts):
+            facets[facet][value] = amount or 0
+
+        return total or 0, facets, approximate
+
+    def rebuild_search_index(self) -> None:
+        """
+        Reconstrói o índice de texto e as contagens de facetas a partir da
+        tabela animals e confirma a transação.
+        """
+        rebuild_search_index(self.session.connection())
+        self.session.commit()
+
+    def __validate_filters(self, filters: dict | None) -> dict[str, list[str]]:
+        """
+        Valida os filtros, descartando as facetas sem valores.
+
+        Raises:
+            ValueError: Caso alguma faceta ou valor não exista.
+        """
+        validated = {}
+
+        for facet, values in (filters or {}).items():
+            if facet not in self.FACETS:
+                raise ValueError(f"Faceta inválida: {facet}")
+
+            values = list(dict.fromkeys(values))
+            invalid = [value for value in values if value not in self.FACETS[facet]]
+
+            if invalid:
+                raise ValueError(f"Valores inválidos para {facet}: {', '.join(invalid)}")
+
+            if values:
+                validated[facet] = values
+
+        return validated
+
+    @staticmethod
+    def __filter_params(filters: dict[str, list[str]]) -> dict[str, list[str]]:
+        # Os nomes dos parâmetros não podem coincidir com os gerados para as
+        # comparações com literais (ex.: "species_1")
+        return {f"{facet}_filter": values for facet, values in filters.items()}
+
+    def __match_query(self, text: str | None) -> str | None:
+        """
+        Converte o texto digitado em uma consulta FTS5: cada palavra vira um
+        termo entre aspas com busca por prefixo, e todos precisam ocorrer.
+        Operadores e caracteres especiais do FTS5 são descartados.
+        """
+        terms = re.findall(r"\w+", text or "")
+
+        if not terms:
+            return None
+
+        return " AND ".join(self.__match_term(term) for term in terms)
+
+    def __match_term(self, term: str) -> str:
+        """
+        Prefixos sem índice próprio (mais longos que FTS_PREFIXES) obrigam o
+        FTS5 a reunir todas as ocorrências dos termos que começam por eles
+        antes de entregar o primeiro resultado, mesmo que a consulta tenha
+        LIMIT. Quando o prefixo corresponde a poucos termos do índice, ele é
+        substituído por esses termos exatos, lidos sob demanda.
+        """
+        folded = _fold(term)
+        if len(folded) <= max(FTS_PREFIXES) or not (folded.isascii() and folded.isalnum()):
+            return f'"{term}"*'
+
+        stmt = (
+            select(self.__fts_terms.c.term)
+            .where(self.__fts_terms.c.term >= bindparam("low"), self.__fts_terms.c.term < folded + "\U0010ffff")
+            .limit(1)
+        )
+
+        # Cada consulta lê apenas a primeira ocorrência do próximo termo
+        found, low = [], folded
+        while len(found) <= self.PREFIX_EXPANSION_LIMIT:
+            match = self.session.execute(stmt, {"low": low}).scalar()
+            if match is None:
+                break
+            found.append(match)
+            low = match + "\x01"
+
+        if not found or len(found) > self.PREFIX_EXPANSION_LIMIT:
+            return f'"{term}"*'
+
+        return "(" + " OR ".join(f'"{match}"' for match in found) + ")"
+
+    def __facet_columns(self, source) -> dict:
+        """Coluna de cada faceta na tabela informada (faixa etária calculada pela idade em animals)."""
+        if "age_group" in source.c:
+            return {facet: source.c[facet] for facet in self.FACETS}
+
+        age_group = case(
+            *((source.c.age_months < upper, name) for name, upper in AGE_GROUPS if upper is not None),
+            else_=AGE_GROUPS[-1][0]
+        )
+        return {
+            facet: age_group if facet == "age_group" else source.c[facet]
+            for facet in self.FACETS
+        }
+
+    def __conditions(self, columns: dict, filtered: frozenset) -> dict:
+        """Condição de cada faceta filtrada, com os valores aceitos em um parâmetro (__filter_params)."""
+        return {
+            facet: columns[facet].in_(bindparam(f"{facet}_filter", expanding=True))
+            for facet in self.FACETS
+            if facet in filtered
+        }
+
+    def __search_statement(self, with_text: bool, filtered: frozenset):
+        animals = AnimalModel.__table__
+        conditions = self.__conditions(self.__facet_columns(animals), filtered)
+
+        if with_text:
+            pk = self.__fts.c.rowid
+            stmt = (
+                select(animals)
+                .select_from(self.__fts)
+                .join(animals, animals.c.id == pk)
+                .where(self.__fts.c[FTS_TABLE].match(bindparam("match")))
+            )
         else:
-            raise InvalidStatusTransitionError(f"Transição inválida! {current} -> {new_status}")
\ No newline at end of file
+            pk = animals.c.id
+            stmt = select(animals)
+
+        return (
+            stmt.where(pk > bindparam("after_id"), *conditions.values())
+            .order_by(pk)
+            .limit(bindparam("limit"))
+        )
+
+    def __facet_statement(self, with_text: bool, filtered: frozenset):
+        if with_text:
+            animals = AnimalModel.__table__
+            columns = self.__facet_columns(animals)
+            weight = 1
+
+            # O FTS5 entrega os animais encontrados sob demanda: o limite
+            # interrompe a leitura do índice e as buscas em animals
+            matches = (
+                select(self.__fts.c.rowid.label("id"))
+                .where(self.__fts.c[FTS_TABLE].match(bindparam("match")))
+                .limit(bindparam("facet_limit"))
+                .subquery()
+            )
+            stmt = select().select_from(matches).join(animals, animals.c.id == matches.c.id)
+        else:
+            source = AnimalFacetCountModel.__table__
+            columns = self.__facet_columns(source)
+            weight = source.c.total
+            stmt = select().select_from(source)
+
+        conditions = self.__conditions(columns, filtered)
+
+        def count(*where):
+            return func.sum(case((and_(true(), *where), weight), else_=0))
+
+        aggregates = [count(*conditions.values())] + [
+            count(
+                columns[facet] == value,
+                *(condition for other, condition in conditions.items() if other != facet)
+            )
+            for facet, values in self.FACETS.items()
+            for value in values
+        ]
+
+        if with_text:
+            aggregates.append(func.count())
+
+        return stmt.add_columns(*aggregates)
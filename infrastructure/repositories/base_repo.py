@@ -1,7 +1,15 @@
+import random
+import time
 from abc import ABC
-from typing import Any
+from datetime import datetime
+from typing import Any, Iterable, Iterator
+from sqlalchemy import select, insert, inspect, and_, or_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 
+from infrastructure.db_models.table_version_model import TableVersionModel
+from .entity_cache import EntityCache
+
 class BaseRepository(ABC):
     """
     Classe base abstrata para repositórios que utilizam SQLAlchemy.
@@ -28,9 +36,34 @@ class BaseRepository(ABC):
         session (Session): Instância da sessão SQLAlchemy utilizada para operações no banco de dados.
         model_class (type): Classe do modelo SQLAlchemy gerenciado pelo repositório.
         domain_class (type): Classe da entidade de domínio correspondente ao modelo.
+        PAGE_SIZE (int): Quantidade padrão de registros por página em list_page.
+        MAX_PAGE_SIZE (int): Quantidade máxima de registros por página em list_page.
+        MAX_RETRIES (int): Tentativas de uma atualização otimista (compare-and-swap)
+            antes de desistir.
+        RETRY_BASE_DELAY (float): Espera inicial, em segundos, entre tentativas.
+        RETRY_MAX_DELAY (float): Espera máxima, em segundos, entre tentativas.
+        IN_CHUNK_SIZE (int): Quantidade máxima de identificadores por consulta
+            ``IN`` em get_many.
+        cache (EntityCache | None): Cache de entidades usado por get_by_id e
+            get_many. Definido na classe, é compartilhado por todas as
+            instâncias do repositório (inclusive as usadas internamente por
+            outros repositórios), de modo que qualquer escrita o mantém
+            atualizado. None (padrão) desativa o cache.
     """
 
     domain_class = None
+    cache: EntityCache | None = None
+
+    PAGE_SIZE = 50
+    MAX_PAGE_SIZE = 200
+
+    MAX_RETRIES = 10
+    RETRY_BASE_DELAY = 0.005
+    RETRY_MAX_DELAY = 0.25
+
+    # Abaixo do limite de 999 parâmetros por instrução das versões do SQLite
+    # anteriores à 3.32 (SQLITE_MAX_VARIABLE_NUMBER)
+    IN_CHUNK_SIZE = 900
     
     def __init__(self, session, model_class):
         self.session = session
@@ -52,7 +85,14 @@ class BaseRepository(ABC):
             - tratamento específico de relacionamentos
 
         Este método pressupõe que o construtor da entidade de domínio aceite
-        apenas atributos públicos presentes no modelo SQLAlchemy.
+        apenas atributos públicos presentes no modelo SQLAlchemy. Quando a
+        entidade define o construtor ``from_row``, ele é utilizado no lugar do
+        construtor comum, evitando repetir a validação de dados já persistidos.
+
+        Os valores são lidos como atributos, de modo que uma linha simples com
+        as colunas da tabela (``select(model_class.__table__)``) também pode ser
+        convertida, sem instanciar o modelo; as conversões das subclasses devem
+        manter essa propriedade.
 
         Args:
             model_obj (Any): Instância do modelo SQLAlchemy persistido no banco
@@ -67,9 +107,10 @@ class BaseRepository(ABC):
 
         data_args = {
             column.name: getattr(model_obj, column.name)
-            for column in model_obj.__table__.columns
+            for column in self.model_class.__table__.columns
         }
-        return self.domain_class(**data_args)
+        factory = getattr(self.domain_class, "from_row", self.domain_class)
+        return factory(**data_args)
 
     def _to_model(self, domain_obj: Any) -> Any | None:
         """
@@ -101,6 +142,65 @@ class BaseRepository(ABC):
         }
         return self.model_class(**data_args)
 
+    # -------------------------- CONCURRENCY --------------------------
+
+    def _backoff(self, attempt: int) -> None:
+        """
+        Aguarda antes de repetir uma atualização otimista que perdeu a disputa.
+
+        Utiliza recuo exponencial com jitter completo: a espera é sorteada entre
+        zero e ``RETRY_BASE_DELAY * 2 ** attempt``, limitada a ``RETRY_MAX_DELAY``,
+        para que transações concorrentes não voltem a colidir em sincronia.
+
+        Args:
+            attempt (int): Número da tentativa que falhou (a partir de 0).
+        """
+        ceiling = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt)
+        time.sleep(random.uniform(0, ceiling))
+
+    # -------------------------- CHANGE TRACKING --------------------------
+
+    def _touch(self, *tables: str) -> None:
+        """
+        Incrementa o contador de alterações (TableVersionModel) das tabelas
+        informadas, na transação corrente.
+
+        Deve ser chamado por toda escrita do repositório antes do commit, de
+        modo que o contador e os dados mudem juntos: um rollback desfaz ambos.
+        Sem argumentos, incrementa o contador da tabela do próprio repositório.
+
+        Args:
+            *tables (str): Nomes das tabelas alteradas.
+        """
+        tables = tables or (self.model_class.__tablename__,)
+        now = datetime.now()
+
+        statement = sqlite_insert(TableVersionModel.__table__).values([
+            {"table_name": table, "version": 1, "updated_at": now}
+            for table in tables
+        ])
+        statement = statement.on_conflict_do_update(
+            index_elements=["table_name"],
+            set_={
+                "version": TableVersionModel.__table__.c.version + 1,
+                "updated_at": statement.excluded.updated_at
+            }
+        )
+        self.session.execute(statement)
+
+    def _evict(self, *ids: Any) -> None:
+        """
+        Remove do cache de entidades os registros alterados.
+
+        Deve ser chamado após o commit: se fosse chamado antes, uma leitura
+        concorrente poderia armazenar novamente a versão anterior.
+
+        Args:
+            *ids (Any): Chaves primárias dos registros alterados.
+        """
+        if self.cache is not None:
+            self.cache.invalidate(*(self.__key(id) for id in ids))
+
     # -------------------------- CRUD --------------------------
 
     # ---- Create ----
@@ -124,13 +224,95 @@ class BaseRepository(ABC):
         try:
             model_obj = self._to_model(domain_obj)
             self.session.add(model_obj)
+            self._touch()
             self.session.commit()
             self.session.refresh(model_obj)
             return True
         except IntegrityError:
             self.session.rollback()
             return False
-          
+
+    def save_many(self, domain_objs: Iterable, batch_size: int = 1000) -> list[int]:
+        """
+        Insere várias entidades no banco de dados em lotes.
+
+        Cada entidade é convertida com ``_to_model`` e cada lote é inserido com um
+        único INSERT executado em modo ``executemany``, seguido de um único commit,
+        sem o refresh individual realizado por save.
+
+        Caso um lote viole alguma restrição de integridade (IntegrityError), ele é
+        revertido e reinserido linha a linha, cada uma em um SAVEPOINT próprio,
+        de modo que apenas as linhas inválidas sejam descartadas e o restante da
+        carga prossiga normalmente.
+
+        Args:
+            domain_objs (Iterable[Any]): Entidades de domínio a serem persistidas.
+            batch_size (int): Quantidade de entidades inseridas por transação.
+
+        Returns:
+            list[int]: Posições (na ordem de ``domain_objs``) das entidades
+            rejeitadas por erro de integridade. Lista vazia se todas forem salvas.
+        """
+        rejected = []
+        batch = []
+
+        for position, domain_obj in enumerate(domain_objs):
+            batch.append((position, self.__to_row(domain_obj)))
+
+            if len(batch) >= batch_size:
+                rejected.extend(self.__insert_batch(batch))
+                batch = []
+
+        if batch:
+            rejected.extend(self.__insert_batch(batch))
+
+        return rejected
+
+    def __to_row(self, domain_obj) -> dict:
+        """
+        Converte uma entidade de domínio nos valores de colunas da tabela.
+
+        Colunas não preenchidas por ``_to_model`` ficam de fora, para que
+        recebam o valor padrão declarado no modelo.
+        """
+        model_obj = self._to_model(domain_obj)
+
+        return {
+            column.name: getattr(model_obj, column.name)
+            for column in self.model_class.__table__.columns
+            if column.name in vars(model_obj)
+        }
+
+    def __insert_batch(self, batch: list[tuple[int, dict]]) -> list[int]:
+        """
+        Insere um lote de linhas em uma única transação, isolando as linhas
+        inválidas em caso de erro de integridade.
+        """
+        statement = insert(self.model_class.__table__)
+
+        try:
+            self.session.execute(statement, [row for _, row in batch])
+            self._touch()
+            self.session.commit()
+            return []
+        except IntegrityError:
+            self.session.rollback()
+
+        rejected = []
+
+        for position, row in batch:
+            try:
+                with self.session.begin_nested():
+                    self.session.execute(statement, row)
+            except IntegrityError:
+                rejected.append(position)
+
+        if len(rejected) < len(batch):
+            self._touch()
+
+        self.session.commit()
+        return rejected
+
     # ---- Read ----
     def list_all(self) -> list:
         """
@@ -146,22 +328,323 @@ class BaseRepository(ABC):
 
         return [self._to_domain(model_obj) for model_obj in models]
 
+    def list_page(
+        self,
+        after_id: int | None = None,
+        limit: int | None = None,
+        order_by: str = "id"
+    ) -> tuple[list, int | None]:
+        """
+        Retorna uma página de registros utilizando paginação por cursor (keyset).
+
+        Em vez de OFFSET, a página seguinte é obtida filtrando os registros
+        posteriores ao último registro da página anterior, o que mantém o custo
+        de cada página limitado independentemente do tamanho da tabela.
+
+        Quando a ordenação é feita por uma coluna diferente da chave primária
+        (ex.: timestamp), a chave primária é utilizada como critério de desempate,
+        e o cursor passa a ser o par (valor da coluna, identificador) do último
+        registro, que continua válido mesmo que esse registro seja removido.
+
+        Args:
+            after_id (int | tuple | None): Cursor retornado pela página
+                anterior. None retorna a primeira página. Com ordenação por
+                outra coluna, um identificador isolado também é aceito; caso
+                o registro não exista mais, a página continua a partir dos
+                registros com identificador maior.
+            limit (int | None): Quantidade de registros da página, limitada a
+                MAX_PAGE_SIZE. None utiliza PAGE_SIZE.
+            order_by (str): Nome da coluna utilizada na ordenação.
+
+        Returns:
+            tuple[list[Any], int | tuple | None]: Entidades de domínio da
+            página e o cursor da próxima página, ou None caso esta seja a última.
+
+        Raises:
+            ValueError: Caso a coluna de ordenação não exista no modelo.
+        """
+        pk = inspect(self.model_class).primary_key[0]
+        query = self.session.query(self.model_class)
+
+        models, next_after = self.__fetch_page(query, after_id, limit, order_by)
+
+        if next_after is not None:
+            next_after = self.__cursor(
+                order_by, getattr(next_after, order_by), getattr(next_after, pk.key)
+            )
+
+        return [self._to_domain(model_obj) for model_obj in models], next_after
+
+    def list_page_columns(
+        self,
+        columns: Iterable[str],
+        after_id: int | None = None,
+        limit: int | None = None,
+        order_by: str = "id"
+    ) -> tuple[list[dict], int | None]:
+        """
+        Retorna uma página de registros contendo apenas as colunas informadas.
+
+        Utiliza a mesma paginação por cursor (keyset) de list_page, mas a
+        consulta seleciona somente as colunas pedidas e nenhum modelo ou
+        entidade de domínio é construído: cada registro é devolvido como um
+        dicionário com os valores armazenados no banco. Indicado para
+        respostas que expõem apenas parte dos atributos (ex.: API JSON).
+
+        Args:
+            columns (Iterable[str]): Nomes das colunas a serem lidas.
+            after_id (int | tuple | None): Cursor retornado pela página
+                anterior (ver list_page). None retorna a primeira página.
+            limit (int | None): Quantidade de registros da página, limitada a
+                MAX_PAGE_SIZE. None utiliza PAGE_SIZE.
+            order_by (str): Nome da coluna utilizada na ordenação.
+
+        Returns:
+            tuple[list[dict], int | tuple | None]: Registros da página (coluna -> valor)
+            e o cursor da próxima página, ou None caso esta seja a última.
+
+        Raises:
+            ValueError: Caso alguma coluna (ou a coluna de ordenação) não exista no modelo.
+        """
+        pk = inspect(self.model_class).primary_key[0]
+        selected = self.__select_columns(columns)
+
+        # A chave primária e a coluna de ordenação são sempre lidas, pois
+        # formam o cursor da próxima página
+        query = self.session.query(
+            *selected, pk.label("_cursor"), self.__order_column(order_by).label("_cursor_value")
+        )
+
+        rows, next_after = self.__fetch_page(query, after_id, limit, order_by)
+
+        if next_after is not None:
+            next_after = self.__cursor(order_by, next_after._cursor_value, next_after._cursor)
+
+        return [{column.name: row[i] for i, column in enumerate(selected)} for row in rows], next_after
+
+    def get_columns(self, id: int, columns: Iterable[str]) -> dict | None:
+        """
+        Obtém apenas as colunas informadas de um único registro.
+
+        Args:
+            id (int): Identificador único do registro desejado.
+            columns (Iterable[str]): Nomes das colunas a serem lidas.
+
+        Returns:
+            dict | None: Valores armazenados (coluna -> valor) ou None, caso o
+            registro não exista.
+
+        Raises:
+            ValueError: Caso alguma coluna não exista no modelo.
+        """
+        pk = inspect(self.model_class).primary_key[0]
+        selected = self.__select_columns(columns)
+
+        row = self.session.query(*selected).filter(pk == id).first()
+
+        if row is None:
+            return None
+
+        return {column.name: row[i] for i, column in enumerate(selected)}
+
+    def __select_columns(self, columns: Iterable[str]) -> list:
+        """Converte nomes em colunas da tabela, sem repetições e na ordem informada."""
+        table = self.model_class.__table__
+        names = list(dict.fromkeys(columns))
+
+        invalid = [name for name in names if name not in table.columns]
+        if invalid:
+            raise ValueError(f"Colunas inválidas: {', '.join(invalid)}")
+
+        return [table.columns[name] for name in names]
+
+    def __order_column(self, order_by: str):
+        """Coluna de ordenação de uma página."""
+        if order_by not in self.model_class.__table__.columns:
+            raise ValueError(f"Coluna de ordenação inválida: {order_by}")
+
+        return self.model_class.__table__.columns[order_by]
+
+    def __cursor(self, order_by: str, value: Any, id: Any) -> Any:
+        """Cursor da próxima página: o identificador ou o par (valor da coluna, identificador)."""
+        pk = inspect(self.model_class).primary_key[0]
+
+        return id if self.__order_column(order_by) is pk else (value, id)
+
+    def __fetch_page(self, query, after_id: int | None, limit: int | None, order_by: str) -> tuple[list, Any]:
+        """
+        Aplica o cursor, a ordenação e o limite de uma página a uma consulta.
+
+        Returns:
+            tuple[list, Any]: Linhas da página e a última delas, caso exista
+            uma próxima página (None caso contrário).
+        """
+        limit = self.PAGE_SIZE if limit is None else max(1, min(limit, self.MAX_PAGE_SIZE))
+
+        pk = inspect(self.model_class).primary_key[0]
+        column = self.__order_column(order_by)
+
+        if column is pk:
+            if after_id is not None:
+                query = query.filter(pk > after_id)
+
+            query = query.order_by(pk)
+        else:
+            if isinstance(after_id, tuple):
+                after_value, after_id = after_id
+            elif after_id is not None:
+                after_value = self.session.execute(select(column).where(pk == after_id)).first()
+
+                if after_value is None:     # Registro do cursor removido
+                    query = query.filter(pk > after_id)
+                    after_id = None
+                else:
+                    after_value = after_value[0]
+
+            if after_id is not None:
+                query = query.filter(
+                    or_(
+                        column > after_value,
+                        and_(column == after_value, pk > after_id)
+                    )
+                )
+
+            query = query.order_by(column, pk)
+
+        # Um registro extra indica se existe uma próxima página
+        rows = query.limit(limit + 1).all()
+
+        if len(rows) > limit:
+            rows = rows[:limit]
+            return rows, rows[-1]
+
+        return rows, None
+
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[Any]:
+        """
+        Percorre todos os registros do modelo gerenciado sob demanda.
+
+        Diferente de list_all, os registros são buscados no banco em blocos de
+        ``chunk_size`` linhas (``yield_per``, com ``stream_results``) e convertidos
+        para entidades de domínio à medida que são consumidos, de forma que apenas
+        um bloco permanece em memória por vez. Indicado para exportações e
+        rotinas em lote sobre tabelas grandes.
+
+        Args:
+            chunk_size (int): Quantidade de linhas buscadas por vez no banco.
+
+        Yields:
+            Any: Entidades de domínio, ordenadas pela chave primária.
+        """
+        pk = inspect(self.model_class).primary_key[0]
+
+        query = (
+            self.session
+            .query(self.model_class)
+            .order_by(pk)
+            .yield_per(chunk_size)
+        )
+
+        for model_obj in query:
+            yield self._to_domain(model_obj)
+
     def get_by_id(self, id: int) -> Any | None:
         """
         Obtém um único registro com base no seu identificador único.
 
         Busca o modelo correspondente no banco e, caso encontrado, converte-o
-        para uma entidade de domínio.
+        para uma entidade de domínio. Quando o repositório possui um cache
+        (``cache``), a entidade é procurada primeiro nele; nesse caso, a mesma
+        instância pode ser devolvida a várias chamadas e não deve ser alterada
+        diretamente (altere uma cópia e persista com update).
 
         Este método deve ser sobrescrito em entidades que não possuem
         chaves únicas próprias (entidades fracas) ou para adição de filtros adicionais.
 
         Args:
-            id (int): Identificador único do registro desejado.
+            id (int): Identificador único do registro desejado. Com cache,
+                valores de outro tipo (ex.: "5" vindo de uma URL) são convertidos
+                para o tipo da chave primária, a mesma chave usada pelas escritas.
 
         Returns:
             (Any | None): Entidade de domínio se encontrada; caso contrário, None.
         """
+        cache = self.cache
+
+        if cache is None:
+            return self.__load(id)
+
+        id = self.__key(id)
+
+        if id is None:
+            return None
+
+        domain_obj = cache.get(id)
+
+        if domain_obj is None:
+            generation = cache.generation
+            domain_obj = self.__load(id)
+
+            if domain_obj is not None:
+                cache.put(id, domain_obj, generation)
+
+        return domain_obj
+
+    def get_many(self, ids: Iterable[int]) -> dict[int, Any]:
+        """
+        Obtém vários registros pelos seus identificadores.
+
+        Os identificadores encontrados no cache (quando existe) não são
+        consultados; os demais são buscados com ``IN``, em consultas de até
+        IN_CHUNK_SIZE identificadores. As linhas são lidas sem instanciar
+        modelos do SQLAlchemy e convertidas por ``_to_domain``, inclusive
+        quando a subclasse o sobrescreve.
+
+        Args:
+            ids (Iterable[int]): Identificadores desejados; repetições são
+                ignoradas e os valores são convertidos como em get_by_id.
+
+        Returns:
+            dict[int, Any]: Entidades de domínio encontradas (id -> entidade), na
+            ordem em que os identificadores foram informados. Identificadores
+            inexistentes ou inválidos não aparecem no resultado.
+        """
+        ids = [id for id in dict.fromkeys(map(self.__key, ids)) if id is not None]
+        cache = self.cache
+
+        if cache is None:
+            found, missing = {}, ids
+        else:
+            found, missing = cache.get_many(ids)
+
+        if missing:
+            generation = cache.generation if cache is not None else None
+            loaded = self.__load_many(missing)
+
+            if cache is not None:
+                cache.put_many(loaded, generation)
+
+            found.update(loaded)
+
+        return {id: found[id] for id in ids if id in found}
+
+    def __key(self, id: Any) -> Any | None:
+        """
+        Converte um identificador para o tipo da chave primária, de modo que
+        leituras e escritas usem a mesma chave no cache. Retorna None para
+        identificadores que não podem ser convertidos.
+        """
+        python_type = inspect(self.model_class).primary_key[0].type.python_type
+
+        if isinstance(id, python_type):
+            return id
+
+        try:
+            return python_type(id)
+        except (TypeError, ValueError):
+            return None
+
+    def __load(self, id: int) -> Any | None:
         model_obj = self.session.get(self.model_class, id)
 
         if not model_obj:
@@ -169,6 +652,22 @@ class BaseRepository(ABC):
 
         return self._to_domain(model_obj)
 
+    def __load_many(self, ids: list) -> dict:
+        """Lê os registros informados em blocos de IN_CHUNK_SIZE, indexados pelo ID."""
+        table = self.model_class.__table__
+        pk = inspect(self.model_class).primary_key[0]
+        loaded = {}
+
+        for start in range(0, len(ids), self.IN_CHUNK_SIZE):
+            chunk = ids[start:start + self.IN_CHUNK_SIZE]
+            rows = self.session.execute(select(table).where(pk.in_(chunk)))
+
+            # As linhas expõem as colunas como atributos, assim como os modelos
+            for row in rows:
+                loaded[getattr(row, pk.name)] = self._to_domain(row)
+
+        return loaded
+
     # ---- Update ----
     def update(self, domain_obj) -> bool:
         """
@@ -191,8 +690,11 @@ class BaseRepository(ABC):
             return False
 
         updated_obj = self.session.merge(model_obj)
+        self._touch()
         self.session.commit()
         self.session.refresh(updated_obj)
+
+        self._evict(domain_obj.id)
         return True
 
     # ---- Delete ----
@@ -217,5 +719,8 @@ class BaseRepository(ABC):
             return False
 
         self.session.delete(model_obj)
+        self._touch()
         self.session.commit()
+
+        self._evict(id)
         return True
\ No newline at end of file
@@ -0,0 +1,164 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable
+
+class EntityCache:
+    """
+    Cache LRU com expiração (TTL) de entidades de domínio, indexadas pela
+    chave primária (mapa de identidade entre requisições).
+
+    Usado por BaseRepository.get_by_id e get_many quando o repositório possui
+    um cache (atributo de classe ``cache``); as escritas do próprio
+    repositório removem as entidades alteradas após o commit. O TTL limita o
+    tempo em que uma alteração feita fora do processo (jobs, outro servidor)
+    pode passar despercebida.
+
+    Para evitar que uma leitura iniciada antes de uma escrita grave no cache
+    a versão antiga da entidade, cada remoção incrementa ``generation``; uma
+    entidade lida do banco só é armazenada se a geração ainda for a mesma do
+    início da leitura.
+
+    As entidades armazenadas são compartilhadas entre as requisições e não
+    devem ser alteradas diretamente.
+
+    Attributes:
+        max_size (int): Quantidade máxima de entidades armazenadas.
+        ttl (float): Tempo, em segundos, em que uma entidade permanece válida.
+        hits (int): Consultas atendidas pelo cache.
+        misses (int): Consultas que precisaram ir ao banco.
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl: float = 30.0):
+        if max_size <= 0:
+            raise ValueError("max_size deve ser maior que zero.")
+        if ttl <= 0:
+            raise ValueError("ttl deve ser maior que zero.")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+        self.__generation = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        return self.__generation
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    # -------------------------- READ --------------------------
+
+    def get(self, id: Hashable) -> Any | None:
+        """
+        Retorna a entidade armazenada, caso exista e não tenha expirado.
+
+        Args:
+            id (Hashable): Chave primária da entidade.
+
+        Returns:
+            Any | None: Entidade de domínio ou None.
+        """
+        with self.__lock:
+            entity = self.__lookup(id, time.monotonic())
+
+            if entity is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+            return entity
+
+    def get_many(self, ids: Iterable[Hashable]) -> tuple[dict, list]:
+        """
+        Separa as chaves informadas entre as encontradas no cache e as ausentes.
+
+        Args:
+            ids (Iterable[Hashable]): Chaves primárias, sem repetições.
+
+        Returns:
+            tuple[dict, list]: Entidades encontradas (chave -> entidade) e as
+            chaves ausentes ou expiradas, na ordem informada.
+        """
+        found = {}
+        missing = []
+        now = time.monotonic()
+
+        with self.__lock:
+            for id in ids:
+                entity = self.__lookup(id, now)
+
+                if entity is None:
+                    missing.append(id)
+                else:
+                    found[id] = entity
+
+            self.hits += len(found)
+            self.misses += len(missing)
+
+        return found, missing
+
+    # -------------------------- WRITE --------------------------
+
+    def put_many(self, entities: dict, generation: int) -> None:
+        """
+        Armazena entidades lidas do banco.
+
+        Args:
+            entities (dict): Entidades a serem armazenadas (chave -> entidade).
+            generation (int): Valor de ``generation`` no início da leitura;
+                se alguma remoção ocorreu desde então, nada é armazenado.
+        """
+        expires_at = time.monotonic() + self.ttl
+
+        with self.__lock:
+            if generation != self.__generation:
+                return
+
+            for id, entity in entities.items():
+                self.__entries[id] = (expires_at, entity)
+                self.__entries.move_to_end(id)
+
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def put(self, id: Hashable, entity: Any, generation: int) -> None:
+        self.put_many({id: entity}, generation)
+
+    def invalidate(self, *ids: Hashable) -> None:
+        """Remove as entidades informadas (chamado após cada escrita confirmada)."""
+        with self.__lock:
+            self.__generation += 1
+
+            for id in ids:
+                self.__entries.pop(id, None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__generation += 1
+            self.__entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __lookup(self, id: Hashable, now: float) -> Any | None:
+        entry = self.__entries.get(id)
+
+        if entry is None:
+            return None
+
+        expires_at, entity = entry
+
+        if expires_at <= now:
+            del self.__entries[id]
+            return None
+
+        self.__entries.move_to_end(id)
+        return entity
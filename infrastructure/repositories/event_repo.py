@@ -96,7 +96,8 @@ class EventRepository(BaseRepository):
 
         Returns:
             list[Event]: Lista de entidades de domínio correspondentes aos registros
-            encontrados no banco, já convertidas via mapeamento de domínio.
+            encontrados no banco, já convertidas via mapeamento de domínio e
+            ordenadas cronologicamente.
         """
         query = self.session.query(EventModel)
 
@@ -106,6 +107,6 @@ class EventRepository(BaseRepository):
         if animal_id is not None:
             query = query.filter_by(animal_id=animal_id)
 
-        models = query.all()
+        models = query.order_by(EventModel.timestamp, EventModel.id).all()
         events = [self._to_domain(model) for model in models]
         return events
\ No newline at end of file
@@ -1,8 +1,23 @@
 from .base_repo import BaseRepository
+from .animal_repo import AnimalRepository
+from .adopter_repo import AdopterRepository
 from infrastructure.db_models.reservation_queue_model import ReservationQueueModel
+from infrastructure.db_models.reservation_queue_stats_model import (
+    ReservationQueueStatsModel, queue_stats_from_scratch_sql, rebuild_queue_stats
+)
+from infrastructure.db_models.animal_model import AnimalModel
+from infrastructure.db_models.adopter_model import AdopterModel
 from domain.adoptions.reservation_queue import ReservationQueue
-from sqlalchemy import asc
+from domain.adoptions.queue_stats import QueueStats
+from domain.animals.cat import Cat
+from domain.animals.dog import Dog
+from domain.people.adopter import Adopter
+from domain.enums.animal_status import AnimalStatus
+from domain.exceptions import InvalidStatusTransitionError, ConcurrentUpdateError
+from sqlalchemy import asc, desc, select, update, delete, bindparam, tuple_
+from sqlalchemy.exc import IntegrityError, OperationalError
 from datetime import datetime, timedelta
+from typing import Iterable, Iterator
 
 class ReservationQueueRepository(BaseRepository):
 
@@ -10,6 +25,8 @@ class ReservationQueueRepository(BaseRepository):
    
     def __init__(self, session):
         super().__init__(session, model_class=ReservationQueueModel)
+        self.animal_mapper = AnimalRepository(session)
+        self.adopter_mapper = AdopterRepository(session)
     
     # ---- Read ----
 
@@ -24,21 +41,26 @@ class ReservationQueueRepository(BaseRepository):
             bool: True se houver reservas ativas para o animal;
                 False caso contrário.
         """
-        models = self.session.query(self.model_class).filter_by(animal_id=animal_id).all()
-
-        for model in models:
-            if model.is_canceled == False:
-                return True
-            
-        return False
+        model = (
+            self.session
+            .query(self.model_class.id)
+            .filter_by(animal_id=animal_id, is_canceled=False)
+            .first()
+        )
+        return model is not None
     
     def all_canceled(self, animal_id: int) -> bool:
-        models = self.session.query(self.model_class).filter_by(animal_id=animal_id).all()
+        """
+        Verifica se todas as reservas de um animal foram canceladas.
 
-        if not models:
-            return True
+        Args:
+            animal_id (int): ID do animal a ser verificado.
 
-        return all(m.is_canceled for m in models)
+        Returns:
+            bool: True se não houver reservas ativas para o animal
+                (inclusive quando não houver nenhuma reserva); False caso contrário.
+        """
+        return not self.has_active_reservations(animal_id)
 
     
     def get_first_reservation(self, animal_id: int) -> ReservationQueue | None:
@@ -69,14 +91,46 @@ class ReservationQueueRepository(BaseRepository):
         return self._to_domain(model)
     
     def is_queue_expired(self, animal_id: int, duration_hours: int) -> bool:
-        first = self.get_first_reservation(animal_id)
+        stats = self.get_queue_stats(animal_id)
 
-        if not first:
+        if not stats:
             return False
 
-        expiration = first.timestamp + timedelta(hours=duration_hours)
+        expiration = stats.first_timestamp + timedelta(hours=duration_hours)
         return datetime.now() >= expiration
-        
+
+    def get_queue_stats(self, animal_id: int) -> QueueStats | None:
+        """
+        Retorna o resumo da fila de reservas de um animal (tamanho, maior
+        compatibilidade e início), lido de reservation_queue_stats.
+
+        Args:
+            animal_id (int): ID do animal.
+
+        Returns:
+            QueueStats | None: Resumo da fila; None caso o animal não tenha
+            nenhuma reserva.
+        """
+        model = self.session.get(ReservationQueueStatsModel, animal_id)
+
+        if not model:
+            return None
+
+        return self.__to_stats(model)
+
+    def list_queue_stats(self) -> list[QueueStats]:
+        """
+        Retorna o resumo de todas as filas de reserva existentes, ordenado
+        por animal, com uma linha lida por fila.
+        """
+        models = (
+            self.session
+            .query(ReservationQueueStatsModel)
+            .order_by(ReservationQueueStatsModel.animal_id)
+            .all()
+        )
+        return [self.__to_stats(m) for m in models]
+
     def list_active_queue(self, animal_id: int) -> list[ReservationQueue]:
         """
         Retorna a fila ativa de reservas de um animal,
@@ -91,9 +145,345 @@ class ReservationQueueRepository(BaseRepository):
         queue = [self._to_domain(m) for m in models]
         queue.sort()    # Using __lt__
         return queue
-        
+
+    def list_active_with_parties(self) -> list[tuple[ReservationQueue, Cat | Dog, Adopter]]:
+        """
+        Retorna todas as reservas não canceladas juntamente com o animal e o
+        adotante envolvidos, utilizando uma única consulta com JOIN.
+
+        Cada animal e cada adotante é convertido para entidade de domínio
+        apenas uma vez, mesmo que apareça em várias reservas.
+
+        Returns:
+            list[tuple[ReservationQueue, Cat | Dog, Adopter]]: Lista de tuplas
+            (reserva, animal, adotante) ordenada por animal.
+        """
+        rows = (
+            self.session
+            .query(ReservationQueueModel, AnimalModel, AdopterModel)
+            .join(AnimalModel, ReservationQueueModel.animal_id == AnimalModel.id)
+            .join(AdopterModel, ReservationQueueModel.adopter_id == AdopterModel.id)
+            .filter(ReservationQueueModel.is_canceled == False)
+            .order_by(ReservationQueueModel.animal_id)
+            .all()
+        )
+
+        animals = {}
+        adopters = {}
+        result = []
+
+        for reservation_model, animal_model, adopter_model in rows:
+            if animal_model.id not in animals:
+                animals[animal_model.id] = self.animal_mapper._to_domain(animal_model)
+
+            if adopter_model.id not in adopters:
+                adopters[adopter_model.id] = self.adopter_mapper._to_domain(adopter_model)
+
+            result.append((
+                self._to_domain(reservation_model),
+                animals[animal_model.id],
+                adopters[adopter_model.id]
+            ))
+
+        return result
+
+    def list_expired_bids(self, duration_hours: float) -> list[tuple[int, int, int, float]]:
+        """
+        Retorna as reservas ativas de todas as filas já expiradas.
+
+        Uma fila expira quando sua primeira reserva (inclusive canceladas)
+        ultrapassa a duração informada, mesmo critério de is_queue_expired;
+        as filas expiradas são obtidas de reservation_queue_stats, pelo índice
+        de first_timestamp. Apenas as colunas necessárias são lidas, sem
+        conversão para entidades.
+
+        Args:
+            duration_hours (float): Duração da fila de reservas, em horas.
+
+        Returns:
+            list[tuple[int, int, int, float]]: Tuplas (id da reserva, animal_id,
+            adopter_id, compatibility_rate) ordenadas por animal e, dentro de
+            cada fila, por prioridade (maior compatibilidade, depois a mais antiga).
+        """
+        cutoff = datetime.now() - timedelta(hours=duration_hours)
+
+        expired_animals = (
+            self.session
+            .query(ReservationQueueStatsModel.animal_id)
+            .filter(ReservationQueueStatsModel.first_timestamp <= cutoff)
+        )
+
+        rows = (
+            self.session
+            .query(
+                ReservationQueueModel.id,
+                ReservationQueueModel.animal_id,
+                ReservationQueueModel.adopter_id,
+                ReservationQueueModel.compatibility_rate
+            )
+            .filter(
+                ReservationQueueModel.is_canceled == False,
+                ReservationQueueModel.animal_id.in_(expired_animals)
+            )
+            .order_by(
+                ReservationQueueModel.animal_id,
+                desc(ReservationQueueModel.compatibility_rate),
+                ReservationQueueModel.timestamp
+            )
+            .all()
+        )
+        return [tuple(row) for row in rows]
+
+    def list_queue_starts(self) -> list[tuple[int, datetime]]:
+        """
+        Retorna o início de cada fila de reservas existente.
+
+        O início é o timestamp da primeira reserva do animal (inclusive
+        canceladas), mesmo critério de get_first_reservation, lido de
+        reservation_queue_stats (uma linha por fila, sem agregar as reservas).
+
+        Returns:
+            list[tuple[int, datetime]]: Tuplas (animal_id, timestamp da primeira reserva).
+        """
+        rows = (
+            self.session
+            .query(ReservationQueueStatsModel.animal_id, ReservationQueueStatsModel.first_timestamp)
+            .all()
+        )
+        return [tuple(row) for row in rows]
+
+    def iter_active_with_parties(
+        self, batch_size: int = 1000
+    ) -> Iterator[list[tuple[int, float, Cat | Dog, Adopter]]]:
+        """
+        Percorre todas as reservas não canceladas, em lotes, juntamente com o
+        animal e o adotante envolvidos.
+
+        Os lotes são paginados por (animal_id, adopter_id) (keyset, sobre o
+        índice da restrição de unicidade), de modo que apenas um lote permanece
+        em memória e o chamador pode gravar
+        alterações (e confirmar a transação) entre os lotes. Para cada lote são
+        executadas três consultas: as reservas (apenas as colunas necessárias)
+        e, com get_many, os animais e os adotantes distintos do lote, convertidos
+        para entidades de domínio uma única vez por lote; como as reservas de
+        um animal são consecutivas, cada animal é convertido, em geral, uma
+        única vez em toda a iteração.
+
+        Args:
+            batch_size (int): Quantidade de reservas por lote.
+
+        Yields:
+            list[tuple[int, float, Cat | Dog, Adopter]]: Tuplas (id da reserva,
+            compatibility_rate armazenada, animal, adotante), ordenadas por
+            animal e adotante.
+        """
+        last_key = (0, 0)
+
+        while True:
+            rows = (
+                self.session
+                .query(
+                    ReservationQueueModel.id,
+                    ReservationQueueModel.compatibility_rate,
+                    ReservationQueueModel.animal_id,
+                    ReservationQueueModel.adopter_id
+                )
+                .filter(
+                    ReservationQueueModel.is_canceled == False,
+                    tuple_(ReservationQueueModel.animal_id, ReservationQueueModel.adopter_id)
+                    > tuple_(*last_key)
+                )
+                .order_by(ReservationQueueModel.animal_id, ReservationQueueModel.adopter_id)
+                .limit(batch_size)
+                .all()
+            )
+
+            if not rows:
+                return
+
+            animals = self.animal_mapper.get_many(row.animal_id for row in rows)
+            adopters = self.adopter_mapper.get_many(row.adopter_id for row in rows)
+
+            last_key = (rows[-1].animal_id, rows[-1].adopter_id)
+            yield [
+                (row.id, row.compatibility_rate, animals[row.animal_id], adopters[row.adopter_id])
+                for row in rows
+            ]
+
+    # ---- Create ----
+
+    def enqueue(self, reservation: ReservationQueue) -> tuple[ReservationQueue, bool] | None:
+        """
+        Insere uma reserva e marca o animal como reservado em uma única transação.
+
+        A primeira escrita da transação é um compare-and-swap sobre a versão do
+        animal (AnimalRepository.compare_and_set_status). Ela garante que o
+        status lido ainda é o atual e impede que outra operação sobre a fila
+        do mesmo animal (reserva, cancelamento ou adoção) se intercale com esta.
+        Caso outra transação vença a disputa, a operação é repetida com recuo
+        exponencial.
+
+        Args:
+            reservation (ReservationQueue): Reserva a ser inserida.
+
+        Returns:
+            tuple[ReservationQueue, bool] | None: A reserva persistida (com ID) e
+            se ela abriu a fila do animal; None caso o adotante já tenha uma
+            reserva para o animal.
+
+        Raises:
+            ValueError: Caso o animal não exista.
+            InvalidStatusTransitionError: Caso o animal não esteja disponível
+                nem reservado.
+            ConcurrentUpdateError: Caso a disputa persista após todas as tentativas.
+        """
+        animal_id = reservation.animal_id
+
+        for attempt in range(self.MAX_RETRIES):
+            status_version = self.animal_mapper.get_status_version(animal_id)
+
+            if status_version is None:
+                raise ValueError("Animal não encontrado.")
+
+            status, version = status_version
+
+            if status not in (AnimalStatus.AVAILABLE, AnimalStatus.RESERVED):
+                raise InvalidStatusTransitionError(
+                    f"Transição inválida! {status} -> {AnimalStatus.RESERVED}"
+                )
+
+            try:
+                claimed = self.animal_mapper.compare_and_set_status(
+                    animal_id, version, AnimalStatus.RESERVED, commit=False
+                )
+
+                if claimed:
+                    model = self._to_model(reservation)
+                    self.session.add(model)
+                    self._touch()
+                    self.session.commit()
+
+                    self.animal_mapper._evict(animal_id)
+                    return self._to_domain(model), status == AnimalStatus.AVAILABLE
+
+            except IntegrityError:
+                self.session.rollback()
+                return None
+            except OperationalError:    # Banco bloqueado por outro escritor
+                pass
+
+            self.session.rollback()
+            self._backoff(attempt)
+
+        raise ConcurrentUpdateError(f"Não foi possível reservar o animal {animal_id}.")
+
     # ---- Update ----
 
+    def cancel_and_release(self, id: int) -> tuple[ReservationQueue, bool] | None:
+        """
+        Cancela uma reserva e, se ela era a última ativa, encerra a fila e
+        devolve o animal ao status disponível, tudo em uma única transação.
+
+        Assim como em enqueue, a transação começa com um compare-and-swap sobre
+        a versão do animal, o que impede que uma nova reserva seja inserida
+        entre a verificação da fila vazia e a sua remoção.
+
+        Args:
+            id (int): ID da reserva.
+
+        Returns:
+            tuple[ReservationQueue, bool] | None: A reserva cancelada e se a fila
+            foi encerrada; None caso a reserva não exista.
+
+        Raises:
+            ConcurrentUpdateError: Caso a disputa persista após todas as tentativas.
+        """
+        for attempt in range(self.MAX_RETRIES):
+            model = self.session.get(ReservationQueueModel, id)
+
+            if not model:
+                return None
+
+            animal_id = model.animal_id
+            status, version = self.animal_mapper.get_status_version(animal_id)
+
+            try:
+                if self.animal_mapper.compare_and_set_status(animal_id, version, status, commit=False):
+                    model.is_canceled = True
+                    self.session.flush()
+                    reservation = self._to_domain(model)
+
+                    released = not self.has_active_reservations(animal_id)
+                    removed = [id]
+
+                    if released:
+                        removed = self.__delete_queue(animal_id)
+
+                        if status == AnimalStatus.RESERVED:
+                            self.animal_mapper.compare_and_set_status(
+                                animal_id, version + 1, AnimalStatus.AVAILABLE, commit=False
+                            )
+
+                    self._touch()
+                    self.session.commit()
+
+                    self._evict(*removed)
+                    self.animal_mapper._evict(animal_id)
+                    return reservation, released
+
+            except OperationalError:    # Banco bloqueado por outro escritor
+                pass
+
+            self.session.rollback()
+            self._backoff(attempt)
+
+        raise ConcurrentUpdateError(f"Não foi possível cancelar a reserva {id}.")
+
+
+    def update_compatibility_rates(self, rates: Iterable[tuple[int, float]]) -> int:
+        """
+        Grava novas taxas de compatibilidade em várias reservas.
+
+        Todas as linhas são atualizadas por um único UPDATE executado em modo
+        ``executemany``, seguido de um único commit. Caso o banco esteja
+        bloqueado por outro escritor, a operação é repetida com recuo exponencial.
+
+        Args:
+            rates (Iterable[tuple[int, float]]): Pares (id da reserva, nova taxa).
+
+        Returns:
+            int: Quantidade de reservas informadas.
+
+        Raises:
+            ConcurrentUpdateError: Caso o banco permaneça bloqueado após todas
+                as tentativas.
+        """
+        params = [{"reservation_id": id, "rate": float(rate)} for id, rate in rates]
+
+        if not params:
+            return 0
+
+        table = ReservationQueueModel.__table__
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("reservation_id"))
+            .values(compatibility_rate=bindparam("rate"))
+        )
+
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                self.session.execute(statement, params)
+                self._touch()
+                self.session.commit()
+
+                self._evict(*(param["reservation_id"] for param in params))
+                return len(params)
+            except OperationalError:    # Banco bloqueado por outro escritor
+                self.session.rollback()
+                self._backoff(attempt)
+
+        raise ConcurrentUpdateError("Não foi possível atualizar as taxas de compatibilidade.")
+
     def cancel_reservation(self,id: int) -> bool:
         """
         Altera o status da reserva para cancelado.
@@ -111,8 +501,11 @@ class ReservationQueueRepository(BaseRepository):
             return False
 
         reservation_model.is_canceled = True
+        self._touch()
         self.session.commit()
         self.session.refresh(reservation_model)
+
+        self._evict(id)
         return True
     
     # ---- Delete ----
@@ -127,6 +520,61 @@ class ReservationQueueRepository(BaseRepository):
         Returns:
             None
         """
-        queue = self.session.query(ReservationQueueModel).filter_by(animal_id=animal_id)
-        queue.delete(synchronize_session=False)
-        self.session.commit()
\ No newline at end of file
+        removed = self.__delete_queue(animal_id)
+        self._touch()
+        self.session.commit()
+
+        self._evict(*removed)
+
+    def __delete_queue(self, animal_id: int) -> list[int]:
+        """Remove as reservas do animal na transação corrente e retorna os seus IDs."""
+        return self.session.execute(
+            delete(ReservationQueueModel)
+            .where(ReservationQueueModel.animal_id == animal_id)
+            .returning(ReservationQueueModel.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+
+    # ---- Queue stats ----
+
+    def check_queue_stats(self) -> list[int]:
+        """
+        Compara reservation_queue_stats com as estatísticas recalculadas a
+        partir das reservas, sem alterar nenhuma das tabelas.
+
+        Returns:
+            list[int]: IDs (ordenados) dos animais cuja linha está ausente,
+            sobrando ou divergente.
+        """
+        connection = self.session.connection()
+
+        stored = {
+            row[0]: tuple(row) for row in connection.exec_driver_sql(
+                "SELECT animal_id, active_count, best_compatibility_rate, first_timestamp "
+                "FROM reservation_queue_stats"
+            )
+        }
+        expected = {
+            row[0]: tuple(row) for row in connection.exec_driver_sql(queue_stats_from_scratch_sql())
+        }
+
+        return sorted(
+            animal_id for animal_id in stored.keys() | expected.keys()
+            if stored.get(animal_id) != expected.get(animal_id)
+        )
+
+    def rebuild_queue_stats(self) -> None:
+        """
+        Reconstrói reservation_queue_stats a partir das reservas e confirma a transação.
+        """
+        rebuild_queue_stats(self.session.connection())
+        self.session.commit()
+
+    @staticmethod
+    def __to_stats(model: ReservationQueueStatsModel) -> QueueStats:
+        return QueueStats(
+            animal_id=model.animal_id,
+            active_count=model.active_count,
+            best_compatibility_rate=model.best_compatibility_rate,
+            first_timestamp=model.first_timestamp
+        )
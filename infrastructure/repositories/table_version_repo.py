@@ -0,0 +1,58 @@
+from .base_repo import BaseRepository
+from infrastructure.db_models.table_version_model import TableVersionModel
+from datetime import datetime
+from sqlalchemy import select, bindparam
+
+class TableVersionRepository(BaseRepository):
+    """
+    Leitura dos contadores de alteração mantidos por BaseRepository._touch.
+
+    Cada escrita feita pelos repositórios incrementa, na mesma transação, o
+    contador da tabela alterada. Comparar os contadores das tabelas de que
+    uma página depende é suficiente para saber se ela mudou, inclusive quando
+    a escrita foi feita por outro processo (jobs, agendador de expiração).
+    """
+
+    # Consulta lida a cada requisição das páginas em cache: montada uma única vez
+    __READ = select(
+        TableVersionModel.table_name, TableVersionModel.version, TableVersionModel.updated_at
+    ).where(TableVersionModel.table_name.in_(bindparam("tables", expanding=True)))
+
+    def __init__(self, session):
+        super().__init__(session, TableVersionModel)
+
+    def read(self, tables: tuple[str, ...]) -> tuple[tuple[int, ...], datetime | None]:
+        """
+        Lê, em uma única consulta, os contadores das tabelas informadas.
+
+        Args:
+            tables (tuple[str, ...]): Nomes das tabelas.
+
+        Returns:
+            tuple[tuple[int, ...], datetime | None]: Versões na mesma ordem de
+            ``tables`` (0 para tabelas ainda não alteradas) e a data da
+            alteração mais recente entre elas (None se nenhuma foi alterada).
+        """
+        rows = self.session.execute(self.__READ, {"tables": list(tables)}).all()
+
+        found = {name: (version, updated_at) for name, version, updated_at in rows}
+        versions = tuple(found[name][0] if name in found else 0 for name in tables)
+        last_modified = max((updated_at for _, updated_at in found.values()), default=None)
+
+        return versions, last_modified
+
+    def bump(self, *tables: str) -> None:
+        """
+        Incrementa os contadores das tabelas informadas e confirma a transação.
+
+        Usado quando os dados são alterados fora dos repositórios (ex.: cargas
+        em massa feitas diretamente no banco), para invalidar as páginas em cache.
+
+        Args:
+            *tables (str): Nomes das tabelas alteradas.
+        """
+        if not tables:
+            raise ValueError("Informe ao menos uma tabela.")
+
+        self._touch(*tables)
+        self.session.commit()
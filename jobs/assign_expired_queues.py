@@ -0,0 +1,72 @@
+"""
+Job offline que decide, em lote, o vencedor de todas as filas de reserva
+expiradas, maximizando a compatibilidade total (AssignmentService).
+
+Por padrão apenas exibe a atribuição calculada; com --confirm cada reserva
+vencedora é confirmada como adoção (ReservationService.confirm_adoption).
+
+Uso:
+    python -m jobs.assign_expired_queues [--max-per-adopter N | --unlimited] [--confirm]
+"""
+import argparse
+import time
+
+from infrastructure.database.db_connection import init_db, Session
+from infrastructure.repositories import (
+    AnimalRepository, AdopterRepository, ReservationQueueRepository, AdoptionRepository
+)
+from config import settings
+from services.assignment_service import AssignmentService
+from services.reservation_service import ReservationService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    limit = parser.add_mutually_exclusive_group()
+    limit.add_argument(
+        "--max-per-adopter", type=int, default=settings.max_animals_per_adopter,
+        help="quantidade máxima de animais por adotante (padrão: settings.json)"
+    )
+    limit.add_argument(
+        "--unlimited", action="store_true",
+        help="não limita a quantidade de animais por adotante"
+    )
+    parser.add_argument(
+        "--confirm", action="store_true",
+        help="confirma as adoções das reservas vencedoras"
+    )
+    args = parser.parse_args()
+
+    init_db()
+    session = Session()
+
+    try:
+        reservation_repo = ReservationQueueRepository(session)
+        assignment_service = AssignmentService(reservation_repo=reservation_repo)
+
+        start = time.perf_counter()
+        assignment = assignment_service.assign_expired_queues(
+            max_per_adopter=None if args.unlimited else args.max_per_adopter
+        )
+        elapsed = time.perf_counter() - start
+
+        for animal_id, reservation_id in sorted(assignment.items()):
+            print(f"animal {animal_id} -> reserva {reservation_id}")
+        print(f"{len(assignment)} filas atribuídas em {elapsed * 1000:.1f} ms")
+
+        if args.confirm:
+            reservation_service = ReservationService(
+                reservation_repo=reservation_repo,
+                animal_repo=AnimalRepository(session),
+                adopter_repo=AdopterRepository(session),
+                adoption_repo=AdoptionRepository(session)
+            )
+            for reservation_id in assignment.values():
+                reservation_service.confirm_adoption(reservation_id)
+            print(f"{len(assignment)} adoções confirmadas")
+    finally:
+        Session.remove()
+
+
+if __name__ == "__main__":
+    main()
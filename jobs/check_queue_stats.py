@@ -0,0 +1,59 @@
+"""
+Job offline que confere a tabela reservation_queue_stats (estatísticas das
+filas de reserva mantidas por triggers) com as estatísticas recalculadas a
+partir das reservas.
+
+Por padrão apenas exibe os animais com estatísticas divergentes; com
+--rebuild a tabela é reconstruída do zero a partir da reservation_queue.
+
+Uso:
+    python -m jobs.check_queue_stats [--rebuild] [--show N]
+"""
+import argparse
+import sys
+import time
+
+from infrastructure.database.db_connection import init_db, Session
+from infrastructure.repositories import ReservationQueueRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--rebuild", action="store_true",
+        help="reconstrói a tabela a partir das reservas"
+    )
+    parser.add_argument(
+        "--show", type=int, default=50,
+        help="quantidade máxima de animais divergentes exibidos (padrão: 50)"
+    )
+    args = parser.parse_args()
+
+    init_db()
+    session = Session()
+
+    try:
+        reservation_repo = ReservationQueueRepository(session)
+
+        start = time.perf_counter()
+        divergent = reservation_repo.check_queue_stats()
+        elapsed = time.perf_counter() - start
+
+        for animal_id in divergent[:args.show]:
+            print(f"animal {animal_id}: estatísticas divergentes")
+        if len(divergent) > args.show:
+            print(f"... mais {len(divergent) - args.show} animais")
+        print(f"{len(divergent)} filas divergentes ({elapsed * 1000:.1f} ms)")
+
+        if args.rebuild:
+            start = time.perf_counter()
+            reservation_repo.rebuild_queue_stats()
+            print(f"tabela reconstruída em {(time.perf_counter() - start) * 1000:.1f} ms")
+        elif divergent:
+            sys.exit(1)
+    finally:
+        Session.remove()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Job offline que recalcula a taxa de compatibilidade de todas as reservas
+ativas com os pesos e pontuações vigentes no settings.json (RescoringService).
+
+Por padrão grava as novas taxas; com --dry-run apenas exibe as diferenças
+(taxa armazenada -> taxa recalculada), das maiores para as menores.
+
+Cada lote gravado incrementa o contador de alterações da tabela
+reservation_queue; a aplicação em execução percebe a mudança na próxima
+leitura das filas e reconstrói o seu índice em memória, sem reinício.
+
+Uso:
+    python -m jobs.rescore_queues [--dry-run [--show N]] [--batch-size N]
+"""
+import argparse
+
+from infrastructure.database.db_connection import init_db, Session
+from infrastructure.repositories import ReservationQueueRepository
+from services.rescoring_service import RescoringService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--batch-size", type=int, default=5000,
+        help="reservas lidas e gravadas por lote (padrão: 5000)"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="apenas exibe as diferenças, sem gravar as novas taxas"
+    )
+    parser.add_argument(
+        "--show", type=int, default=50,
+        help="quantidade máxima de diferenças exibidas em --dry-run (padrão: 50)"
+    )
+    args = parser.parse_args()
+
+    init_db()
+    session = Session()
+
+    try:
+        rescoring_service = RescoringService(reservation_repo=ReservationQueueRepository(session))
+        report = rescoring_service.rescore_active_queues(
+            batch_size=args.batch_size, dry_run=args.dry_run
+        )
+
+        if report.dry_run:
+            changes = sorted(report.changes, key=lambda change: abs(change.delta), reverse=True)
+
+            for change in changes[:args.show]:
+                print(
+                    f"reserva {change.reservation_id} (animal {change.animal_id}, "
+                    f"adotante {change.adopter_id}): "
+                    f"{change.old_rate:.2f} -> {change.new_rate:.2f} ({change.delta:+.2f})"
+                )
+            if len(changes) > args.show:
+                print(f"... mais {len(changes) - args.show} diferenças")
+
+        action = "seriam alteradas" if report.dry_run else "alteradas"
+        print(
+            f"{report.scanned} reservas avaliadas em {report.batches} lotes, "
+            f"{report.changed} {action}"
+        )
+        print(
+            f"{report.elapsed * 1000:.1f} ms ({report.rows_per_second:,.0f} reservas/s)"
+        )
+    finally:
+        Session.remove()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,16 @@
+import os
 from flask import Flask
+from config import settings
 from infrastructure.database.db_connection import init_db, Session
 from infrastructure.repositories import *
 from services import *
 
-# -------------------------- DB INIT --------------------------
-init_db()
-session = Session()
+# Importar este módulo apenas monta os repositórios e serviços, sem acessar
+# o banco: a aplicação é criada (e o banco inicializado) por create_app.
+
+# Session é um scoped_session: os repositórios delegam cada operação
+# para a sessão da thread que atende a requisição atual.
+session = Session
 
 # -------------------------- REPOSITORIES --------------------------
 animal_repo = AnimalRepository(session)
@@ -14,6 +19,7 @@ reservation_repo = ReservationQueueRepository(session)
 adoption_repo = AdoptionRepository(session)
 adoption_return_repo = AdoptionReturnRepository(session)
 event_repo = EventRepository(session)
+table_version_repo = TableVersionRepository(session)
 
 # -------------------------- SERVICES --------------------------
 animal_service = AnimalService(
@@ -27,7 +33,8 @@ reservation_service = ReservationService(
     animal_repo=animal_repo,
     adopter_repo=adopter_repo,
     reservation_repo=reservation_repo,
-    adoption_repo=adoption_repo
+    adoption_repo=adoption_repo,
+    table_version_repo=table_version_repo
 )
 adoption_service = AdoptionService(
     animal_repo=animal_repo,
@@ -46,15 +53,86 @@ contract_service = AdoptionContractService(
     animal_repo=animal_repo,
     adopter_repo=adopter_repo
 )
+recommendation_service = RecommendationService(
+    animal_repo=animal_repo,
+    adopter_repo=adopter_repo,
+    table_version_repo=table_version_repo
+)
 
 # -------------------------- APP --------------------------
-app = Flask(
-    __name__,
-    template_folder="app/templates",
-    static_folder="app/static"
-)
+def refresh_settings():
+    """
+    Aplica alterações do settings.json sem reiniciar a aplicação (o arquivo
+    é verificado no máximo uma vez a cada Settings.CHECK_INTERVAL segundos).
+    """
+    settings.refresh()
+
+def remove_session(exception=None):
+    """Fecha a sessão da requisição e devolve a conexão ao pool."""
+    Session.remove()
+
+def create_app(engine=None, start_scheduler: bool = True) -> Flask:
+    """
+    Cria a aplicação Flask: inicializa o banco, ativa o cache de entidades,
+    carrega o índice das filas de reserva e registra as rotas.
+
+    Args:
+        engine (Engine | None): Engine do banco utilizado pelas sessões das
+            requisições. None utiliza o banco configurado em db_connection.
+        start_scheduler (bool): Inicia o agendador que encerra as filas de
+            reserva no prazo, em uma thread em segundo plano.
+
+    Returns:
+        Flask: A aplicação criada.
+    """
+    if engine is not None:
+        Session.remove()
+        Session.configure(bind=engine)
+
+    init_db(engine)
+
+    # Cache de entidades (get_by_id / get_many), compartilhado por todas as
+    # instâncias de cada repositório e atualizado pelas escritas deles.
+    if settings.entity_cache["enabled"]:
+        for repository_class in (
+            AnimalRepository,
+            AdopterRepository,
+            ReservationQueueRepository,
+            AdoptionRepository
+        ):
+            repository_class.cache = EntityCache(
+                max_size=settings.entity_cache["max_size"],
+                ttl=settings.entity_cache["ttl_seconds"]
+            )
+
+    # Índice em memória das filas de reserva (primeiro da fila, tamanho e prazo),
+    # reconstruído quando outro processo altera as filas
+    reservation_service.load_queue_index()
+
+    # Encerra as filas de reserva no prazo, em segundo plano (as adoções
+    # continuam confirmadas manualmente ou pelo job assign_expired_queues);
+    # a thread do agendador usa a própria sessão, liberada ao fim de cada lote.
+    if start_scheduler:
+        reservation_service.start_expiry_scheduler(after_batch=Session.remove)
+
+    app = Flask(
+        __name__,
+        template_folder="app/templates",
+        static_folder="app/static"
+    )
+    app.before_request(refresh_settings)
+    app.teardown_appcontext(remove_session)
+
+    from app.routes import register_routes
+    from app.api import api
+
+    register_routes(app)
+    app.register_blueprint(api)
 
-from app.routes import *
+    return app
 
 if __name__ == "__main__":
-    app.run(debug=True)
\ No newline at end of file
+    # Com debug=True, o reloader executa este bloco também no processo que
+    # apenas observa os arquivos; o agendador é iniciado somente no processo
+    # que atende as requisições.
+    create_app(start_scheduler=os.environ.get("WERKZEUG_RUN_MAIN") == "true").run(debug=True)
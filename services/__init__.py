@@ -4,6 +4,9 @@ from .adopter_service import AdopterService
 from .reservation_service import ReservationService
 from .adoption_service import AdoptionService
 from .adoption_contract_service import AdoptionContractService
+from .recommendation_service import RecommendationService
+from .assignment_service import AssignmentService
+from .rescoring_service import RescoringService
 
 __all__ = [
     "TimelineService",
@@ -12,4 +15,7 @@ __all__ = [
     "ReservationService",
     "AdoptionService",
     "AdoptionContractService",
+    "RecommendationService",
+    "AssignmentService",
+    "RescoringService",
 ]
\ No newline at end of file
@@ -1,5 +1,7 @@
-from domain.people.adopter import Adopter, minimum_age
+import copy
+from domain.people.adopter import Adopter
 from domain.enums.adopter_enums import HousingType
+from config import settings
 
 class AdopterService:
 
@@ -8,17 +10,23 @@ class AdopterService:
     def __init__(self, adopter_repo):
         self.adopter_repo = adopter_repo
 
-    def list_adopters(self):
-        return self.adopter_repo.list_all()
+    def list_adopters(self, after_id: int = None, limit: int = None) -> dict:
+        adopters, next_after = self.adopter_repo.list_page(after_id=after_id, limit=limit)
+
+        return {
+            "items": adopters,
+            "next_after": next_after
+        }
 
     def register_adopter(self, form_data):
         age = int(form_data["age"])
+        minimum_age = settings.minimum_adopter_age
 
         if age < minimum_age:
             raise ValueError(
                 f"""
                 Você não cumpre as políticas para cadastro de adotantes.
-                A idade mínima para adotantes é {self.minimum_age}.
+                A idade mínima para adotantes é {minimum_age}.
                 """
             )
 
@@ -50,6 +58,9 @@ class AdopterService:
         if not adopter:
             raise ValueError("Adotante não encontrado")
 
+        # A entidade pode vir do cache do repositório: altera-se uma cópia
+        adopter = copy.copy(adopter)
+
         # Converter enums
         if "housing_type" in kwargs:
             kwargs["housing_type"] = HousingType(kwargs["housing_type"].upper())
@@ -1,8 +1,5 @@
-import json
 from domain.animals.animal import Animal
-
-with open("settings.json", "r", encoding="utf-8") as f:
-    settings = json.load(f)
+from config import settings, SettingsSnapshot
 
 
 class AdoptionFeeService:
@@ -12,9 +9,29 @@ class AdoptionFeeService:
     O cálculo é baseado em configurações externas (settings.json),
     considerando valor base, idade do animal, condições especiais
     e limites mínimos e máximos.
+
+    Como a taxa depende apenas da faixa etária do animal, a taxa final de
+    cada faixa é pré-calculada e reconstruída automaticamente quando o
+    settings.json é recarregado (Settings.on_change).
     """
     def __init__(self):
-        self.settings = settings["policies"]["adoption_fee"]
+        self.load_settings(settings.current)
+        settings.on_change(self.load_settings)
+
+    def load_settings(self, snapshot: SettingsSnapshot) -> None:
+        """
+        Aplica a política de taxa da configuração informada, pré-calculando
+        a taxa final de cada faixa etária.
+
+        Args:
+            snapshot (SettingsSnapshot): Configuração a ser aplicada.
+        """
+        self.settings = snapshot.adoption_fee
+
+        self.fees = {
+            age_group: self.__apply_limits(self.settings["base_fee"] + adjustment)
+            for age_group, adjustment in self.settings["age_adjustments"].items()
+        }
 
     def calculate_fee(self, animal: Animal) -> float:
         """
@@ -26,16 +43,7 @@ class AdoptionFeeService:
         Returns:
             float: Valor final da taxa de adoção.
         """
-        fee = self.settings["base_fee"]
-        fee += self.__age_adjustment(animal)
-        fee = self.__apply_limits(fee)
-
-        return fee
-
-    def __age_adjustment(self, animal: Animal) -> float:
-        """Aplica ajuste de taxa conforme a idade do animal."""
-        age_group = animal.age_group()
-        return self.settings["age_adjustments"][age_group]
+        return self.fees[animal.age_group()]
 
     def __apply_limits(self, fee: float) -> float:
         """Garante que a taxa esteja dentro dos limites configurados."""
@@ -16,18 +16,14 @@ class AdoptionService:
         self.adopter_repo = adopter_repo
 
     def list_adoptions(self):
-        adoptions = self.adoption_repo.list_all()
+        rows = self.adoption_repo.list_with_parties()
 
         active_adoptions = []
         returned_adoptions = []
 
-        for adoption in adoptions:
-            animal = self.animal_repo.get_by_id(id=adoption.animal_id)
-            adopter = self.adopter_repo.get_by_id(id=adoption.adopter_id)
+        for adoption, animal, adopter, return_timestamp in rows:
 
-            has_returned = self.adoption_return_repo.has_returned_adoption(adoption.id)
-
-            if not has_returned:
+            if return_timestamp is None:
                 active_adoptions.append({
                     "id": adoption.id,
                     "timestamp": adoption.timestamp,
@@ -39,9 +35,7 @@ class AdoptionService:
                 returned_adoptions.append({
                     "id": adoption.id,
                     "adoption_timestamp": adoption.timestamp,
-                    "return_timestamp": self.adoption_return_repo.get_timestamp(
-                        adoption_id=adoption.id
-                    ),
+                    "return_timestamp": return_timestamp,
                     "fee": adoption.fee,
                     "animal": animal,
                     "adopter": adopter,
@@ -1,3 +1,4 @@
+import copy
 from datetime import datetime
 from domain.animals.cat import Cat
 from domain.animals.dog import Dog
@@ -13,8 +14,45 @@ class AnimalService:
         self.animal_repo = animal_repo
         self.event_repo = event_repo
 
-    def list_animals(self) -> list[Cat | Dog]:
-        return self.animal_repo.list_all()
+    def list_animals(self, after_id: int = None, limit: int = None) -> dict:
+        animals, next_after = self.animal_repo.list_page(after_id=after_id, limit=limit)
+
+        return {
+            "items": animals,
+            "next_after": next_after
+        }
+
+    def search_facets(self) -> tuple[str, ...]:
+        return tuple(self.animal_repo.FACETS)
+
+    def search_animals(
+        self,
+        text: str = None,
+        filters: dict[str, list[str]] = None,
+        after_id: int = None,
+        limit: int = None
+    ) -> dict:
+        """
+        Busca animais por texto e facetas (AnimalRepository.search) e calcula
+        as contagens de cada faceta para os mesmos critérios.
+
+        Raises:
+            ValueError: Caso alguma faceta ou valor não exista.
+        """
+        filters = {facet: values for facet, values in (filters or {}).items() if values}
+
+        animals, next_after = self.animal_repo.search(
+            text=text, filters=filters, after_id=after_id, limit=limit
+        )
+        total, facets, approximate = self.animal_repo.facet_counts(text=text, filters=filters)
+
+        return {
+            "items": animals,
+            "next_after": next_after,
+            "total": total,
+            "facets": facets,
+            "approximate": approximate
+        }
 
     def get_animal(self, animal_id) -> Cat | Dog:
         return self.animal_repo.get_by_id(id=animal_id)
@@ -117,6 +155,9 @@ class AnimalService:
         if not animal_model:
             raise ValueError("Animal não encontrado")
 
+        # A entidade pode vir do cache do repositório: altera-se uma cópia
+        animal_model = copy.copy(animal_model)
+
         if "gender" in kwargs:
             kwargs["gender"] = Gender(kwargs["gender"].upper())  
         
@@ -0,0 +1,157 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import min_weight_full_bipartite_matching
+from config import settings
+
+# Valor padrão de max_per_adopter: utiliza max_animals_per_adopter do
+# settings.json vigente no momento da chamada
+POLICY_LIMIT = object()
+
+class AssignmentService:
+    """
+    Serviço responsável por decidir, em lote, o vencedor de todas as filas
+    de reserva expiradas.
+
+    Ao contrário de ReservationService.finalize_queue, que escolhe o primeiro
+    da fila de cada animal isoladamente, este serviço resolve uma atribuição
+    global que maximiza a soma das taxas de compatibilidade armazenadas nas
+    reservas, respeitando o limite de animais por adotante.
+
+    O problema é reduzido a um emparelhamento bipartido completo de custo
+    mínimo (algoritmo LAPJVsp do SciPy) sobre a matriz esparsa de lances:
+        - cada animal é uma linha;
+        - cada adotante ocupa uma coluna por vaga disponível;
+        - cada animal possui uma coluna fictícia exclusiva, que representa
+          "sem vencedor" e garante que todo animal seja emparelhado.
+
+    Attributes:
+        RATE_STEP (float): Menor diferença entre duas taxas de compatibilidade
+            (CompatibilityService arredonda as taxas em duas casas decimais).
+    """
+
+    RATE_STEP = 0.01
+
+    def __init__(self, reservation_repo):
+        self.reservation_repo = reservation_repo
+
+    def assign_expired_queues(self, max_per_adopter: int | None = POLICY_LIMIT) -> dict[int, int]:
+        """
+        Calcula os vencedores de todas as filas de reserva expiradas.
+
+        Nenhuma alteração é gravada: as reservas escolhidas devem ser
+        confirmadas com ReservationService.confirm_adoption. Animais cujos
+        candidatos foram atribuídos a outras filas ficam sem vencedor.
+
+        Args:
+            max_per_adopter (int | None): Quantidade máxima de animais por
+                adotante; None remove o limite. Por padrão, utiliza o limite
+                do settings.json.
+
+        Returns:
+            dict[int, int]: Mapeamento animal_id -> id da reserva vencedora.
+        """
+        bids = self.reservation_repo.list_expired_bids(settings.reservation_duration_hours)
+
+        if not bids:
+            return {}
+
+        reservation_ids, animal_ids, adopter_ids, rates = (np.array(column) for column in zip(*bids))
+        winners = self.solve(animal_ids, adopter_ids, rates, max_per_adopter)
+
+        return {
+            int(animal_ids[i]): int(reservation_ids[i])
+            for i in winners
+        }
+
+    def solve(
+        self,
+        animal_ids: np.ndarray,
+        adopter_ids: np.ndarray,
+        rates: np.ndarray,
+        max_per_adopter: int | None = POLICY_LIMIT
+    ) -> np.ndarray:
+        """
+        Resolve a atribuição de compatibilidade total máxima para um
+        conjunto de lances (animal, adotante, taxa).
+
+        Args:
+            animal_ids (np.ndarray): Animal de cada lance.
+            adopter_ids (np.ndarray): Adotante de cada lance.
+            rates (np.ndarray): Taxa de compatibilidade de cada lance (0 a 100,
+                em múltiplos de RATE_STEP).
+            max_per_adopter (int | None): Quantidade máxima de animais por
+                adotante; None remove o limite. Por padrão, utiliza o limite
+                do settings.json.
+
+        Returns:
+            np.ndarray: Índices dos lances vencedores (no máximo um por animal).
+
+        Raises:
+            ValueError: Caso max_per_adopter seja menor que 1.
+        """
+        if max_per_adopter is POLICY_LIMIT:
+            max_per_adopter = settings.max_animals_per_adopter
+
+        if max_per_adopter is not None and max_per_adopter < 1:
+            raise ValueError("max_per_adopter deve ser maior ou igual a 1.")
+
+        if len(animal_ids) == 0:
+            return np.empty(0, dtype=np.intp)
+
+        animals, rows = np.unique(animal_ids, return_inverse=True)
+        adopters, adopter_index = np.unique(adopter_ids, return_inverse=True)
+        n_animals = len(animals)
+
+        # Sem limite (ou limite inalcançável) as filas não competem entre si
+        if max_per_adopter is None or max_per_adopter >= n_animals:
+            return self.__best_per_animal(rows, rates)
+
+        # Remove lances repetidos para o mesmo par, mantendo o de maior taxa
+        order = np.lexsort((-rates, adopter_index, rows))
+        pair = rows[order] * len(adopters) + adopter_index[order]
+        keep = np.ones(len(order), dtype=bool)
+        keep[1:] = pair[1:] != pair[:-1]
+        bids = order[keep]
+
+        # Custo estritamente positivo: entradas nulas são ausência de aresta
+        offset = rates.max() + 1
+        n_slots = len(adopters) * max_per_adopter
+
+        slot = np.arange(max_per_adopter)
+        bid_rows = np.repeat(rows[bids], max_per_adopter)
+        bid_cols = (adopter_index[bids][:, None] * max_per_adopter + slot).ravel()
+        bid_costs = np.repeat(offset - rates[bids], max_per_adopter)
+
+        # A vaga fictícia equivale a um lance de taxa 0, acrescido de um desempate
+        # que, somado em todos os animais, fica abaixo de RATE_STEP: entre
+        # atribuições de mesma compatibilidade total, prefere a com mais
+        # vencedores, sem nunca trocar compatibilidade por quantidade
+        dummy = np.arange(n_animals)
+        dummy_cost = offset + self.RATE_STEP / (n_animals + 1)
+
+        graph = csr_matrix(
+            (
+                np.concatenate([bid_costs, np.full(n_animals, dummy_cost)]),
+                (np.concatenate([bid_rows, dummy]), np.concatenate([bid_cols, n_slots + dummy]))
+            ),
+            shape=(n_animals, n_slots + n_animals)
+        )
+
+        matched_rows, matched_cols = min_weight_full_bipartite_matching(graph)
+
+        # Traduz (animal, vaga do adotante) de volta para o índice do lance;
+        # os pares de bids já estão em ordem crescente
+        real = matched_cols < n_slots
+        matched_pairs = matched_rows[real] * len(adopters) + matched_cols[real] // max_per_adopter
+        winners = bids[np.searchsorted(pair[keep], matched_pairs)]
+
+        return np.sort(winners)
+
+    # -------------------------- HELPERS --------------------------
+
+    def __best_per_animal(self, rows: np.ndarray, rates: np.ndarray) -> np.ndarray:
+        """Retorna, para cada animal, o primeiro lance de maior taxa."""
+        order = np.lexsort((np.arange(len(rows)), -rates, rows))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = rows[order][1:] != rows[order][:-1]
+        return np.sort(order[first])
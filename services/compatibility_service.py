@@ -1,16 +1,102 @@
+from dataclasses import dataclass
+from itertools import product
+import numpy as np
 from domain.animals.cat import Cat
 from domain.animals.dog import Dog
 from domain.people.adopter import Adopter
-import json
+from domain.enums.animal_enums import Size
+from domain.enums.adopter_enums import HousingType
+from config import settings, SettingsSnapshot
+
+PET_AGE_GROUPS = ("young_pet", "adult_pet", "senior_pet")
+ADOPTER_AGE_GROUPS = ("young", "adult", "senior")
+
+# ---------------- FEATURE PROFILES ----------------
+# Representam apenas as características discretas usadas no cálculo da
+# compatibilidade, expondo a mesma interface de Animal/Adopter consumida
+# pelos métodos de pontuação.
+
+@dataclass(frozen=True)
+class _AnimalProfile:
+    size: Size
+    pet_age_group: str
+    is_wary: bool
+
+    def age_group(self) -> str:
+        return self.pet_age_group
+
+    def has_wary_temperament(self) -> bool:
+        return self.is_wary
+
+
+@dataclass(frozen=True)
+class _AdopterProfile:
+    usable_area: float
+    housing_type: HousingType
+    has_pet_experience: bool
+    has_children_at_home: bool
+    adopter_age_group: str
+    has_other_animals: bool
+
+    def age_group(self) -> str:
+        return self.adopter_age_group
 
-with open("settings.json", "r", encoding="utf-8") as f:
-    settings = json.load(f)
 
 class CompatibilityService:
+    """
+    Serviço responsável por calcular o índice de compatibilidade entre
+    animais e adotantes.
+
+    A pontuação depende apenas de um pequeno conjunto de características
+    discretas (porte, faixa etária e temperamento do animal; faixa de área
+    útil, moradia, experiência, crianças, faixa etária e outros animais do
+    adotante). Por isso, na construção do serviço todas as combinações são
+    pré-calculadas em uma tabela densa (NumPy) indexada por um código do
+    animal e um código do adotante, e cada cálculo passa a ser uma consulta
+    à tabela.
+
+    A tabela é reconstruída automaticamente quando o settings.json é
+    recarregado (Settings.on_change).
+    """
 
     def __init__(self):
-        self.weights = settings["compatibility"]["weights"]
-        self.scores = settings["compatibility"]["scores"]
+        self.size_index = {size: i for i, size in enumerate(Size)}
+        self.pet_age_index = {group: i for i, group in enumerate(PET_AGE_GROUPS)}
+        self.housing_index = {housing: i for i, housing in enumerate(HousingType)}
+        self.adopter_age_index = {group: i for i, group in enumerate(ADOPTER_AGE_GROUPS)}
+
+        self.load_settings(settings.current)
+        settings.on_change(self.load_settings)
+
+    def load_settings(self, snapshot: SettingsSnapshot) -> None:
+        """
+        Aplica os pesos, as pontuações e as áreas mínimas da configuração
+        informada e reconstrói a tabela de compatibilidade.
+
+        A nova tabela é construída por completo antes de substituir a anterior,
+        de modo que consultas concorrentes nunca veem uma tabela parcial.
+
+        Args:
+            snapshot (SettingsSnapshot): Configuração a ser aplicada.
+        """
+        self.weights = snapshot.compatibility_weights
+        self.scores = snapshot.compatibility_scores
+        self.minimum_area = snapshot.minimum_area
+
+        # Faixas de área: quantidade de áreas mínimas atendidas pelo adotante
+        area_thresholds = np.array(snapshot.area_thresholds, dtype=float)
+        table = self.__build_table(area_thresholds)
+
+        # Faixas e tabela são substituídas juntas, em uma única atribuição
+        self.__tables = (area_thresholds, table)
+
+    @property
+    def area_thresholds(self) -> np.ndarray:
+        return self.__tables[0]
+
+    @property
+    def table(self) -> np.ndarray:
+        return self.__tables[1]
 
     def calculate_rate(self, animal: Cat | Dog, adopter: Adopter) -> float:
         """
@@ -21,7 +107,8 @@ class CompatibilityService:
         Cada critério gera uma pontuação parcial (0 a 100), multiplicada pelo
         peso correspondente.
 
-        O valor final é limitado ao intervalo de 0 a 100.
+        O valor final é limitado ao intervalo de 0 a 100 e é obtido da tabela
+        pré-calculada na construção do serviço.
 
         Args:
             animal (Cat | Dog): Animal candidato à adoção.
@@ -30,6 +117,200 @@ class CompatibilityService:
         Returns:
             float: Pontuação final de compatibilidade no intervalo de 0 a 100.
         """
+        area_thresholds, table = self.__tables
+
+        return float(table[self.__animal_code(animal), self.__adopter_code(adopter, area_thresholds)])
+
+    def calculate_rates(self, animals: list[Cat | Dog], adopters: list[Adopter]) -> np.ndarray:
+        """
+        Calcula a matriz de compatibilidade entre vários animais e adotantes.
+
+        Cada animal e cada adotante é codificado uma única vez; a matriz é
+        obtida por indexação vetorizada da tabela pré-calculada, sem laços
+        sobre os pares.
+
+        Args:
+            animals (list[Cat | Dog]): Animais candidatos (N).
+            adopters (list[Adopter]): Adotantes interessados (M).
+
+        Returns:
+            np.ndarray: Matriz N×M em que a posição [i, j] contém a
+            compatibilidade entre ``animals[i]`` e ``adopters[j]``.
+        """
+        area_thresholds, table = self.__tables
+
+        animal_codes = self.encode_animals(animals)
+        adopter_codes = self.__encode_adopters(adopters, area_thresholds)
+
+        return table[animal_codes[:, None], adopter_codes[None, :]]
+
+    def calculate_rates_by_code(self, animal_codes: np.ndarray, adopter: Adopter) -> np.ndarray:
+        """
+        Calcula a compatibilidade de um adotante com animais já codificados
+        (encode_animals), sem percorrer os animais novamente.
+
+        Args:
+            animal_codes (np.ndarray): Códigos dos animais (N).
+            adopter (Adopter): Adotante interessado.
+
+        Returns:
+            np.ndarray: Vetor com N taxas de compatibilidade.
+        """
+        area_thresholds, table = self.__tables
+
+        return table[animal_codes, self.__encode_adopters([adopter], area_thresholds)[0]]
+
+    def calculate_pair_rates(self, animals: list[Cat | Dog], adopters: list[Adopter]) -> np.ndarray:
+        """
+        Calcula a compatibilidade de cada par (``animals[i]``, ``adopters[i]``).
+
+        Animais e adotantes repetidos (o mesmo objeto em vários pares) são
+        codificados uma única vez; os pares são obtidos por indexação
+        vetorizada da tabela pré-calculada.
+
+        Args:
+            animals (list[Cat | Dog]): Animal de cada par (N).
+            adopters (list[Adopter]): Adotante de cada par (N).
+
+        Returns:
+            np.ndarray: Vetor com N taxas de compatibilidade.
+
+        Raises:
+            ValueError: Caso as listas tenham tamanhos diferentes.
+        """
+        if len(animals) != len(adopters):
+            raise ValueError("As listas de animais e adotantes devem ter o mesmo tamanho.")
+
+        area_thresholds, table = self.__tables
+
+        unique_animals, animal_positions = self.__deduplicate(animals)
+        unique_adopters, adopter_positions = self.__deduplicate(adopters)
+
+        animal_codes = self.encode_animals(unique_animals)[animal_positions]
+        adopter_codes = self.__encode_adopters(unique_adopters, area_thresholds)[adopter_positions]
+
+        return table[animal_codes, adopter_codes]
+
+    # ---------------- FEATURE ENCODING ----------------
+
+    @staticmethod
+    def __deduplicate(items: list) -> tuple[list, np.ndarray]:
+        """Objetos distintos (por identidade) e a posição de cada item entre eles."""
+        positions = {}
+        unique = []
+        index = np.empty(len(items), dtype=np.intp)
+
+        for i, item in enumerate(items):
+            position = positions.get(id(item))
+
+            if position is None:
+                position = positions[id(item)] = len(unique)
+                unique.append(item)
+
+            index[i] = position
+
+        return unique, index
+
+    def encode_animals(self, animals: list[Cat | Dog]) -> np.ndarray:
+        """Retorna o código (linha da tabela) de cada animal."""
+        return np.fromiter(
+            (self.__animal_code(animal) for animal in animals),
+            dtype=np.intp, count=len(animals)
+        )
+
+    def encode_animal_features(self, features: list[tuple[Size, str, tuple[str, ...]]]) -> np.ndarray:
+        """
+        Retorna o código (linha da tabela) de cada animal a partir apenas das
+        suas características (porte, faixa etária, temperamento), sem
+        entidades de domínio. Cada combinação distinta é codificada uma vez.
+        """
+        wary_temperaments = settings.wary_temperaments
+        codes = {}
+
+        def code(feature) -> int:
+            found = codes.get(feature)
+
+            if found is None:
+                size, age_group, temperament = feature
+                found = codes[feature] = self.__animal_code(_AnimalProfile(
+                    size, age_group, not wary_temperaments.isdisjoint(temperament)
+                ))
+            return found
+
+        return np.fromiter((code(feature) for feature in features), dtype=np.intp, count=len(features))
+
+    def encode_adopters(self, adopters: list[Adopter]) -> np.ndarray:
+        """Retorna o código (coluna da tabela) de cada adotante."""
+        return self.__encode_adopters(adopters, self.area_thresholds)
+
+    def __encode_adopters(self, adopters: list[Adopter], area_thresholds: np.ndarray) -> np.ndarray:
+        if not adopters:
+            return np.empty(0, dtype=np.intp)
+
+        areas = np.fromiter((a.usable_area for a in adopters), dtype=float, count=len(adopters))
+        area_classes = np.searchsorted(area_thresholds, areas, side="right")
+
+        others = np.fromiter(
+            (self.__adopter_code(adopter, area_class=0) for adopter in adopters),
+            dtype=np.intp, count=len(adopters)
+        )
+        return area_classes * self.__adopter_stride() + others
+
+    def __animal_code(self, animal) -> int:
+        size = self.size_index[animal.size]
+        pet_age = self.pet_age_index[animal.age_group()]
+        wary = int(animal.has_wary_temperament())
+
+        return (size * len(PET_AGE_GROUPS) + pet_age) * 2 + wary
+
+    def __adopter_code(self, adopter, area_thresholds: np.ndarray = None, area_class: int = None) -> int:
+        if area_class is None:
+            area_class = int(np.searchsorted(area_thresholds, adopter.usable_area, side="right"))
+
+        code = self.housing_index[adopter.housing_type]
+        code = code * 2 + int(adopter.has_pet_experience)
+        code = code * 2 + int(adopter.has_children_at_home)
+        code = code * len(ADOPTER_AGE_GROUPS) + self.adopter_age_index[adopter.age_group()]
+        code = code * 2 + int(adopter.has_other_animals)
+
+        return area_class * self.__adopter_stride() + code
+
+    def __adopter_stride(self) -> int:
+        """Quantidade de códigos de adotante por faixa de área."""
+        return len(HousingType) * 2 * 2 * len(ADOPTER_AGE_GROUPS) * 2
+
+    # ---------------- LOOKUP TABLE ----------------
+
+    def __build_table(self, area_thresholds: np.ndarray) -> np.ndarray:
+        """
+        Pré-calcula a compatibilidade de todas as combinações de perfis de
+        animal e de adotante, utilizando os mesmos métodos de pontuação.
+        """
+        # Área representativa de cada faixa (0 = abaixo de todas as áreas mínimas)
+        area_values = [float("-inf"), *area_thresholds.tolist()]
+
+        animal_profiles = [
+            _AnimalProfile(size, pet_age, is_wary)
+            for size, pet_age, is_wary in product(Size, PET_AGE_GROUPS, (False, True))
+        ]
+        adopter_profiles = [
+            _AdopterProfile(area, housing, experience, children, age_group, others)
+            for area, housing, experience, children, age_group, others in product(
+                area_values, HousingType, (False, True), (False, True),
+                ADOPTER_AGE_GROUPS, (False, True)
+            )
+        ]
+
+        table = np.empty((len(animal_profiles), len(adopter_profiles)), dtype=float)
+
+        for i, animal in enumerate(animal_profiles):
+            for j, adopter in enumerate(adopter_profiles):
+                table[i, j] = self.__score(animal, adopter)
+
+        return table
+
+    def __score(self, animal, adopter) -> float:
+        """Soma ponderada dos critérios de compatibilidade, limitada a 100."""
         total_score = 0.0
 
         total_score += self.__score_size_vs_area(animal, adopter)
@@ -54,7 +335,7 @@ class CompatibilityService:
         weight = self.weights["size_vs_area"]
         size_key = animal.size.name
 
-        min_area = settings["policies"]["minimum_area"][size_key]
+        min_area = self.minimum_area[size_key]
 
         if adopter.usable_area >= min_area:
             base_score = self.scores["size_vs_area"][size_key]["above_min"]
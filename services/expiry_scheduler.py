@@ -0,0 +1,119 @@
+import heapq
+import logging
+import threading
+from datetime import datetime
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+class ExpiryScheduler:
+    """
+    Agendador em segundo plano que dispara uma ação quando prazos vencem.
+
+    Os prazos são mantidos em um min-heap de tuplas (prazo, chave). Uma única
+    thread dorme até o prazo mais próximo e, ao acordar, retira do heap todas
+    as chaves vencidas e as entrega de uma só vez à ação configurada.
+    Agendar um prazo anterior ao atual topo do heap acorda a thread para
+    recalcular o tempo de espera.
+
+    Entradas obsoletas não são removidas do heap: a ação deve ser idempotente
+    e revalidar cada chave recebida.
+
+    Attributes:
+        on_expired (Callable[[list[int]], None]): Ação executada com as chaves
+            vencidas, em ordem crescente.
+    """
+
+    def __init__(self, on_expired: Callable[[list[int]], None]):
+        self.on_expired = on_expired
+        self.__heap = []
+        self.__condition = threading.Condition()
+        self.__thread = None
+        self.__stopped = False
+
+    def schedule(self, key: int, deadline: datetime) -> None:
+        """
+        Agenda a chave para o prazo informado.
+
+        Args:
+            key (int): Chave entregue à ação quando o prazo vencer.
+            deadline (datetime): Momento em que a chave expira.
+        """
+        with self.__condition:
+            heapq.heappush(self.__heap, (deadline, key))
+
+            if self.__heap[0] == (deadline, key):
+                self.__condition.notify()
+
+    def next_deadline(self) -> datetime | None:
+        """Retorna o prazo mais próximo agendado, ou None se não houver."""
+        with self.__condition:
+            return self.__heap[0][0] if self.__heap else None
+
+    def start(self) -> None:
+        """Inicia a thread do agendador (daemon)."""
+        with self.__condition:
+            if self.__thread is not None:
+                return
+
+            self.__stopped = False
+            self.__thread = threading.Thread(
+                target=self.__run,
+                name="expiry-scheduler",
+                daemon=True
+            )
+            self.__thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Encerra a thread do agendador, aguardando o fim do lote em andamento.
+
+        Args:
+            timeout (float | None): Tempo máximo de espera, em segundos.
+        """
+        with self.__condition:
+            self.__stopped = True
+            self.__condition.notify()
+            thread, self.__thread = self.__thread, None
+
+        if thread is not None:
+            thread.join(timeout)
+
+    # -------------------------- HELPERS --------------------------
+
+    def __run(self) -> None:
+        while True:
+            due = self.__wait_for_due()
+
+            if due is None:
+                return
+
+            try:
+                self.on_expired(due)
+            except Exception:
+                logger.exception("Falha ao processar prazos vencidos: %s", due)
+
+    def __wait_for_due(self) -> list[int] | None:
+        """Dorme até o próximo prazo e retorna as chaves vencidas (None ao parar)."""
+        with self.__condition:
+            while not self.__stopped:
+                if not self.__heap:
+                    self.__condition.wait()
+                    continue
+
+                delay = (self.__heap[0][0] - datetime.now()).total_seconds()
+                if delay <= 0:
+                    break
+
+                self.__condition.wait(timeout=delay)
+
+            if self.__stopped:
+                return None
+
+            now = datetime.now()
+            due = set()
+
+            while self.__heap and self.__heap[0][0] <= now:
+                due.add(heapq.heappop(self.__heap)[1])
+
+            return sorted(due)
@@ -0,0 +1,139 @@
+import numpy as np
+from config import settings
+from .compatibility_service import CompatibilityService
+
+class RecommendationService:
+    """
+    Serviço responsável por recomendar os pares animal/adotante mais
+    compatíveis entre si.
+
+    As pontuações são calculadas em lote (CompatibilityService.calculate_rates)
+    e os K melhores candidatos são obtidos por seleção parcial (partition),
+    sem ordenar todos os candidatos.
+
+    Os animais candidatos são codificados a partir apenas das características
+    usadas na compatibilidade (AnimalRepository.list_reservable_features), e
+    somente os K recomendados são convertidos em entidades (get_many). Com
+    um TableVersionRepository, os identificadores e os códigos dos animais
+    reserváveis ficam em memória até que o contador de alterações da tabela
+    animals (ou a configuração) mude, de modo que cada recomendação para um
+    adotante custa uma leitura do contador e uma indexação vetorizada.
+    """
+
+    DEFAULT_K = 5
+    MAX_K = 50
+
+    def __init__(self, animal_repo, adopter_repo, table_version_repo=None):
+        self.animal_repo = animal_repo
+        self.adopter_repo = adopter_repo
+        self.table_version_repo = table_version_repo
+        self.compatibility_service = CompatibilityService()
+        self.__candidates = None    # (versão, configuração, ids, códigos)
+
+    def top_animals_for(self, adopter_id: int, k: int = None) -> list[dict]:
+        """
+        Retorna os animais reserváveis mais compatíveis com um adotante.
+
+        Args:
+            adopter_id (int): Identificador do adotante.
+            k (int): Quantidade de recomendações (limitada a MAX_K).
+
+        Returns:
+            list[dict]: Recomendações em ordem decrescente de compatibilidade,
+            cada uma com as chaves "animal" e "compatibility_rate".
+
+        Raises:
+            ValueError: Caso o adotante não exista.
+        """
+        adopter = self.adopter_repo.get_by_id(adopter_id)
+        if not adopter:
+            raise ValueError("Adotante não encontrado")
+
+        ids, codes = self.__reservable_animals()
+        scores = self.compatibility_service.calculate_rates_by_code(codes, adopter)
+        top = self.__top_k(scores, k)
+
+        # Animais removidos desde a codificação são ignorados
+        animals = self.animal_repo.get_many(ids[top].tolist())
+
+        return [
+            {"animal": animals[ids[i]], "compatibility_rate": float(scores[i])}
+            for i in top if ids[i] in animals
+        ]
+
+    def top_adopters_for(self, animal_id: int, k: int = None) -> list[dict]:
+        """
+        Retorna os adotantes mais compatíveis com um animal.
+
+        Args:
+            animal_id (int): Identificador do animal.
+            k (int): Quantidade de recomendações (limitada a MAX_K).
+
+        Returns:
+            list[dict]: Recomendações em ordem decrescente de compatibilidade,
+            cada uma com as chaves "adopter" e "compatibility_rate".
+
+        Raises:
+            ValueError: Caso o animal não exista.
+        """
+        animal = self.animal_repo.get_by_id(animal_id)
+        if not animal:
+            raise ValueError("Animal não encontrado")
+
+        adopters = self.adopter_repo.list_all()
+        scores = self.compatibility_service.calculate_rates([animal], adopters)[0]
+
+        return [
+            {"adopter": adopters[i], "compatibility_rate": float(scores[i])}
+            for i in self.__top_k(scores, k)
+        ]
+
+    # -------------------------- HELPERS --------------------------
+
+    def __reservable_animals(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Retorna os identificadores e os códigos dos animais reserváveis,
+        reutilizando os da última chamada enquanto a tabela animals e a
+        configuração não mudarem.
+        """
+        if self.table_version_repo is None:
+            return self.__encode_reservable()
+
+        # O contador é lido antes dos animais: uma escrita concorrente faz, no
+        # máximo, a próxima chamada recarregar dados que já estavam atualizados
+        (version,), _ = self.table_version_repo.read(("animals",))
+        snapshot = settings.current
+        cached = self.__candidates
+
+        if cached is None or cached[0] != version or cached[1] is not snapshot:
+            cached = (version, snapshot, *self.__encode_reservable())
+            self.__candidates = cached
+
+        return cached[2], cached[3]
+
+    def __encode_reservable(self) -> tuple[np.ndarray, np.ndarray]:
+        features = self.animal_repo.list_reservable_features()
+
+        ids = np.fromiter((row[0] for row in features), dtype=np.int64, count=len(features))
+        codes = self.compatibility_service.encode_animal_features([row[1:] for row in features])
+        return ids, codes
+
+    def __top_k(self, scores: np.ndarray, k: int = None) -> np.ndarray:
+        """
+        Retorna os índices das K maiores pontuações, em ordem decrescente.
+        Empates são resolvidos pela ordem original dos candidatos, inclusive
+        na fronteira da K-ésima posição.
+        """
+        k = self.DEFAULT_K if k is None else max(1, min(k, self.MAX_K))
+
+        if k < len(scores):
+            # K-ésima maior pontuação: entram todas as maiores e, entre as
+            # iguais a ela, as primeiras na ordem original
+            kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+            above = np.flatnonzero(scores > kth)
+            tied = np.flatnonzero(scores == kth)[:k - len(above)]
+            candidates = np.concatenate((above, tied))
+        else:
+            candidates = np.arange(len(scores))
+
+        return candidates[np.lexsort((candidates, -scores[candidates]))]
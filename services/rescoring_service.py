@@ -0,0 +1,118 @@
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .compatibility_service import CompatibilityService
+
+@dataclass(slots=True)
+class RateChange:
+    """Alteração da taxa de compatibilidade de uma reserva."""
+    reservation_id: int
+    animal_id: int
+    adopter_id: int
+    old_rate: float
+    new_rate: float
+
+    @property
+    def delta(self) -> float:
+        return self.new_rate - self.old_rate
+
+
+@dataclass(slots=True)
+class RescoreReport:
+    """
+    Resultado de um recálculo das taxas de compatibilidade.
+
+    Attributes:
+        scanned (int): Reservas ativas avaliadas.
+        changed (int): Reservas cuja taxa foi (ou seria, em dry_run) alterada.
+        batches (int): Lotes processados.
+        elapsed (float): Duração total, em segundos.
+        dry_run (bool): Se as novas taxas deixaram de ser gravadas.
+        changes (list[RateChange]): Alterações encontradas (apenas em dry_run).
+    """
+    scanned: int = 0
+    changed: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+    dry_run: bool = False
+    changes: list[RateChange] = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.scanned / self.elapsed if self.elapsed else 0.0
+
+
+class RescoringService:
+    """
+    Serviço responsável por recalcular a taxa de compatibilidade de todas as
+    reservas ativas.
+
+    A taxa é calculada uma única vez, na criação da reserva, e define a
+    prioridade na fila. Quando os pesos ou as pontuações de compatibilidade
+    do settings.json mudam, as filas abertas mantêm as prioridades antigas
+    até serem recalculadas por este serviço.
+
+    As reservas são lidas em lotes (ReservationQueueRepository.iter_active_with_parties),
+    as novas taxas de cada lote são obtidas por indexação vetorizada da tabela
+    de compatibilidade (CompatibilityService.calculate_pair_rates) e somente
+    as taxas alteradas são gravadas, com um único UPDATE por lote.
+    """
+
+    def __init__(self, reservation_repo, compatibility_service: CompatibilityService | None = None):
+        self.reservation_repo = reservation_repo
+        self.compatibility_service = compatibility_service or CompatibilityService()
+
+    def rescore_active_queues(self, batch_size: int = 5000, dry_run: bool = False) -> RescoreReport:
+        """
+        Recalcula e grava a taxa de compatibilidade de todas as reservas ativas.
+
+        Cada lote é confirmado separadamente; uma interrupção no meio da
+        execução mantém os lotes já gravados, e uma nova execução conclui os
+        demais (reservas já atualizadas não são regravadas).
+
+        Args:
+            batch_size (int): Quantidade de reservas lidas e gravadas por vez.
+            dry_run (bool): Apenas calcula as alterações, sem gravá-las. As
+                alterações ficam disponíveis em ``RescoreReport.changes``.
+
+        Returns:
+            RescoreReport: Quantidades processadas, duração e, em dry_run,
+            as alterações encontradas.
+
+        Raises:
+            ValueError: Caso batch_size não seja positivo.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size deve ser maior que zero.")
+
+        report = RescoreReport(dry_run=dry_run)
+        start = time.perf_counter()
+
+        for batch in self.reservation_repo.iter_active_with_parties(batch_size):
+            reservation_ids, old_rates, animals, adopters = zip(*batch)
+
+            old_rates = np.array(old_rates, dtype=float)
+            new_rates = self.compatibility_service.calculate_pair_rates(animals, adopters)
+            changed = np.flatnonzero(new_rates != old_rates)
+
+            report.scanned += len(batch)
+            report.changed += len(changed)
+            report.batches += 1
+
+            if dry_run:
+                report.changes.extend(
+                    RateChange(
+                        reservation_ids[i], animals[i].id, adopters[i].id,
+                        float(old_rates[i]), float(new_rates[i])
+                    )
+                    for i in changed
+                )
+            elif len(changed):
+                self.reservation_repo.update_compatibility_rates(
+                    (reservation_ids[i], new_rates[i]) for i in changed
+                )
+
+        report.elapsed = time.perf_counter() - start
+        return report
@@ -0,0 +1,127 @@
+import heapq
+import threading
+from datetime import datetime
+from typing import Iterable
+
+from domain.adoptions.reservation_queue import ReservationQueue
+
+class _Queue:
+    """Estado em memória da fila de reservas de um animal."""
+
+    __slots__ = ("heap", "active", "started_at")
+
+    def __init__(self, started_at: datetime):
+        self.heap = []          # (-compatibility_rate, timestamp, id, reserva)
+        self.active = set()     # IDs das reservas ativas; as demais entradas do heap são obsoletas
+        self.started_at = started_at
+
+class ReservationQueueIndex:
+    """
+    Índice em memória das filas de reserva, com um heap de prioridade por animal.
+
+    Cada fila é um min-heap de tuplas (-compatibility_rate, timestamp, id,
+    reserva), a mesma ordem de ReservationQueue.__lt__. Cancelamentos são
+    registrados por remoção preguiçosa: o ID deixa o conjunto de reservas
+    ativas e a entrada só sai do heap quando chega ao topo. Assim, a leitura do
+    primeiro da fila, do tamanho e do início da fila é O(1) (amortizado).
+
+    O índice é mantido pelo ReservationService a cada escrita e reconstruído
+    a partir do banco na inicialização. Ele pertence ao processo: escritas
+    feitas por outros processos só são vistas após uma nova reconstrução, que
+    o ReservationService faz quando o contador de alterações da tabela
+    reservation_queue muda.
+    """
+
+    def __init__(self):
+        self.__queues = {}
+        self.__lock = threading.Lock()
+
+    def rebuild(self, reservations: Iterable[ReservationQueue]) -> None:
+        """
+        Reconstrói o índice a partir de todas as reservas persistidas.
+
+        Reservas canceladas não entram no heap, mas contam para o início
+        da fila, mesmo critério de ReservationQueueRepository.get_first_reservation.
+
+        Args:
+            reservations (Iterable[ReservationQueue]): Todas as reservas existentes.
+        """
+        queues = {}
+
+        for reservation in reservations:
+            queue = queues.get(reservation.animal_id)
+
+            if queue is None:
+                queue = queues[reservation.animal_id] = _Queue(reservation.timestamp)
+            elif reservation.timestamp < queue.started_at:
+                queue.started_at = reservation.timestamp
+
+            if not reservation.is_canceled:
+                queue.heap.append(self.__entry(reservation))
+                queue.active.add(reservation.id)
+
+        for queue in queues.values():
+            heapq.heapify(queue.heap)
+
+        with self.__lock:
+            self.__queues = queues
+
+    # ---- Write ----
+
+    def push(self, reservation: ReservationQueue) -> None:
+        """Adiciona uma reserva ativa (já persistida) à fila do seu animal."""
+        with self.__lock:
+            queue = self.__queues.get(reservation.animal_id)
+
+            if queue is None:
+                queue = self.__queues[reservation.animal_id] = _Queue(reservation.timestamp)
+            elif reservation.timestamp < queue.started_at:
+                queue.started_at = reservation.timestamp
+
+            heapq.heappush(queue.heap, self.__entry(reservation))
+            queue.active.add(reservation.id)
+
+    def discard(self, reservation: ReservationQueue) -> None:
+        """Marca uma reserva como cancelada (remoção preguiçosa)."""
+        with self.__lock:
+            queue = self.__queues.get(reservation.animal_id)
+
+            if queue is not None:
+                queue.active.discard(reservation.id)
+
+    def clear(self, animal_id: int) -> None:
+        """Remove toda a fila de um animal."""
+        with self.__lock:
+            self.__queues.pop(animal_id, None)
+
+    # ---- Read ----
+
+    def head(self, animal_id: int) -> ReservationQueue | None:
+        """Retorna a reserva de maior prioridade da fila, ou None se não houver."""
+        with self.__lock:
+            queue = self.__queues.get(animal_id)
+
+            if queue is None:
+                return None
+
+            while queue.heap and queue.heap[0][2] not in queue.active:
+                heapq.heappop(queue.heap)
+
+            return queue.heap[0][3] if queue.heap else None
+
+    def size(self, animal_id: int) -> int:
+        """Retorna a quantidade de reservas ativas da fila."""
+        with self.__lock:
+            queue = self.__queues.get(animal_id)
+            return len(queue.active) if queue else 0
+
+    def started_at(self, animal_id: int) -> datetime | None:
+        """Retorna o timestamp da primeira reserva da fila, ou None se não houver fila."""
+        with self.__lock:
+            queue = self.__queues.get(animal_id)
+            return queue.started_at if queue else None
+
+    # -------------------------- HELPERS --------------------------
+
+    def __entry(self, reservation: ReservationQueue) -> tuple:
+        return (-reservation.compatibility_rate, reservation.timestamp, reservation.id, reservation)
@@ -3,14 +3,14 @@ from domain.adoptions.adoption import Adoption
 from domain.enums.animal_status import AnimalStatus
 from .compatibility_service import CompatibilityService
 from .adoption_fee_service import AdoptionFeeService
-from datetime import datetime, timedelta
-from collections import defaultdict
-import json
-
-with open("settings.json", "r", encoding="utf-8") as f:
-    settings = json.load(f)
-
-queue_duration = settings["policies"]["reservation_duration_hours"]
+from .expiry_scheduler import ExpiryScheduler
+from .reservation_queue_index import ReservationQueueIndex
+from domain.exceptions import InvalidStatusTransitionError
+from config import settings, SettingsSnapshot
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable
+import threading
 
 class ReservationService:
 
@@ -19,51 +19,70 @@ class ReservationService:
         reservation_repo,
         animal_repo,
         adopter_repo,
-        adoption_repo
+        adoption_repo,
+        table_version_repo=None
     ):
         self.reservation_repo = reservation_repo
         self.animal_repo = animal_repo
         self.adopter_repo = adopter_repo
         self.adoption_repo = adoption_repo
+        self.table_version_repo = table_version_repo
+        self.compatibility_service = CompatibilityService()
+        self.fee_service = AdoptionFeeService()
+        self.expiry_scheduler = None
+        self.queue_index = None
+        self.__index_lock = threading.Lock()
+        self.__index_version = None     # versão de reservation_queue refletida pelo índice
+        self.__index_applied = False
+        self.__scheduled_duration = None
+
+        settings.on_change(self.__on_settings_change)
 
     def list_reservations(self):
         """
         Retorna as reservas agrupadas por animal e separadas
         entre filas concluídas e em andamento.
         """
-        reservations = self.reservation_repo.list_all()
+        rows = self.reservation_repo.list_active_with_parties()
         now = datetime.now()
+        queue_duration = settings.reservation_duration
+
+        grouped = {}
 
-        grouped = defaultdict(list)
+        # Agrupa reservas ativas por animal em uma única passagem
+        for r, animal, adopter in rows:
+            group = grouped.get(r.animal_id)
 
-        # Agrupa reservas ativas por animal
-        for r in reservations:
-            if not r.is_canceled:
-                grouped[r.animal_id].append(r)
+            if group is None:
+                group = grouped[r.animal_id] = {
+                    "animal": animal,
+                    "first_timestamp": r.timestamp,
+                    "entries": []
+                }
+            elif r.timestamp < group["first_timestamp"]:
+                group["first_timestamp"] = r.timestamp
+
+            group["entries"].append((r, adopter))
 
         finished = {}
         ongoing = {}
 
-        for animal_id, queue in grouped.items():
-            
-            first = min(queue, key=lambda r: r.timestamp)
-            queue_end = first.timestamp + timedelta(hours=queue_duration)
-
-            animal = self.animal_repo.get_by_id(id=animal_id)
+        for animal_id, group in grouped.items():
 
-            reservations_data = []
-            for r in sorted(queue):
-                adopter = self.adopter_repo.get_by_id(id=r.adopter_id)
+            queue_end = group["first_timestamp"] + queue_duration
 
-                reservations_data.append({
+            reservations_data = [
+                {
                     "id": r.id,
                     "timestamp": r.timestamp,
                     "compatibility_rate": r.compatibility_rate,
                     "adopter": adopter
-                })
+                }
+                for r, adopter in sorted(group["entries"], key=lambda e: e[0])    # Using __lt__
+            ]
 
             queue_data = {
-                "animal": animal,
+                "animal": group["animal"],
                 "queue_ending": queue_end,
                 "reservations": reservations_data
             }
@@ -105,49 +124,76 @@ class ReservationService:
         animal = self.animal_repo.get_by_id(animal_id)
         adopter = self.adopter_repo.get_by_id(adopter_id)
 
-        compatibility = CompatibilityService().calculate_rate(animal, adopter)
-
-        had_active_reservations = self.reservation_repo.has_active_reservations(animal_id)
+        compatibility = self.compatibility_service.calculate_rate(animal, adopter)
 
         reservation = ReservationQueue(
             animal_id=animal_id,
             adopter_id=adopter_id,
-            compatibility_rate=compatibility
+            compatibility_rate=compatibility,
+            timestamp=datetime.now()
         )
-        was_saved = self.reservation_repo.save(reservation)
-        if not was_saved:
-            raise ValueError("Reserva já existente.")
 
-        if not had_active_reservations:
-            self.animal_repo.update_status(
-                id=animal_id,
-                new_status=AnimalStatus.RESERVED
+        # A inserção e a transição para RESERVED ocorrem na mesma transação,
+        # protegida por compare-and-swap sobre a versão do animal
+        with self.__index_guard():
+            try:
+                result = self.reservation_repo.enqueue(reservation)
+            except InvalidStatusTransitionError:
+                raise ValueError("Animal indisponível para reserva.")
+
+            if result is None:
+                raise ValueError("Reserva já existente.")
+
+            saved, opened_queue = result
+            index = self.__index_written()
+
+            if index is not None:
+                index.push(saved)
+
+        # A reserva abre uma nova fila: agenda o seu encerramento
+        if opened_queue and self.expiry_scheduler is not None:
+            self.expiry_scheduler.schedule(
+                animal_id,
+                saved.timestamp + settings.reservation_duration
             )
 
-    def get_queue_ending_time(self, animal_id: int) -> datetime:
-        first_reservation = self.reservation_repo.get_first_reservation(animal_id)
-        queue_ending = first_reservation.timestamp + timedelta(hours=queue_duration)
-        return queue_ending
+    def get_queue_ending_time(self, animal_id: int) -> datetime | None:
+        """Retorna o prazo da fila de reservas do animal, ou None se não houver fila."""
+        index = self.__fresh_index()
+
+        if index is not None:
+            started_at = index.started_at(animal_id)
+            return started_at + settings.reservation_duration if started_at is not None else None
+
+        stats = self.reservation_repo.get_queue_stats(animal_id)
+        return stats.deadline if stats is not None else None
 
     def cancel_reservation(self, reservation_id: int):
-        self.reservation_repo.cancel_reservation(reservation_id)
+        # Cancela e, se era a última reserva ativa, encerra a fila e devolve
+        # o animal para AVAILABLE, tudo na mesma transação
+        with self.__index_guard():
+            result = self.reservation_repo.cancel_and_release(reservation_id)
 
-        reservation = self.reservation_repo.get_by_id(reservation_id)
-        animal_id = reservation.animal_id
+            if result is None:
+                return
 
-        if self.reservation_repo.all_canceled(animal_id):
-            self.reservation_repo.clear_queue(animal_id)
+            reservation, released = result
+            index = self.__index_written()
 
-            self.animal_repo.update_status(
-                id=animal_id,
-                new_status=AnimalStatus.AVAILABLE
-            )
+            if index is not None:
+                index.discard(reservation)
+
+                if released:
+                    index.clear(reservation.animal_id)
     
     def finalize_queue(self, animal_id: int):
 
+        if self.queue_index is not None:
+            return self.__finalize_indexed_queue(animal_id)
+
         if not self.reservation_repo.is_queue_expired(
             animal_id,
-            queue_duration
+            settings.reservation_duration_hours
         ):
             return None
 
@@ -162,6 +208,103 @@ class ReservationService:
 
         selected = queue[0] 
         return selected
+
+    def finalize_queues(self, animal_ids: list[int]) -> dict[int, ReservationQueue]:
+        """
+        Encerra, em lote, as filas expiradas dos animais informados.
+
+        Filas ainda em andamento ou inexistentes são ignoradas, de modo que
+        a chamada pode ser repetida sem efeitos colaterais.
+
+        Args:
+            animal_ids (list[int]): IDs dos animais cujas filas devem ser verificadas.
+
+        Returns:
+            dict[int, ReservationQueue]: Reserva selecionada de cada fila
+            encerrada que ainda possui reservas ativas.
+        """
+        selected = {}
+
+        for animal_id in animal_ids:
+            reservation = self.finalize_queue(animal_id)
+
+            if reservation is not None:
+                selected[animal_id] = reservation
+
+        return selected
+
+    def start_expiry_scheduler(self, after_batch: Callable[[], None] | None = None) -> ExpiryScheduler:
+        """
+        Inicia o agendador que encerra as filas assim que expiram.
+
+        Os prazos das filas existentes (primeira reserva + duração da fila)
+        são carregados do banco; filas abertas depois disso são agendadas
+        por create_reservation. Se a duração das filas mudar no settings.json,
+        os prazos de todas as filas abertas são agendados novamente.
+
+        Filas expiradas sem reservas ativas devolvem o animal para AVAILABLE;
+        as demais permanecem entre as concluídas de list_reservations,
+        aguardando a confirmação manual (confirm_adoption) ou a atribuição em
+        lote (AssignmentService, job assign_expired_queues).
+
+        Args:
+            after_batch (Callable[[], None] | None): Função chamada ao fim de
+                cada lote, por exemplo para liberar a sessão da thread do agendador.
+
+        Returns:
+            ExpiryScheduler: O agendador em execução.
+        """
+        if self.expiry_scheduler is not None:
+            return self.expiry_scheduler
+
+        def on_expired(animal_ids: list[int]) -> None:
+            try:
+                self.finalize_queues(animal_ids)
+            finally:
+                if after_batch is not None:
+                    after_batch()
+
+        scheduler = ExpiryScheduler(on_expired=on_expired)
+        self.__schedule_open_queues(scheduler, settings.reservation_duration)
+
+        scheduler.start()
+        self.expiry_scheduler = scheduler
+        return scheduler
+
+    def stop_expiry_scheduler(self) -> None:
+        """Encerra o agendador de expiração de filas, se estiver em execução."""
+        if self.expiry_scheduler is not None:
+            self.expiry_scheduler.stop()
+            self.expiry_scheduler = None
+
+    def load_queue_index(self) -> ReservationQueueIndex:
+        """
+        Constrói (ou reconstrói) o índice em memória das filas de reserva.
+
+        A partir daí, create_reservation, cancel_reservation e confirm_adoption
+        mantêm o índice atualizado, e as leituras do primeiro da fila, do
+        tamanho e do prazo da fila deixam de consultar o banco.
+
+        Com um TableVersionRepository, cada leitura do índice confere antes o
+        contador de alterações da tabela reservation_queue (uma consulta por
+        chave primária): escritas feitas por outros processos (outros workers,
+        jobs como rescore_queues) fazem o índice ser reconstruído. Sem ele, o
+        índice só enxerga as escritas deste processo, e a aplicação deve rodar
+        com um único processo.
+
+        Returns:
+            ReservationQueueIndex: O índice carregado.
+        """
+        # A versão é lida antes das reservas: uma escrita concorrente faz, no
+        # máximo, a próxima leitura reconstruir um índice já atualizado
+        version = self.__queue_version()
+
+        index = ReservationQueueIndex()
+        index.rebuild(self.reservation_repo.iter_all())
+
+        self.queue_index = index
+        self.__index_version = version
+        return index
     
     def confirm_adoption(self, reservation_id: int):
 
@@ -170,15 +313,22 @@ class ReservationService:
         animal_id = reservation.animal_id
         adopter_id = reservation.adopter_id
 
-        self.reservation_repo.clear_queue(animal_id)
+        # A mudança para ADOPTED vem antes da limpeza da fila: a partir dela,
+        # nenhuma nova reserva concorrente consegue entrar na fila do animal
+        with self.__index_guard():
+            self.animal_repo.update_status(
+                id=animal_id,
+                new_status=AnimalStatus.ADOPTED
+            )
 
-        animal = self.animal_repo.get_by_id(id=animal_id)
-        fee = AdoptionFeeService().calculate_fee(animal)
+            self.reservation_repo.clear_queue(animal_id)
+            index = self.__index_written()
 
-        self.animal_repo.update_status(
-            id=animal_id,
-            new_status=AnimalStatus.ADOPTED
-        )
+            if index is not None:
+                index.clear(animal_id)
+
+        animal = self.animal_repo.get_by_id(id=animal_id)
+        fee = self.fee_service.calculate_fee(animal)
 
         adoption = Adoption(
             animal_id=animal_id,
@@ -186,4 +336,97 @@ class ReservationService:
             fee=fee
         )
 
-        self.adoption_repo.save(adoption)
\ No newline at end of file
+        self.adoption_repo.save(adoption)
+
+    # -------------------------- HELPERS --------------------------
+
+    def __schedule_open_queues(self, scheduler: ExpiryScheduler, duration) -> None:
+        """Agenda o prazo de todas as filas existentes para a duração informada."""
+        self.__scheduled_duration = duration
+
+        for animal_id, first_timestamp in self.reservation_repo.list_queue_starts():
+            scheduler.schedule(animal_id, first_timestamp + duration)
+
+    def __on_settings_change(self, snapshot: SettingsSnapshot) -> None:
+        """Reagenda as filas abertas quando a duração das filas é alterada."""
+        scheduler = self.expiry_scheduler
+
+        if scheduler is not None and snapshot.reservation_duration != self.__scheduled_duration:
+            # Prazos antigos permanecem no heap e são revalidados por finalize_queue
+            self.__schedule_open_queues(scheduler, snapshot.reservation_duration)
+
+    @contextmanager
+    def __index_guard(self):
+        """
+        Serializa, dentro do processo, as escritas nas filas enquanto o índice
+        em memória estiver carregado, para que ele reflita as transações na
+        mesma ordem em que foram confirmadas no banco.
+
+        Com um TableVersionRepository, compara o contador de reservation_queue
+        antes e depois da escrita: o índice continua atualizado apenas se a
+        única alteração foi a desta escrita (aplicada por __index_written);
+        caso contrário, é reconstruído na próxima leitura.
+        """
+        if self.queue_index is None:
+            yield
+            return
+
+        with self.__index_lock:
+            before = self.__queue_version()
+            self.__index_applied = False
+
+            try:
+                yield
+            finally:
+                after = self.__queue_version()
+                expected = before + self.__index_applied if before is not None else None
+
+                if after != expected or self.__index_version != before:
+                    self.__index_version = None
+                else:
+                    self.__index_version = after
+
+    def __index_written(self) -> ReservationQueueIndex | None:
+        """Registra que a escrita corrente foi confirmada e retorna o índice a atualizar."""
+        self.__index_applied = True
+        return self.queue_index
+
+    def __queue_version(self) -> int | None:
+        """Contador de alterações da tabela reservation_queue (None sem TableVersionRepository)."""
+        if self.table_version_repo is None:
+            return None
+
+        (version,), _ = self.table_version_repo.read(("reservation_queue",))
+        return version
+
+    def __fresh_index(self) -> ReservationQueueIndex | None:
+        """
+        Retorna o índice em memória, reconstruindo-o antes se as filas foram
+        alteradas fora dele (por outro processo).
+        """
+        if self.queue_index is None or self.table_version_repo is None:
+            return self.queue_index
+
+        with self.__index_lock:
+            if self.__queue_version() != self.__index_version:
+                self.load_queue_index()
+
+        return self.queue_index
+
+    def __finalize_indexed_queue(self, animal_id: int) -> ReservationQueue | None:
+        """finalize_queue a partir do índice em memória, sem consultar as reservas."""
+        index = self.__fresh_index()
+        started_at = index.started_at(animal_id)
+
+        if started_at is None or datetime.now() < started_at + settings.reservation_duration:
+            return None
+
+        selected = index.head(animal_id)
+
+        if selected is None:
+            self.animal_repo.update_status(
+                id=animal_id,
+                new_status=AnimalStatus.AVAILABLE
+            )
+
+        return selected
@@ -1,3 +1,4 @@
+import heapq
 from domain.events.animal_events import Event, AdoptionEvent, ReturnEvent
 
 class TimelineService:
@@ -26,45 +27,37 @@ class TimelineService:
         Returns:
             list[Event]: Lista de eventos ordenados por timestamp.
         """
-        timeline = list()
-
-        # Vaccine / Training / Quarentine
+        # Vaccine / Training / Quarentine (já ordenados pelo banco)
         generic_events = self.event_repo.list_by(animal_id=animal_id)
-        timeline.extend(generic_events)
 
-        # Adoptions
-        adoptions = self.adoption_repo.list_by_animal(animal_id)
+        adoption_events = []
+        return_events = []
 
-        for adoption in adoptions:
+        # Adoptions / Adoption Returns
+        # Um animal só pode ser adotado novamente após ser devolvido, logo as
+        # devoluções seguem a mesma ordem cronológica das adoções.
+        history = self.adoption_repo.list_history_by_animal(animal_id)
 
-            adopter = self.adopter_repo.get_by_id(adoption.adopter_id)
+        for adoption, adopter, adoption_return in history:
 
-            adoption_event = AdoptionEvent(
+            adoption_events.append(AdoptionEvent(
                 id=adoption.id,
                 animal_id=adoption.animal_id,
                 adopter=adopter,
                 fee=adoption.fee,
                 timestamp=adoption.timestamp
-            )
-            timeline.append(adoption_event)
-
-            # Adoption Returns
-            ret_timestamp = self.adoption_return_repo.get_timestamp(
-                adoption_id=adoption.id
-            )
-            ret_reason = self.adoption_return_repo.get_return_reason(
-                adoption_id=adoption.id
-            )
+            ))
 
-            if ret_timestamp:
-                return_event = ReturnEvent(
+            if adoption_return is not None:
+                return_events.append(ReturnEvent(
                     id=adoption.id,
                     animal_id=animal_id,
                     adoption_id=adoption.id,
-                    reason=ret_reason,
-                    timestamp=ret_timestamp
-                )
-                timeline.append(return_event)
-        timeline.sort()     # Using __lt__
+                    reason=adoption_return.reason,
+                    timestamp=adoption_return.timestamp
+                ))
+
+        # K-way merge das três fontes já ordenadas (Using __lt__)
+        timeline = list(heapq.merge(generic_events, adoption_events, return_events))
 
-        return timeline
\ No newline at end of file
+        return timeline
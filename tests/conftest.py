@@ -0,0 +1,141 @@
+import pytest
+from dataclasses import replace
+from datetime import datetime
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure.database.db_connection import Base
+from infrastructure.db_models import (
+    adopter_model,
+    animal_model,
+    adoption_model,
+    reservation_queue_model,
+    adoption_return_model,
+    event_model,
+    table_version_model,
+    animal_search_model,
+    reservation_queue_stats_model
+)
+
+# ---------------------------------------------------------
+# FIXTURES (BANCO SQLITE EM MEMÓRIA)
+# ---------------------------------------------------------
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+@pytest.fixture
+def db_session(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def statements(engine):
+    """Registra todas as instruções SQL executadas no engine."""
+    executed = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield executed
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+# ---------------------------------------------------------
+# CONFIGURAÇÃO
+# ---------------------------------------------------------
+@pytest.fixture
+def override_settings(monkeypatch):
+    """Substitui campos da configuração vigente durante o teste."""
+    from config import settings
+
+    def apply(**changes):
+        monkeypatch.setattr(settings, "current", replace(settings.current, **changes))
+
+    return apply
+
+# ---------------------------------------------------------
+# FÁBRICAS DE ENTIDADES
+# ---------------------------------------------------------
+@pytest.fixture
+def make_dog():
+    from domain.animals.dog import Dog
+    from domain.enums.animal_enums import Species, Gender, Size
+    from domain.enums.animal_status import AnimalStatus
+
+    def factory(name: str = "Rex", **overrides) -> Dog:
+        args = dict(
+            species=Species.DOG,
+            breed="Vira-lata",
+            name=name,
+            gender=Gender.MALE,
+            age_months=12,
+            size=Size.MEDIUM,
+            temperament=["Calmo"],
+            status=AnimalStatus.AVAILABLE,
+            needs_walk=True,
+            timestamp=datetime.now()
+        )
+        args.update(overrides)
+        return Dog(**args)
+
+    return factory
+
+
+@pytest.fixture
+def make_adopter():
+    from domain.people.adopter import Adopter, HousingType
+
+    def factory(name: str = "Alice", age: int = 30, **overrides) -> Adopter:
+        args = dict(
+            name=name,
+            age=age,
+            housing_type=HousingType.HOUSE,
+            usable_area=60,
+            has_pet_experience=True,
+            has_children_at_home=False,
+            has_other_animals=False,
+            timestamp=datetime.now()
+        )
+        args.update(overrides)
+        return Adopter(**args)
+
+    return factory
+
+# ---------------------------------------------------------
+# APLICAÇÃO FLASK
+# ---------------------------------------------------------
+@pytest.fixture
+def client(engine):
+    """
+    Cliente de teste da aplicação criada sobre o banco em memória, sem o
+    agendador de expiração e com caches (entidades e páginas) vazios.
+    """
+    from main import create_app
+    from app.http_cache import page_cache
+    from infrastructure.database.db_connection import Session
+    from infrastructure.repositories import (
+        AnimalRepository, AdopterRepository, ReservationQueueRepository, AdoptionRepository
+    )
+
+    original_bind = Session.session_factory.kw["bind"]
+    app = create_app(engine=engine, start_scheduler=False)
+    page_cache.clear()
+
+    yield app.test_client()
+
+    Session.remove()
+    Session.configure(bind=original_bind)
+
+    # create_app ativa o cache de entidades nas classes dos repositórios;
+    # fora deste fixture, os demais testes os usam sem cache
+    for repository_class in (
+        AnimalRepository, AdopterRepository, ReservationQueueRepository, AdoptionRepository
+    ):
+        if "cache" in vars(repository_class):
+            del repository_class.cache
@@ -9,11 +9,8 @@ from domain.exceptions import PolicyNotMetError
 # MOCK GLOBAL DE POLÍTICA
 # ---------------------------------------------------------
 @pytest.fixture(autouse=True)
-def mock_minimum_age(monkeypatch):
-    monkeypatch.setattr(
-        "domain.people.adopter.minimum_age",
-        18
-    )
+def mock_minimum_age(override_settings):
+    override_settings(minimum_adopter_age=18)
 
 
 # ---------------------------------------------------------
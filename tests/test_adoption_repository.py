@@ -0,0 +1,69 @@
+import pytest
+from datetime import datetime, timedelta
+
+from infrastructure.repositories import (
+    AnimalRepository, AdopterRepository, AdoptionRepository, AdoptionReturnRepository
+)
+from domain.adoptions.adoption import Adoption
+from domain.adoptions.adoption_return import AdoptionReturn
+from domain.enums.animal_status import AnimalStatus
+
+# ---------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------
+def populate(session, make_dog, make_adopter, n_adoptions: int, returned_ids: set[int] = frozenset()):
+    animal_repo = AnimalRepository(session)
+    adopter_repo = AdopterRepository(session)
+    adoption_repo = AdoptionRepository(session)
+    return_repo = AdoptionReturnRepository(session)
+    now = datetime.now()
+
+    adopter_repo.save(make_adopter())
+
+    for i in range(1, n_adoptions + 1):
+        animal_repo.save(make_dog(name=f"Rex {i}", status=AnimalStatus.ADOPTED))
+        adoption_repo.save(Adoption(
+            animal_id=i,
+            adopter_id=1,
+            fee=100,
+            timestamp=now - timedelta(days=i)
+        ))
+
+        if i in returned_ids:
+            return_repo.save(AdoptionReturn(adoption_id=i, reason="Mudança", timestamp=now))
+
+    return adoption_repo
+
+# ---------------------------------------------------------
+# TESTES list_with_parties
+# ---------------------------------------------------------
+def test_list_with_parties_includes_return_timestamp(db_session, make_dog, make_adopter):
+    adoption_repo = populate(db_session, make_dog, make_adopter, n_adoptions=3, returned_ids={2})
+
+    rows = adoption_repo.list_with_parties()
+
+    assert [adoption.id for adoption, _, _, _ in rows] == [1, 2, 3]
+    assert [ret is not None for _, _, _, ret in rows] == [False, True, False]
+    assert all(adoption.animal_id == animal.id for adoption, animal, _, _ in rows)
+
+
+def test_list_with_parties_reuses_adopter(db_session, make_dog, make_adopter):
+    adoption_repo = populate(db_session, make_dog, make_adopter, n_adoptions=3)
+
+    adopters = {id(adopter) for _, _, adopter, _ in adoption_repo.list_with_parties()}
+
+    assert len(adopters) == 1
+
+
+@pytest.mark.parametrize("n_adoptions", [1, 10, 40])
+def test_list_with_parties_statement_count_is_constant(
+    db_session, statements, make_dog, make_adopter, n_adoptions
+):
+    adoption_repo = populate(db_session, make_dog, make_adopter, n_adoptions=n_adoptions, returned_ids={1})
+    db_session.expire_all()
+    statements.clear()
+
+    rows = adoption_repo.list_with_parties()
+
+    assert len(rows) == n_adoptions
+    assert len(statements) == 1
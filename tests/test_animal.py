@@ -39,11 +39,8 @@ class FakeAnimal(Animal):
 # FIXTURE
 # ---------------------------------------------------------
 @pytest.fixture
-def animal(monkeypatch):
-    monkeypatch.setattr(
-        "domain.animals.animal.settings",
-        {"policies": {"wary_animal_temperaments": ["Medroso", "Agressivo"]}}
-    )
+def animal(override_settings):
+    override_settings(wary_temperaments=frozenset({"Medroso", "Agressivo"}))
 
     return FakeAnimal(
         species=Species.DOG,
@@ -0,0 +1,190 @@
+import copy
+import pytest
+from datetime import datetime
+from sqlalchemy import text
+
+from infrastructure.database.db_connection import Base
+from infrastructure.repositories import AnimalRepository
+from domain.animals.cat import Cat
+from domain.enums.animal_enums import Species, Gender, Size
+from domain.enums.animal_status import AnimalStatus
+
+# ---------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------
+@pytest.fixture
+def make_cat():
+    def factory(name: str = "Mia", **overrides) -> Cat:
+        args = dict(
+            species=Species.CAT,
+            breed="Siamês",
+            name=name,
+            gender=Gender.FEMALE,
+            age_months=30,
+            size=Size.SMALL,
+            temperament=["Arisco"],
+            status=AnimalStatus.AVAILABLE,
+            is_hypoallergenic=False,
+            timestamp=datetime.now()
+        )
+        args.update(overrides)
+        return Cat(**args)
+
+    return factory
+
+
+@pytest.fixture
+def repo(db_session, make_dog, make_cat):
+    repo = AnimalRepository(db_session)
+    repo.save_many([
+        make_dog(name="Rex", breed="Labrador", age_months=5, temperament=["Brincalhão", "Calmo"]),
+        make_dog(name="Thor", breed="Labrador", age_months=40, size=Size.LARGE),
+        make_dog(name="Luna", breed="Poodle", age_months=100, gender=Gender.FEMALE),
+        make_cat(name="Mia"),
+        make_cat(name="Rexona", breed="Persa", age_months=8, temperament=["Calmo"]),
+    ])
+    return repo
+
+
+def names(animals) -> list[str]:
+    return [animal.name for animal in animals]
+
+
+def brute_force_counts(animals: list, filters: dict) -> tuple[int, dict]:
+    """Contagens esperadas de facet_counts, calculadas animal a animal."""
+    def value(animal, facet):
+        return animal.age_group() if facet == "age_group" else getattr(animal, facet).value
+
+    def accepted(animal, ignore=None):
+        return all(
+            value(animal, facet) in values
+            for facet, values in filters.items() if facet != ignore
+        )
+
+    facets = {
+        facet: {v: sum(1 for a in animals if value(a, facet) == v and accepted(a, facet)) for v in values}
+        for facet, values in AnimalRepository.FACETS.items()
+    }
+    return sum(1 for a in animals if accepted(a)), facets
+
+# ---------------------------------------------------------
+# TESTES BUSCA POR TEXTO
+# ---------------------------------------------------------
+def test_text_matches_name_breed_and_temperament(repo):
+    assert names(repo.search("rex")[0]) == ["Rex", "Rexona"]           # prefixo
+    assert names(repo.search("labrador")[0]) == ["Rex", "Thor"]
+    assert names(repo.search("brincalhao")[0]) == ["Rex"]              # sem acento
+    assert names(repo.search("calmo rex")[0]) == ["Rex", "Rexona"]     # todos os termos
+    assert names(repo.search("calmo persa")[0]) == ["Rexona"]
+    assert names(repo.search("arisco")[0]) == ["Mia"]
+
+
+def test_query_syntax_is_not_interpreted(repo):
+    assert repo.search('" OR * (')[0] == []
+    assert names(repo.search("  ")[0]) == ["Rex", "Thor", "Luna", "Mia", "Rexona"]
+
+
+def test_index_follows_repository_writes(repo):
+    thor = copy.copy(repo.get_by_id(2))
+    thor.name = "Zeus"
+    repo.update(thor)
+    repo.delete_by(1)
+
+    assert names(repo.search("zeus")[0]) == ["Zeus"]
+    assert repo.search("thor")[0] == []
+    assert names(repo.search("rex")[0]) == ["Rexona"]
+
+# ---------------------------------------------------------
+# TESTES FACETAS E PAGINAÇÃO
+# ---------------------------------------------------------
+def test_filters_combine_with_text(repo):
+    assert names(repo.search("rex", {"species": ["CAT"]})[0]) == ["Rexona"]
+    assert names(repo.search(None, {"age_group": ["young_pet"]})[0]) == ["Rex", "Rexona"]
+    assert names(repo.search(None, {"species": ["DOG"], "size": ["LARGE", "SMALL"]})[0]) == ["Thor"]
+
+
+def test_pagination_with_text(repo):
+    page, next_after = repo.search("rex", limit=1)
+    assert (names(page), next_after) == (["Rex"], 1)
+
+    page, next_after = repo.search("rex", after_id=next_after, limit=1)
+    assert (names(page), next_after) == (["Rexona"], None)
+
+
+def test_invalid_filters(repo):
+    with pytest.raises(ValueError):
+        repo.search(None, {"color": ["BLACK"]})
+
+    with pytest.raises(ValueError):
+        repo.facet_counts(None, {"species": ["FISH"]})
+
+
+@pytest.mark.parametrize("text", [None, "calmo", "rex"])
+@pytest.mark.parametrize("filters", [
+    {},
+    {"species": ["DOG"]},
+    {"species": ["CAT"], "age_group": ["young_pet", "adult_pet"]},
+    {"status": ["RESERVED"]},
+])
+def test_facet_counts_ignore_own_filter(repo, text, filters):
+    found = repo.search(text, limit=repo.MAX_PAGE_SIZE)[0]
+
+    assert repo.facet_counts(text, filters) == (*brute_force_counts(found, filters), False)
+
+
+def test_facet_counts_follow_status_changes(repo):
+    repo.update_status(4, AnimalStatus.RESERVED)
+    repo.delete_by(5)
+
+    total, facets, _ = repo.facet_counts(None, {"species": ["CAT"]})
+
+    assert total == 1
+    assert facets["status"]["RESERVED"] == 1
+    assert facets["species"] == {"CAT": 1, "DOG": 3}
+
+
+def test_facet_counts_are_capped_for_broad_text(repo, monkeypatch):
+    monkeypatch.setattr(AnimalRepository, "FACET_COUNT_LIMIT", 1)
+    found = repo.search("labrador")[0]
+
+    # Apenas o primeiro animal encontrado (Rex) é contado
+    assert repo.facet_counts("labrador", {"size": ["LARGE"]}) == (
+        *brute_force_counts(found[:1], {"size": ["LARGE"]}), True
+    )
+
+    monkeypatch.setattr(AnimalRepository, "FACET_COUNT_LIMIT", 2)
+    assert repo.facet_counts("poodle") == (*brute_force_counts(repo.search("poodle")[0], {}), False)
+
+
+@pytest.mark.parametrize("text", ["labr", "LABRADOR", "brincalhao", "Brincalhão", "rexo", "calmo rex"])
+def test_expanded_prefixes_match_like_plain_prefixes(repo, monkeypatch, text):
+    expanded = names(repo.search(text)[0])
+    monkeypatch.setattr(AnimalRepository, "PREFIX_EXPANSION_LIMIT", 0)
+
+    assert expanded == names(repo.search(text)[0])
+    assert expanded
+
+# ---------------------------------------------------------
+# TESTES CRIAÇÃO DO ÍNDICE
+# ---------------------------------------------------------
+def test_index_is_built_for_existing_animals(engine, repo):
+    # Simula um banco criado antes da busca existir
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE animals_fts"))
+        conn.execute(text("DELETE FROM animal_facet_counts"))
+
+    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    assert names(repo.search("labrador")[0]) == ["Rex", "Thor"]
+    assert repo.facet_counts()[0] == 5
+
+
+def test_rebuild_search_index(engine, repo):
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE animal_facet_counts SET total = 0"))
+
+    repo.rebuild_search_index()
+
+    assert repo.facet_counts()[0] == 5
+    assert names(repo.search("poodle")[0]) == ["Luna"]
@@ -0,0 +1,141 @@
+import pytest
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from datetime import datetime, timedelta
+
+from infrastructure.database.db_connection import Session
+from infrastructure.repositories import (
+    AnimalRepository, AdopterRepository, AdoptionRepository, EventRepository
+)
+from domain.adoptions.adoption import Adoption
+from domain.events.animal_events import VaccineEvent
+from domain.enums.animal_status import AnimalStatus
+
+START = datetime(2024, 1, 1)
+ROOT = Path(__file__).resolve().parent.parent
+
+# ---------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------
+@pytest.fixture
+def animals(client, make_dog):
+    """Cinco cães cadastrados pela sessão das requisições."""
+    AnimalRepository(Session).save_many([
+        make_dog(name=f"Rex {i}", temperament=["Calmo", "Dócil"]) for i in range(5)
+    ])
+    Session.remove()
+
+# ---------------------------------------------------------
+# TESTES COLEÇÕES
+# ---------------------------------------------------------
+def test_list_projects_requested_fields(client, animals):
+    response = client.get("/api/v1/animals?fields=id,name,temperament&limit=2")
+
+    assert response.status_code == 200
+    assert response.json["items"] == [
+        {"id": 1, "name": "Rex 0", "temperament": ["Calmo", "Dócil"]},
+        {"id": 2, "name": "Rex 1", "temperament": ["Calmo", "Dócil"]},
+    ]
+
+
+def test_unknown_field_is_rejected(client, animals):
+    response = client.get("/api/v1/animals?fields=id,owner")
+
+    assert response.status_code == 400
+    assert "owner" in response.json["error"]
+    assert "ETag" not in response.headers
+
+
+def test_next_links_walk_all_pages(client, animals):
+    url, ids = "/api/v1/animals?fields=id&limit=2&fields=name", []
+
+    while url is not None:
+        page = client.get(url).json
+        ids += [item["id"] for item in page["items"]]
+        url = page["next"]
+
+        if url is not None:
+            # Parâmetros repetidos são preservados no link
+            assert url.count("fields=") == 2
+
+    assert ids == [1, 2, 3, 4, 5]
+
+
+def test_missing_record_returns_404(client, animals):
+    response = client.get("/api/v1/animals/99")
+
+    assert response.status_code == 404
+    assert "ETag" not in response.headers
+
+# ---------------------------------------------------------
+# TESTES ETag
+# ---------------------------------------------------------
+def test_if_none_match_returns_304_until_table_changes(client, animals, statements):
+    etag = client.get("/api/v1/animals/1").headers["ETag"]
+
+    statements.clear()
+    response = client.get("/api/v1/animals/1", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.data == b""
+    # Apenas a leitura dos contadores de alteração
+    assert len([s for s in statements if s.startswith("SELECT")]) == 1
+
+    AnimalRepository(Session).update_status(2, AnimalStatus.UNADOPTABLE)
+    Session.remove()
+
+    assert client.get("/api/v1/animals/1", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_etag_depends_on_query_args(client, animals):
+    first = client.get("/api/v1/animals?limit=2").headers["ETag"]
+    second = client.get("/api/v1/animals?limit=3").headers["ETag"]
+
+    assert first != second
+
+# ---------------------------------------------------------
+# TESTES LINHA DO TEMPO
+# ---------------------------------------------------------
+def test_timeline_encodes_events(client, make_dog, make_adopter):
+    AnimalRepository(Session).save(make_dog(status=AnimalStatus.RESERVED))
+    AdopterRepository(Session).save(make_adopter(name="Bruno"))
+    EventRepository(Session).save(VaccineEvent(
+        id=None, animal_id=1, timestamp=START, vaccine_name="V10", veterinarian="Dra. Ana"
+    ))
+    AdoptionRepository(Session).save(Adoption(
+        animal_id=1, adopter_id=1, fee=150, timestamp=START + timedelta(days=1)
+    ))
+    Session.remove()
+
+    items = client.get("/api/v1/animals/1/timeline").json["items"]
+
+    assert [item["event_type"] for item in items] == ["VACCINE", "ADOPTION"]
+    assert items[0]["timestamp"] == START.isoformat()
+    assert items[1]["adopter"] == {"id": 1, "name": "Bruno"}
+    assert client.get("/api/v1/animals/99/timeline").status_code == 404
+
+# ---------------------------------------------------------
+# TESTES CRIAÇÃO DA APLICAÇÃO
+# ---------------------------------------------------------
+def test_importing_application_does_not_touch_database():
+    # Processo separado: outros testes já podem ter importado o main
+    code = (
+        "import threading, main, app.routes, app.api\n"
+        "from infrastructure.database.db_connection import engine\n"
+        "print(engine.pool.checkedin(), engine.pool.checkedout(), threading.active_count())"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.split() == ["0", "0", "1"]
+
+
+def test_client_uses_test_database_without_scheduler(client, engine):
+    from main import reservation_service
+
+    assert Session().get_bind() is engine
+    assert reservation_service.expiry_scheduler is None
+    assert "expiry-scheduler" not in {thread.name for thread in threading.enumerate()}
@@ -0,0 +1,136 @@
+import itertools
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+
+from infrastructure.repositories import (
+    AnimalRepository, AdopterRepository, ReservationQueueRepository
+)
+from services.assignment_service import AssignmentService
+from config import settings
+from domain.adoptions.reservation_queue import ReservationQueue
+from domain.enums.animal_status import AnimalStatus
+
+# ---------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------
+@pytest.fixture
+def service():
+    return AssignmentService(reservation_repo=None)
+
+
+def solve(service, bids, max_per_adopter=1):
+    animal_ids, adopter_ids, rates = (np.array(c) for c in zip(*bids))
+    winners = service.solve(animal_ids, adopter_ids, rates, max_per_adopter)
+    return sorted((bids[i][0], bids[i][1]) for i in winners)
+
+
+def brute_force(bids, max_per_adopter):
+    """Maior soma de taxas testando todas as escolhas (um lance ou nenhum por animal)."""
+    by_animal = {}
+    for i, (animal_id, _, _) in enumerate(bids):
+        by_animal.setdefault(animal_id, [None]).append(i)
+
+    best = 0
+    for choice in itertools.product(*by_animal.values()):
+        chosen = [bids[i] for i in choice if i is not None]
+        counts = {}
+        for _, adopter_id, _ in chosen:
+            counts[adopter_id] = counts.get(adopter_id, 0) + 1
+        if all(c <= max_per_adopter for c in counts.values()):
+            best = max(best, sum(rate for _, _, rate in chosen))
+    return best
+
+# ---------------------------------------------------------
+# TESTES solve
+# ---------------------------------------------------------
+def test_same_adopter_does_not_win_every_queue(service):
+    # O adotante 1 lidera as duas filas; o guloso daria os dois animais a ele
+    bids = [(1, 1, 90), (1, 2, 80), (2, 1, 95), (2, 2, 60)]
+
+    assert solve(service, bids) == [(1, 2), (2, 1)]
+
+
+def test_unlimited_matches_queue_head(service):
+    bids = [(1, 1, 90), (1, 2, 80), (2, 1, 95), (2, 2, 60)]
+
+    assert solve(service, bids, max_per_adopter=None) == [(1, 1), (2, 1)]
+
+
+def test_animal_without_free_adopter_is_left_unassigned(service):
+    bids = [(1, 1, 90), (2, 1, 80)]
+
+    assert solve(service, bids) == [(1, 1)]
+
+
+def test_zero_rate_bid_beats_leaving_animal_unassigned(service):
+    # Animal 3 só tem um lance de taxa 0; o animal 2 pode ir para o adotante 3
+    bids = [(1, 1, 50.0), (2, 2, 0.0), (2, 3, 0.0), (3, 2, 0.0)]
+
+    assert solve(service, bids) == [(1, 1), (2, 3), (3, 2)]
+
+
+def test_more_winners_never_beat_higher_total_rate(service):
+    # Atribuir os dois animais soma 59.5; apenas o animal 1 soma 60
+    bids = [(1, 1, 60.0), (2, 1, 59.5), (1, 2, 0.0)]
+
+    assert solve(service, bids) == [(1, 1)]
+
+
+def test_max_per_adopter_allows_several_animals(service):
+    bids = [(1, 1, 90), (2, 1, 80), (3, 1, 70), (3, 2, 10)]
+
+    assert solve(service, bids, max_per_adopter=2) == [(1, 1), (2, 1), (3, 2)]
+
+
+def test_duplicate_bids_keep_highest_rate(service):
+    bids = [(1, 1, 20), (1, 1, 90), (1, 2, 50)]
+
+    assert solve(service, bids) == [(1, 1)]
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("max_per_adopter", [1, 2])
+def test_solution_is_optimal(service, seed, max_per_adopter):
+    rng = np.random.default_rng(seed)
+    pairs = {(int(a), int(d)) for a, d in rng.integers(1, 5, size=(9, 2))}
+    bids = [(a, d, int(rng.integers(0, 101))) for a, d in sorted(pairs)]
+
+    animal_ids, adopter_ids, rates = (np.array(c) for c in zip(*bids))
+    winners = service.solve(animal_ids, adopter_ids, rates, max_per_adopter)
+
+    assert len(set(animal_ids[winners])) == len(winners)
+    assert np.bincount(adopter_ids[winners]).max() <= max_per_adopter
+    assert rates[winners].sum() == brute_force(bids, max_per_adopter)
+
+
+def test_invalid_max_per_adopter_raises(service):
+    with pytest.raises(ValueError):
+        service.solve(np.array([1]), np.array([1]), np.array([50.0]), max_per_adopter=0)
+
+# ---------------------------------------------------------
+# TESTES assign_expired_queues
+# ---------------------------------------------------------
+def test_assign_expired_queues_ignores_ongoing_and_canceled(db_session, make_dog, make_adopter):
+    animal_repo = AnimalRepository(db_session)
+    adopter_repo = AdopterRepository(db_session)
+    reservation_repo = ReservationQueueRepository(db_session)
+
+    expired = datetime.now() - settings.reservation_duration - timedelta(hours=1)
+    for i in range(3):
+        animal_repo.save(make_dog(name=f"Rex {i}", status=AnimalStatus.RESERVED))
+        adopter_repo.save(make_adopter(name=f"Adotante {i}"))
+
+    # Animal 1: fila expirada disputada pelos adotantes 1 (cancelado) e 2
+    reservation_repo.save(ReservationQueue(animal_id=1, adopter_id=1, compatibility_rate=99, timestamp=expired))
+    reservation_repo.save(ReservationQueue(animal_id=1, adopter_id=2, compatibility_rate=70, timestamp=expired))
+    reservation_repo.cancel_reservation(1)
+    # Animal 2: fila expirada em que o adotante 2 também lidera
+    reservation_repo.save(ReservationQueue(animal_id=2, adopter_id=2, compatibility_rate=90, timestamp=expired))
+    reservation_repo.save(ReservationQueue(animal_id=2, adopter_id=3, compatibility_rate=60, timestamp=expired))
+    # Animal 3: fila ainda em andamento
+    reservation_repo.save(ReservationQueue(animal_id=3, adopter_id=3, compatibility_rate=80))
+
+    assignment = AssignmentService(reservation_repo).assign_expired_queues(max_per_adopter=1)
+
+    assert assignment == {1: 2, 2: 4}
@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import MagicMock
+from datetime import datetime
 from sqlalchemy.exc import IntegrityError
 
 from infrastructure.repositories.base_repo import BaseRepository
@@ -21,6 +22,7 @@ class FakeTable:
 
 
 class FakeModel:
+    __tablename__ = "fakes"
     __table__ = FakeTable()
 
     def __init__(self, id=None, name=None, age=None):
@@ -187,3 +189,231 @@ def test_delete_by_not_found(repository):
 
     assert result is False
 
+# ---------------------------------------------------------
+# TESTES list_page (BANCO SQLITE EM MEMÓRIA)
+# ---------------------------------------------------------
+@pytest.fixture
+def adopter_repo(db_session, make_adopter):
+    from datetime import timedelta
+    from infrastructure.repositories import AdopterRepository
+
+    repo = AdopterRepository(db_session)
+    start = datetime(2024, 1, 1)
+
+    # Timestamps em ordem inversa aos IDs
+    for i in range(7):
+        repo.save(make_adopter(name=f"Adotante {i}", timestamp=start - timedelta(days=i)))
+
+    return repo
+
+
+def test_list_page_walks_all_pages_by_id(adopter_repo):
+    seen = []
+    after_id = None
+
+    while True:
+        page, after_id = adopter_repo.list_page(after_id=after_id, limit=3)
+        seen.extend(a.id for a in page)
+        assert len(page) <= 3
+
+        if after_id is None:
+            break
+
+    assert seen == [1, 2, 3, 4, 5, 6, 7]
+
+
+def test_list_page_by_timestamp(adopter_repo):
+    first, after_id = adopter_repo.list_page(limit=4, order_by="timestamp")
+    second, last = adopter_repo.list_page(after_id=after_id, limit=4, order_by="timestamp")
+
+    assert [a.id for a in first] == [7, 6, 5, 4]
+    assert [a.id for a in second] == [3, 2, 1]
+    assert last is None
+
+
+def test_list_page_by_timestamp_survives_deleted_cursor(adopter_repo):
+    first, after_id = adopter_repo.list_page(limit=4, order_by="timestamp")
+    adopter_repo.delete_by(first[-1].id)
+
+    second, _ = adopter_repo.list_page(after_id=after_id, limit=4, order_by="timestamp")
+    by_id, _ = adopter_repo.list_page(after_id=3, limit=4, order_by="timestamp")
+
+    assert [a.id for a in second] == [3, 2, 1]
+    assert [a.id for a in by_id] == [2, 1]
+
+
+def test_list_page_by_timestamp_with_deleted_id_cursor(adopter_repo):
+    adopter_repo.delete_by(4)
+
+    page, _ = adopter_repo.list_page(after_id=4, limit=4, order_by="timestamp")
+
+    # Sem o valor da coluna, a página continua pelos identificadores maiores
+    assert [a.id for a in page] == [7, 6, 5]
+
+
+def test_list_page_limit_is_bounded(adopter_repo):
+    adopter_repo.MAX_PAGE_SIZE = 5
+
+    page, after_id = adopter_repo.list_page(limit=1000)
+
+    assert len(page) == 5
+    assert after_id == 5
+
+
+def test_list_page_invalid_order_by(adopter_repo):
+    with pytest.raises(ValueError):
+        adopter_repo.list_page(order_by="unknown")
+
+# ---------------------------------------------------------
+# TESTES list_page_columns / get_columns (BANCO SQLITE EM MEMÓRIA)
+# ---------------------------------------------------------
+def test_list_page_columns_selects_only_requested_columns(adopter_repo, statements):
+    first, after_id = adopter_repo.list_page_columns(["name", "age"], limit=4, order_by="timestamp")
+    second, last = adopter_repo.list_page_columns(
+        ["name"], after_id=after_id, limit=4, order_by="timestamp"
+    )
+
+    assert first[0] == {"name": "Adotante 6", "age": 30}
+    assert [row["name"][-1] for row in first + second] == list("6543210")
+    assert last is None
+
+    # Apenas as colunas pedidas (e a chave primária, usada como cursor) são lidas
+    select = statements[-1].split(" FROM ")[0]
+    assert "adopters.name" in select and "adopters.age" not in select
+    assert "adopters.housing_type" not in select
+
+
+def test_get_columns(adopter_repo):
+    assert adopter_repo.get_columns(2, ["id", "name", "id"]) == {"id": 2, "name": "Adotante 1"}
+    assert adopter_repo.get_columns(99, ["id"]) is None
+
+
+def test_columns_must_exist(adopter_repo):
+    with pytest.raises(ValueError):
+        adopter_repo.list_page_columns(["name", "password"])
+
+    with pytest.raises(ValueError):
+        adopter_repo.get_columns(1, ["password"])
+
+# ---------------------------------------------------------
+# TESTES iter_all (BANCO SQLITE EM MEMÓRIA)
+# ---------------------------------------------------------
+def test_iter_all_is_lazy_and_complete(adopter_repo):
+    iterator = adopter_repo.iter_all(chunk_size=2)
+
+    first = next(iterator)
+    rest = list(iterator)
+
+    assert first.id == 1
+    assert [a.id for a in rest] == [2, 3, 4, 5, 6, 7]
+
+
+def test_iter_all_uses_custom_to_domain(db_session, make_dog):
+    from domain.animals.dog import Dog
+    from infrastructure.repositories import AnimalRepository
+
+    repo = AnimalRepository(db_session)
+    for i in range(3):
+        repo.save(make_dog(name=f"Rex {i}"))
+
+    animals = list(repo.iter_all(chunk_size=2))
+
+    assert len(animals) == 3
+    assert all(isinstance(a, Dog) for a in animals)
+
+# ---------------------------------------------------------
+# TESTES save_many (BANCO SQLITE EM MEMÓRIA)
+# ---------------------------------------------------------
+def test_save_many_inserts_in_batches(db_session, statements, make_adopter):
+    from infrastructure.repositories import AdopterRepository
+
+    repo = AdopterRepository(db_session)
+    adopters = [make_adopter(name=f"Adotante {i}") for i in range(10)]
+
+    rejected = repo.save_many(adopters, batch_size=4)
+    inserts = [s for s in statements if s.startswith("INSERT INTO adopters")]
+
+    assert rejected == []
+    assert len(inserts) == 3
+    assert len(repo.list_all()) == 10
+
+
+def test_save_many_reports_integrity_errors(db_session, make_adopter):
+    from infrastructure.repositories import AdopterRepository
+
+    repo = AdopterRepository(db_session)
+    repo.save(make_adopter(name="Duplicado", timestamp=datetime(2024, 1, 1)))
+
+    adopters = [
+        make_adopter(name="Adotante 0"),
+        make_adopter(name="Duplicado", timestamp=datetime(2024, 1, 1)),
+        make_adopter(name="Adotante 2"),
+        make_adopter(name="Adotante 2"),
+        make_adopter(name="Adotante 4"),
+    ]
+
+    rejected = repo.save_many(adopters, batch_size=2)
+
+    assert rejected == [1, 3]
+    assert sorted(a.name for a in repo.list_all()) == [
+        "Adotante 0", "Adotante 2", "Adotante 4", "Duplicado"
+    ]
+
+
+def test_save_many_uses_custom_to_model(db_session, make_dog):
+    from domain.animals.dog import Dog
+    from infrastructure.repositories import AnimalRepository
+
+    repo = AnimalRepository(db_session)
+
+    rejected = repo.save_many([make_dog(name=f"Rex {i}", needs_walk=False) for i in range(3)])
+    animals = repo.list_all()
+
+    assert rejected == []
+    assert all(isinstance(a, Dog) and a.needs_walk is False for a in animals)
+
+# ---------------------------------------------------------
+# TESTES get_many (BANCO SQLITE EM MEMÓRIA)
+# ---------------------------------------------------------
+def test_get_many_splits_in_lists(adopter_repo, statements):
+    adopter_repo.IN_CHUNK_SIZE = 3
+
+    adopters = adopter_repo.get_many([7, 1, 7, 99, 2, 5, 1, 3])
+    selects = [s for s in statements if s.startswith("SELECT")]
+
+    assert list(adopters) == [7, 1, 2, 5, 3]
+    assert adopters[7].name == "Adotante 6"
+    assert len(selects) == 2     # 6 IDs distintos em blocos de 3
+
+
+def test_get_many_empty(adopter_repo, statements):
+    assert adopter_repo.get_many([]) == {}
+    assert statements == []
+
+
+def test_get_many_uses_custom_to_domain(db_session, make_dog):
+    from domain.animals.dog import Dog
+    from infrastructure.repositories import AnimalRepository
+
+    repo = AnimalRepository(db_session)
+    repo.save_many([make_dog(name=f"Rex {i}", needs_walk=False, temperament=["Calmo"]) for i in range(2)])
+
+    animals = repo.get_many([2, 1])
+
+    assert all(isinstance(a, Dog) and a.needs_walk is False for a in animals.values())
+    assert animals[1].temperament == ["Calmo"]
+
+
+def test_get_many_uses_default_to_domain(db_session, make_adopter, make_dog):
+    from domain.adoptions.adoption import Adoption
+    from infrastructure.repositories import AdoptionRepository, AnimalRepository, AdopterRepository
+
+    AnimalRepository(db_session).save(make_dog())
+    AdopterRepository(db_session).save(make_adopter())
+    repo = AdoptionRepository(db_session)
+    repo.save(Adoption(animal_id=1, adopter_id=1, fee=120.0))
+
+    adoption = repo.get_many([1])[1]
+
+    assert isinstance(adoption, Adoption)
+    assert (adoption.animal_id, adoption.adopter_id, adoption.fee) == (1, 1, 120.0)
@@ -94,3 +94,76 @@ def test_score_adopter_age(service, adopter):
 def test_score_other_animals(service, adopter):
     score = service._CompatibilityService__score_other_animals(adopter)
     assert score >= 0
+
+# ---------------------- TESTES DA TABELA PRÉ-CALCULADA ----------------------
+
+@pytest.fixture
+def adopters():
+    return [
+        Adopter(
+            name=f"Adotante {i}",
+            age=age,
+            housing_type=housing,
+            usable_area=area,
+            has_pet_experience=experience,
+            has_children_at_home=children,
+            has_other_animals=others
+        )
+        for i, (age, housing, area, experience, children, others) in enumerate([
+            (18, HousingType.APARTMENT, 10, False, True, True),
+            (30, HousingType.HOUSE, 15, True, False, False),
+            (45, HousingType.APARTMENT, 34.9, False, False, True),
+            (59, HousingType.HOUSE, 35, True, True, False),
+            (60, HousingType.APARTMENT, 50, False, True, False),
+            (90, HousingType.HOUSE, 500, True, False, True),
+        ])
+    ]
+
+@pytest.fixture
+def animals(dog, cat):
+    wary_dog = Dog(
+        species=Species.DOG,
+        breed="Pastor",
+        name="Thor",
+        gender=Gender.MALE,
+        age_months=100,
+        size=Size.LARGE,
+        temperament=["Agressivo"],
+        status=AnimalStatus.AVAILABLE,
+        needs_walk=True
+    )
+    return [dog, cat, wary_dog]
+
+def test_table_matches_weighted_sum(service, animals, adopters):
+    for animal in animals:
+        for adopter in adopters:
+            expected = service._CompatibilityService__score(animal, adopter)
+            assert service.calculate_rate(animal, adopter) == expected
+
+def test_calculate_rates_matrix(service, animals, adopters):
+    matrix = service.calculate_rates(animals, adopters)
+
+    assert matrix.shape == (len(animals), len(adopters))
+    for i, animal in enumerate(animals):
+        for j, adopter in enumerate(adopters):
+            assert matrix[i, j] == service.calculate_rate(animal, adopter)
+
+def test_calculate_rates_with_empty_inputs(service, animals, adopters):
+    assert service.calculate_rates([], adopters).shape == (0, len(adopters))
+    assert service.calculate_rates(animals, []).shape == (len(animals), 0)
+
+def test_calculate_pair_rates(service, animals, adopters):
+    pairs = [(animals[i % len(animals)], adopter) for i, adopter in enumerate(adopters)]
+    pairs.append(pairs[0])
+
+    rates = service.calculate_pair_rates(*zip(*pairs))
+
+    assert rates.tolist() == [service.calculate_rate(a, b) for a, b in pairs]
+
+    with pytest.raises(ValueError):
+        service.calculate_pair_rates(animals, adopters)
+
+def test_encode_animal_features_matches_entities(service, animals):
+    features = [(a.size, a.age_group(), tuple(a.temperament)) for a in animals]
+
+    assert service.encode_animal_features(features).tolist() == service.encode_animals(animals).tolist()
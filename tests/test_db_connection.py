@@ -0,0 +1,91 @@
+import threading
+import pytest
+from sqlalchemy import create_engine, text
+
+from infrastructure.database.db_connection import (
+    Session, engine, pool_settings, apply_storage_profile
+)
+
+PROFILE = {
+    "enabled": True,
+    "journal_mode": "wal",
+    "synchronous": "normal",
+    "mmap_size": 1048576,
+    "cache_size": -2000,
+    "temp_store": "memory",
+    "busy_timeout": 1234
+}
+
+def read_pragma(engine, name: str):
+    with engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+# ---------------------------------------------------------
+# TESTES DO ENGINE
+# ---------------------------------------------------------
+def test_engine_uses_configured_pool():
+    assert engine.pool.size() == pool_settings["pool_size"]
+    assert engine.pool._max_overflow == pool_settings["max_overflow"]
+    assert engine.pool._recycle == pool_settings["pool_recycle"]
+
+# ---------------------------------------------------------
+# TESTES DA SESSÃO POR THREAD
+# ---------------------------------------------------------
+def test_session_is_reused_within_thread():
+    try:
+        assert Session() is Session()
+    finally:
+        Session.remove()
+
+
+def test_session_is_isolated_between_threads():
+    sessions = []
+
+    def worker():
+        sessions.append(Session())
+        Session.remove()
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sessions[0] is not sessions[1]
+
+
+def test_remove_discards_session():
+    first = Session()
+    Session.remove()
+
+    try:
+        assert Session() is not first
+    finally:
+        Session.remove()
+
+# ---------------------------------------------------------
+# TESTES apply_storage_profile
+# ---------------------------------------------------------
+def test_storage_profile_applies_pragmas(tmp_path):
+    file_engine = create_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+    apply_storage_profile(file_engine, PROFILE)
+
+    assert read_pragma(file_engine, "journal_mode") == "wal"
+    assert read_pragma(file_engine, "synchronous") == 1     # NORMAL
+    assert read_pragma(file_engine, "cache_size") == -2000
+    assert read_pragma(file_engine, "temp_store") == 2      # MEMORY
+    assert read_pragma(file_engine, "busy_timeout") == 1234
+
+
+def test_disabled_storage_profile_keeps_defaults(tmp_path):
+    file_engine = create_engine(f"sqlite:///{tmp_path / 'default.db'}")
+    apply_storage_profile(file_engine, {**PROFILE, "enabled": False})
+
+    assert read_pragma(file_engine, "journal_mode") == "delete"
+
+
+def test_storage_profile_rejects_invalid_values(tmp_path):
+    file_engine = create_engine(f"sqlite:///{tmp_path / 'invalid.db'}")
+
+    with pytest.raises(ValueError):
+        apply_storage_profile(file_engine, {**PROFILE, "journal_mode": "WAL; DROP TABLE x"})
@@ -0,0 +1,83 @@
+import pytest
+from datetime import datetime
+
+from domain.adoptions.adoption import Adoption
+from domain.adoptions.reservation_queue import ReservationQueue
+from domain.events.animal_events import (
+    Event, TrainingEvent, VaccineEvent, AdoptionEvent, ReturnEvent, QuarentineEvent
+)
+from domain.enums.event_type import EventType
+
+NOW = datetime(2024, 1, 1)
+
+# ---------------------------------------------------------
+# ENTIDADES SEM __dict__
+# ---------------------------------------------------------
+@pytest.fixture
+def entities(make_dog, make_adopter):
+    from domain.animals.cat import Cat
+    from domain.enums.animal_enums import Species, Gender, Size
+    from domain.enums.animal_status import AnimalStatus
+
+    cat = Cat(
+        species=Species.CAT, breed="Siamês", name="Mia", gender=Gender.FEMALE,
+        age_months=30, size=Size.SMALL, temperament=["Calmo"],
+        status=AnimalStatus.AVAILABLE, is_hypoallergenic=True
+    )
+    return [
+        make_dog(),
+        cat,
+        make_adopter(),
+        Adoption(animal_id=1, adopter_id=1, fee=10.0),
+        ReservationQueue(animal_id=1, adopter_id=1, compatibility_rate=50),
+    ]
+
+
+def test_entities_have_no_instance_dict(entities):
+    for entity in entities:
+        assert not hasattr(entity, "__dict__"), type(entity).__name__
+
+        with pytest.raises(AttributeError):
+            entity.undeclared_attribute = 1
+
+
+def test_mixin_lists_are_created_on_first_access(make_dog):
+    dog = make_dog()
+
+    assert dog.is_vaccineable and dog.is_trainable
+    assert not hasattr(dog, "_vaccines")
+
+    dog.vaccines.append("V8")
+
+    assert dog.vaccines == ["V8"]
+    assert dog.trainings == []
+    assert make_dog(name="Bob").vaccines == []
+
+
+def test_properties_still_validate(make_dog, make_adopter):
+    dog = make_dog()
+    dog.name = "  thor "
+    assert dog.name == "Thor"
+
+    with pytest.raises(TypeError):
+        dog.needs_walk = "sim"
+
+    with pytest.raises(TypeError):
+        make_adopter().has_pet_experience = "sim"
+
+# ---------------------------------------------------------
+# EVENTOS (@dataclass(slots=True))
+# ---------------------------------------------------------
+@pytest.mark.parametrize("event, event_type", [
+    (Event(id=1, animal_id=1, timestamp=NOW), None),
+    (VaccineEvent(id=1, animal_id=1, timestamp=NOW, vaccine_name="V8", veterinarian="Ana"),
+     EventType.VACCINE),
+    (TrainingEvent(id=1, animal_id=1, timestamp=NOW, duration_min=30,
+                   training_type="Obediência", trainer="Rui", notes=""), EventType.TRAINING),
+    (AdoptionEvent(id=1, animal_id=1, timestamp=NOW, adopter=None, fee=0.0), EventType.ADOPTION),
+    (ReturnEvent(id=1, animal_id=1, timestamp=NOW, adoption_id=1, reason=""), EventType.RETURN),
+    (QuarentineEvent(id=1, animal_id=1, timestamp=NOW), EventType.QUARENTINE),
+])
+def test_events_are_slotted(event, event_type):
+    assert not hasattr(event, "__dict__")
+    assert event.event_type == event_type
@@ -0,0 +1,190 @@
+import copy
+import pytest
+
+from infrastructure.repositories import (
+    AnimalRepository,
+    AdopterRepository,
+    ReservationQueueRepository,
+    EntityCache
+)
+from infrastructure.repositories import entity_cache
+from domain.adoptions.reservation_queue import ReservationQueue
+from domain.enums.animal_status import AnimalStatus
+from domain.exceptions import PolicyNotMetError
+from services.adopter_service import AdopterService
+
+# ---------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------
+@pytest.fixture
+def caches(monkeypatch):
+    """Ativa o cache de entidades nos repositórios durante o teste."""
+    created = {}
+
+    for repository_class in (AnimalRepository, AdopterRepository, ReservationQueueRepository):
+        created[repository_class] = EntityCache(max_size=100, ttl=60)
+        monkeypatch.setattr(repository_class, "cache", created[repository_class])
+
+    return created
+
+
+@pytest.fixture
+def animal_repo(db_session, caches, make_dog):
+    repo = AnimalRepository(db_session)
+    repo.save_many([make_dog(name=f"Rex {i}") for i in range(3)])
+    return repo
+
+
+def selects(statements) -> list[str]:
+    return [s for s in statements if s.startswith("SELECT")]
+
+# ---------------------------------------------------------
+# TESTES EntityCache
+# ---------------------------------------------------------
+def test_lru_evicts_least_recently_used():
+    cache = EntityCache(max_size=2, ttl=60)
+
+    cache.put_many({1: "a", 2: "b"}, cache.generation)
+    cache.get(1)
+    cache.put(3, "c", cache.generation)
+
+    assert cache.get_many([1, 2, 3]) == ({1: "a", 3: "c"}, [2])
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(entity_cache.time, "monotonic", lambda: now[0])
+    cache = EntityCache(ttl=5)
+
+    cache.put(1, "a", cache.generation)
+    now[0] += 4.9
+    assert cache.get(1) == "a"
+
+    now[0] += 0.1
+    assert cache.get(1) is None
+    assert len(cache) == 0
+
+
+def test_put_after_invalidation_is_discarded():
+    cache = EntityCache()
+
+    generation = cache.generation       # leitura iniciada...
+    cache.invalidate(1)                 # ...escrita confirmada durante a leitura
+    cache.put(1, "versão antiga", generation)
+
+    assert cache.get(1) is None
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        EntityCache(max_size=0)
+
+    with pytest.raises(ValueError):
+        EntityCache(ttl=0)
+
+# ---------------------------------------------------------
+# TESTES get_by_id / get_many (BANCO SQLITE EM MEMÓRIA)
+# ---------------------------------------------------------
+def test_get_by_id_is_read_through(animal_repo, statements):
+    first = animal_repo.get_by_id(1)
+    statements.clear()
+
+    assert animal_repo.get_by_id(1) is first
+    assert AnimalRepository(animal_repo.session).get_by_id(1) is first
+    assert selects(statements) == []
+
+
+def test_get_many_queries_only_misses(animal_repo, statements):
+    cached = animal_repo.get_by_id(2)
+    statements.clear()
+
+    animals = animal_repo.get_many([3, 2, 99, 1, 3])
+
+    assert list(animals) == [3, 2, 1]
+    assert animals[2] is cached
+    assert len(selects(statements)) == 1
+    assert "IN (?, ?, ?)" in selects(statements)[0]
+
+    statements.clear()
+    assert list(animal_repo.get_many([1, 3])) == [1, 3]
+    assert selects(statements) == []
+
+
+def test_get_many_without_cache(db_session, make_adopter):
+    repo = AdopterRepository(db_session)
+    repo.save_many([make_adopter(name=f"Adotante {i}") for i in range(3)])
+
+    adopters = repo.get_many([3, 1, 3])
+
+    assert [a.name for a in adopters.values()] == ["Adotante 2", "Adotante 0"]
+
+# ---------------------------------------------------------
+# TESTES INVALIDAÇÃO PELAS ESCRITAS
+# ---------------------------------------------------------
+def test_update_status_invalidates(animal_repo):
+    animal_repo.get_by_id(1)
+
+    animal_repo.update_status(1, AnimalStatus.UNADOPTABLE)
+
+    assert animal_repo.get_by_id(1).status == AnimalStatus.UNADOPTABLE
+
+
+def test_string_ids_share_cache_entry_with_writes(animal_repo):
+    animal_repo.get_by_id("1")
+    assert animal_repo.get_many(["2", 2, "x"]).keys() == {2}
+
+    animal_repo.update_status(1, AnimalStatus.UNADOPTABLE)
+    animal_repo.update_status(2, AnimalStatus.UNADOPTABLE)
+
+    assert animal_repo.get_by_id("1").status == AnimalStatus.UNADOPTABLE
+    assert animal_repo.get_many(["2"])[2].status == AnimalStatus.UNADOPTABLE
+    assert animal_repo.get_by_id("x") is None
+
+
+def test_update_and_delete_invalidate(animal_repo):
+    animal = copy.copy(animal_repo.get_by_id(1))
+    animal.name = "Thor"
+    animal_repo.update(animal)
+    animal_repo.get_by_id(2)
+    animal_repo.delete_by(2)
+
+    assert animal_repo.get_by_id(1).name == "Thor"
+    assert animal_repo.get_by_id(2) is None
+
+
+def test_queue_writes_invalidate_reservations_and_animal(db_session, animal_repo, make_adopter):
+    from datetime import datetime
+
+    AdopterRepository(db_session).save_many([make_adopter(name=f"Adotante {i}") for i in range(2)])
+    reservation_repo = ReservationQueueRepository(db_session)
+
+    for adopter_id in (1, 2):
+        reservation_repo.enqueue(ReservationQueue(
+            animal_id=1, adopter_id=adopter_id, compatibility_rate=50, timestamp=datetime.now()
+        ))
+
+    # A reserva foi feita por outra instância de AnimalRepository (animal_mapper)
+    assert animal_repo.get_by_id(1).status == AnimalStatus.RESERVED
+
+    reservation_repo.get_many([1, 2])
+    reservation_repo.update_compatibility_rates([(2, 75)])
+    reservation_repo.cancel_reservation(1)
+
+    assert reservation_repo.get_by_id(1).is_canceled is True
+    assert reservation_repo.get_by_id(2).compatibility_rate == 75
+
+    reservation_repo.clear_queue(1)
+
+    assert reservation_repo.get_many([1, 2]) == {}
+
+
+def test_failed_service_update_keeps_cached_entity(db_session, caches, make_adopter):
+    repo = AdopterRepository(db_session)
+    repo.save(make_adopter(name="Ana", age=30))
+    service = AdopterService(adopter_repo=repo)
+
+    with pytest.raises(PolicyNotMetError):
+        service.update(1, name="Ana Maria", age=10)
+
+    assert repo.get_by_id(1).name == "Ana"
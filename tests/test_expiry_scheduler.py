@@ -0,0 +1,157 @@
+import queue
+import threading
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker, scoped_session
+
+from infrastructure.database.db_connection import Base
+from infrastructure.repositories import (
+    AnimalRepository, AdopterRepository, ReservationQueueRepository, AdoptionRepository
+)
+from services.expiry_scheduler import ExpiryScheduler
+from services.reservation_service import ReservationService
+from domain.adoptions.reservation_queue import ReservationQueue
+from domain.enums.animal_status import AnimalStatus
+
+# ---------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------
+@pytest.fixture
+def batches():
+    return queue.Queue()
+
+
+@pytest.fixture
+def scheduler(batches):
+    scheduler = ExpiryScheduler(on_expired=batches.put)
+    yield scheduler
+    scheduler.stop(timeout=1)
+
+
+def in_seconds(seconds: float) -> datetime:
+    return datetime.now() + timedelta(seconds=seconds)
+
+# ---------------------------------------------------------
+# TESTES
+# ---------------------------------------------------------
+def test_due_keys_are_delivered_in_one_batch(scheduler, batches):
+    deadline = in_seconds(0.05)
+    for key in (3, 1, 2, 1):
+        scheduler.schedule(key, deadline)
+
+    scheduler.start()
+
+    assert batches.get(timeout=1) == [1, 2, 3]
+    assert scheduler.next_deadline() is None
+
+
+def test_does_not_fire_before_deadline(scheduler, batches):
+    deadline = in_seconds(0.2)
+    scheduler.schedule(1, deadline)
+    scheduler.start()
+
+    assert batches.get(timeout=1) == [1]
+    assert datetime.now() >= deadline
+
+
+def test_earlier_deadline_wakes_scheduler(scheduler, batches):
+    scheduler.schedule(1, in_seconds(60))
+    scheduler.start()
+
+    scheduler.schedule(2, in_seconds(0.05))
+
+    assert batches.get(timeout=1) == [2]
+    assert batches.empty()
+
+
+def test_failing_action_does_not_stop_scheduler(batches):
+    calls = []
+
+    def on_expired(keys):
+        calls.append(keys)
+        if len(calls) == 1:
+            raise RuntimeError("falha")
+        batches.put(keys)
+
+    scheduler = ExpiryScheduler(on_expired=on_expired)
+    scheduler.schedule(1, in_seconds(0.01))
+    scheduler.start()
+    scheduler.schedule(2, in_seconds(0.1))
+
+    try:
+        assert batches.get(timeout=1) == [2]
+    finally:
+        scheduler.stop(timeout=1)
+
+
+def test_stop_interrupts_wait(batches):
+    scheduler = ExpiryScheduler(on_expired=batches.put)
+    scheduler.schedule(1, in_seconds(60))
+    scheduler.start()
+
+    scheduler.stop(timeout=1)
+
+    assert batches.empty()
+    assert scheduler.next_deadline() is not None
+
+# ---------------------------------------------------------
+# TESTES ENCERRAMENTO DAS FILAS PELO ReservationService
+# ---------------------------------------------------------
+@pytest.fixture
+def expired_queues(tmp_path, make_dog, make_adopter):
+    """
+    Duas filas expiradas em um banco em arquivo (a thread do agendador usa
+    a própria conexão): a do animal 1 com duas reservas ativas e a do
+    animal 2 apenas com uma reserva cancelada.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'expiry.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = scoped_session(sessionmaker(bind=engine))
+
+    AnimalRepository(session).save_many([make_dog(name=f"Rex {i}") for i in range(2)])
+    AdopterRepository(session).save_many([make_adopter(name=f"Adotante {i}") for i in range(2)])
+
+    reservation_repo = ReservationQueueRepository(session)
+    started = datetime.now() - timedelta(days=30)
+
+    for animal_id, adopter_id, rate in [(1, 1, 60), (1, 2, 90), (2, 1, 70)]:
+        reservation_repo.enqueue(ReservationQueue(
+            animal_id=animal_id, adopter_id=adopter_id, compatibility_rate=rate, timestamp=started
+        ))
+    reservation_repo.cancel_reservation(3)
+
+    service = ReservationService(
+        reservation_repo=reservation_repo,
+        animal_repo=AnimalRepository(session),
+        adopter_repo=AdopterRepository(session),
+        adoption_repo=AdoptionRepository(session)
+    )
+    yield service, session
+
+    service.stop_expiry_scheduler()
+    session.remove()
+    engine.dispose()
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_scheduler_only_releases_empty_queues(expired_queues, indexed):
+    service, session = expired_queues
+    finished = threading.Event()
+
+    if indexed:
+        service.load_queue_index()
+
+    def after_batch():
+        session.remove()
+        finished.set()
+
+    service.start_expiry_scheduler(after_batch=after_batch)
+
+    assert finished.wait(timeout=5)
+
+    # A fila com reservas ativas aguarda a confirmação da adoção
+    assert service.adoption_repo.get_latest_by_animal(1) is None
+    assert service.animal_repo.get_by_id(1).status == AnimalStatus.RESERVED
+    assert len(service.reservation_repo.list_active_queue(1)) == 2
+    assert service.animal_repo.get_by_id(2).status == AnimalStatus.AVAILABLE
@@ -0,0 +1,25 @@
+from infrastructure.database.db_connection import Session
+from infrastructure.repositories import AnimalRepository
+from domain.enums.animal_status import AnimalStatus
+
+# ---------------------------------------------------------
+# TESTES VALIDADORES HTTP
+# ---------------------------------------------------------
+def test_page_is_validated_only_by_etag(client, make_dog):
+    AnimalRepository(Session).save_many([make_dog(name=f"Rex {i}") for i in range(2)])
+    Session.remove()
+
+    first = client.get("/animals")
+    etag = first.headers["ETag"]
+
+    assert "Last-Modified" not in first.headers
+    assert client.get("/animals", headers={"If-None-Match": etag}).status_code == 304
+
+    # Escrita no mesmo segundo da página já enviada
+    AnimalRepository(Session).update_status(1, AnimalStatus.UNADOPTABLE)
+    Session.remove()
+
+    assert client.get("/animals", headers={"If-None-Match": etag}).status_code == 200
+    assert client.get(
+        "/animals", headers={"If-Modified-Since": "Fri, 31 Dec 2100 00:00:00 GMT"}
+    ).status_code == 200
@@ -0,0 +1,116 @@
+import pytest
+from sqlalchemy import event, inspect, text
+
+from infrastructure.database.db_connection import Base, migrate_indexes
+from infrastructure.repositories import (
+    AnimalRepository, AdoptionRepository, EventRepository, ReservationQueueRepository
+)
+from domain.enums.event_type import EventType
+
+# ---------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------
+@pytest.fixture
+def query_plan(engine, db_session):
+    """
+    Executa uma chamada de repositório e retorna o plano de execução
+    (EXPLAIN QUERY PLAN) da última consulta SELECT emitida por ela.
+    """
+    def explain(call) -> str:
+        captured = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("SELECT"):
+                captured.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            call()
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+        statement, parameters = captured[-1]
+        with engine.connect() as conn:
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+
+        return "\n".join(row[-1] for row in rows)
+
+    return explain
+
+# ---------------------------------------------------------
+# TESTES DE USO DOS ÍNDICES
+# ---------------------------------------------------------
+def test_reservable_animals_use_status_index(db_session, query_plan):
+    repo = AnimalRepository(db_session)
+
+    plan = query_plan(repo.list_reservable_animals)
+
+    assert "USING INDEX ix_animals_status" in plan
+
+
+def test_active_queue_uses_composite_index(db_session, query_plan):
+    repo = ReservationQueueRepository(db_session)
+
+    plan = query_plan(lambda: repo.list_active_queue(animal_id=1))
+
+    assert "ix_reservation_queue_animal_active" in plan
+
+
+def test_has_active_reservations_uses_composite_index(db_session, query_plan):
+    repo = ReservationQueueRepository(db_session)
+
+    plan = query_plan(lambda: repo.has_active_reservations(animal_id=1))
+
+    assert "COVERING INDEX ix_reservation_queue_animal_active" in plan
+
+
+def test_events_by_animal_use_index_without_sorting(db_session, query_plan):
+    repo = EventRepository(db_session)
+
+    plan = query_plan(lambda: repo.list_by(animal_id=1))
+
+    assert "USING INDEX ix_events_animal_id_timestamp" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_events_by_type_use_index(db_session, query_plan):
+    repo = EventRepository(db_session)
+
+    plan = query_plan(lambda: repo.list_by(event_type=EventType.VACCINE))
+
+    assert "USING INDEX ix_events_event_type_timestamp" in plan
+
+
+def test_adoptions_by_animal_use_index(db_session, query_plan):
+    repo = AdoptionRepository(db_session)
+
+    plan = query_plan(lambda: repo.get_latest_by_animal(animal_id=1))
+
+    assert "USING INDEX ix_adoptions_animal_id_timestamp" in plan
+
+# ---------------------------------------------------------
+# TESTES DA MIGRAÇÃO
+# ---------------------------------------------------------
+def test_migrate_indexes_creates_missing_indexes_idempotently(engine):
+    expected = {
+        index.name
+        for table in Base.metadata.sorted_tables
+        for index in table.indexes
+    }
+
+    # Simula um banco criado antes dos índices existirem
+    with engine.begin() as conn:
+        for name in expected:
+            conn.execute(text(f"DROP INDEX {name}"))
+
+    migrate_indexes(engine)
+    migrate_indexes(engine)
+
+    inspector = inspect(engine)
+    created = {
+        index["name"]
+        for table in inspector.get_table_names()
+        for index in inspector.get_indexes(table)
+    }
+
+    assert expected <= created
@@ -0,0 +1,174 @@
+import pytest
+from unittest.mock import MagicMock
+
+from services.recommendation_service import RecommendationService
+from domain.enums.adopter_enums import HousingType
+from domain.enums.animal_enums import Size
+from domain.enums.animal_status import AnimalStatus
+from infrastructure.repositories import AnimalRepository
+
+# ---------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------
+@pytest.fixture
+def animal_repo():
+    return MagicMock()
+
+
+@pytest.fixture
+def adopter_repo():
+    return MagicMock()
+
+
+@pytest.fixture
+def service(animal_repo, adopter_repo):
+    return RecommendationService(animal_repo=animal_repo, adopter_repo=adopter_repo)
+
+
+@pytest.fixture
+def animals(make_dog):
+    return [
+        make_dog(name=f"Rex {i}", id=i + 1, size=size, age_months=age, temperament=temperament)
+        for i, (size, age, temperament) in enumerate([
+            (Size.LARGE, 100, ["Agressivo"]),
+            (Size.SMALL, 24, ["Calmo"]),
+            (Size.MEDIUM, 6, ["Arisco"]),
+            (Size.SMALL, 24, ["Dócil"]),
+            (Size.LARGE, 30, ["Calmo"]),
+        ])
+    ]
+
+
+@pytest.fixture
+def adopters(make_adopter):
+    return [
+        make_adopter(name=f"Adotante {i}", id=i + 1, age=age, housing_type=housing,
+                     usable_area=area, has_children_at_home=children)
+        for i, (age, housing, area, children) in enumerate([
+            (25, HousingType.APARTMENT, 20, True),
+            (40, HousingType.HOUSE, 80, False),
+            (70, HousingType.APARTMENT, 40, False),
+        ])
+    ]
+
+def stock(animal_repo, animals) -> None:
+    """Faz o repositório simulado servir os animais como reserváveis."""
+    by_id = {animal.id: animal for animal in animals}
+    animal_repo.list_reservable_features.return_value = [
+        (animal.id, animal.size, animal.age_group(), tuple(animal.temperament))
+        for animal in animals
+    ]
+    animal_repo.get_many.side_effect = lambda ids: {id: by_id[id] for id in ids if id in by_id}
+
+# ---------------------------------------------------------
+# TESTES top_animals_for
+# ---------------------------------------------------------
+def test_top_animals_for_returns_best_first(service, animal_repo, adopter_repo, animals, adopters):
+    adopter = adopters[0]
+    adopter_repo.get_by_id.return_value = adopter
+    stock(animal_repo, animals)
+
+    result = service.top_animals_for(adopter_id=1, k=3)
+
+    expected = sorted(
+        animals,
+        key=lambda a: -service.compatibility_service.calculate_rate(a, adopter)
+    )[:3]
+
+    assert [r["animal"] for r in result] == expected
+    assert [r["compatibility_rate"] for r in result] == sorted(
+        (r["compatibility_rate"] for r in result), reverse=True
+    )
+
+
+def test_top_animals_for_ties_keep_original_order(service, animal_repo, adopter_repo, animals, adopters):
+    adopter_repo.get_by_id.return_value = adopters[1]
+    stock(animal_repo, animals)
+
+    result = service.top_animals_for(adopter_id=2, k=5)
+    small_dogs = [r["animal"].id for r in result if r["animal"].size == Size.SMALL]
+
+    assert small_dogs == [2, 4]
+
+
+def test_top_adopters_for_ties_at_k_boundary_keep_original_order(service, animal_repo, adopter_repo, animals, make_adopter):
+    animal_repo.get_by_id.return_value = animals[0]
+    adopter_repo.list_all.return_value = [make_adopter(name=f"Adotante {i}", id=i) for i in range(200)]
+
+    result = service.top_adopters_for(animal_id=1, k=5)
+
+    assert [r["adopter"].id for r in result] == [0, 1, 2, 3, 4]
+
+
+def test_top_animals_for_reuses_candidates_until_animals_change(animal_repo, adopter_repo, animals, adopters):
+    table_version_repo = MagicMock()
+    table_version_repo.read.return_value = ((1,), None)
+    service = RecommendationService(animal_repo, adopter_repo, table_version_repo=table_version_repo)
+    adopter_repo.get_by_id.return_value = adopters[0]
+    stock(animal_repo, animals)
+
+    first = service.top_animals_for(adopter_id=1, k=3)
+    assert service.top_animals_for(adopter_id=1, k=3) == first
+    assert animal_repo.list_reservable_features.call_count == 1
+
+    stock(animal_repo, animals[:2])
+    table_version_repo.read.return_value = ((2,), None)
+
+    assert {r["animal"].id for r in service.top_animals_for(adopter_id=1, k=3)} == {1, 2}
+    assert animal_repo.list_reservable_features.call_count == 2
+
+
+def test_top_animals_for_unknown_adopter(service, adopter_repo):
+    adopter_repo.get_by_id.return_value = None
+
+    with pytest.raises(ValueError):
+        service.top_animals_for(adopter_id=99)
+
+
+def test_top_animals_for_without_candidates(service, animal_repo, adopter_repo, adopters):
+    adopter_repo.get_by_id.return_value = adopters[0]
+    stock(animal_repo, [])
+
+    assert service.top_animals_for(adopter_id=1) == []
+
+# ---------------------------------------------------------
+# TESTES top_adopters_for
+# ---------------------------------------------------------
+def test_top_adopters_for_limits_k(service, animal_repo, adopter_repo, animals, adopters):
+    animal = animals[0]
+    animal_repo.get_by_id.return_value = animal
+    adopter_repo.list_all.return_value = adopters
+
+    result = service.top_adopters_for(animal_id=1, k=2)
+    best = max(adopters, key=lambda a: service.compatibility_service.calculate_rate(animal, a))
+
+    assert len(result) == 2
+    assert result[0]["adopter"] is best
+
+
+def test_top_adopters_for_k_is_bounded(service, animal_repo, adopter_repo, animals, adopters):
+    animal_repo.get_by_id.return_value = animals[0]
+    adopter_repo.list_all.return_value = adopters * 30
+
+    assert len(service.top_adopters_for(animal_id=1, k=1000)) == service.MAX_K
+    assert len(service.top_adopters_for(animal_id=1, k=0)) == 1
+
+
+def test_top_adopters_for_unknown_animal(service, animal_repo):
+    animal_repo.get_by_id.return_value = None
+
+    with pytest.raises(ValueError):
+        service.top_adopters_for(animal_id=99)
+
+
+def test_reservable_features_match_entities(db_session, make_dog):
+    repo = AnimalRepository(db_session)
+    repo.save_many([
+        make_dog(name=f"Rex {age}", age_months=age, temperament=["Arisco", "Calmo"])
+        for age in (11, 12, 79, 80)
+    ])
+    repo.update_status(2, AnimalStatus.UNADOPTABLE)
+
+    assert repo.list_reservable_features() == [
+        (a.id, a.size, a.age_group(), tuple(a.temperament)) for a in repo.list_reservable_animals()
+    ]
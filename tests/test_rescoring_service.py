@@ -0,0 +1,126 @@
+import pytest
+from dataclasses import replace
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure.repositories import (
+    AnimalRepository, AdopterRepository, ReservationQueueRepository, AdoptionRepository,
+    TableVersionRepository
+)
+from services.compatibility_service import CompatibilityService
+from services.rescoring_service import RescoringService
+from services.reservation_service import ReservationService
+from config import settings
+from domain.adoptions.reservation_queue import ReservationQueue
+
+# ---------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------
+@pytest.fixture
+def reservation_repo(db_session, make_dog, make_adopter):
+    """Três animais e dois adotantes com reservas cruzadas e taxas atuais."""
+    animal_repo = AnimalRepository(db_session)
+    adopter_repo = AdopterRepository(db_session)
+    repo = ReservationQueueRepository(db_session)
+    compatibility = CompatibilityService()
+
+    for i in range(3):
+        animal_repo.save(make_dog(name=f"Rex {i}", age_months=12 * (1 + 5 * i)))
+    adopter_repo.save(make_adopter(name="Alice", has_other_animals=True))
+    adopter_repo.save(make_adopter(name="Bruno", has_other_animals=False))
+
+    for animal_id in (1, 2, 3):
+        for adopter_id in (1, 2):
+            rate = compatibility.calculate_rate(
+                animal_repo.get_by_id(animal_id), adopter_repo.get_by_id(adopter_id)
+            )
+            repo.save(ReservationQueue(
+                animal_id=animal_id, adopter_id=adopter_id, compatibility_rate=rate
+            ))
+
+    repo.cancel_reservation(5)
+    return repo
+
+
+@pytest.fixture
+def retuned():
+    """Serviço de compatibilidade que deixa de pontuar a presença de outros animais."""
+    service = CompatibilityService()
+    scores = dict(settings.compatibility_scores, has_other_animals={"true": 0, "false": 100})
+    service.load_settings(replace(settings.current, compatibility_scores=scores))
+    return service
+
+
+def rates(repo) -> dict[int, float]:
+    return {r.id: r.compatibility_rate for r in repo.list_all()}
+
+# ---------------------------------------------------------
+# TESTES
+# ---------------------------------------------------------
+def test_unchanged_settings_do_not_write(reservation_repo, statements):
+    report = RescoringService(reservation_repo).rescore_active_queues()
+
+    assert (report.scanned, report.changed) == (5, 0)
+    assert not any(s.startswith("UPDATE") for s in statements)
+
+
+def test_rescore_updates_stale_rates_in_one_statement_per_batch(reservation_repo, retuned, statements):
+    before = rates(reservation_repo)
+
+    report = RescoringService(reservation_repo, retuned).rescore_active_queues(batch_size=2)
+    after = rates(reservation_repo)
+
+    # Apenas as reservas ativas do adotante 1 (que possui outros animais) mudam
+    assert (report.scanned, report.changed, report.batches) == (5, 2, 3)
+    assert [i for i in after if after[i] != before[i]] == [1, 3]
+    assert after[1] < before[1]
+
+    updates = [s for s in statements if s.startswith("UPDATE reservation_queue")]
+    assert len(updates) == 2    # Lotes {1, 2} e {3, 4}; o lote {6} não muda
+
+    # Uma segunda execução não encontra mais diferenças
+    assert RescoringService(reservation_repo, retuned).rescore_active_queues().changed == 0
+
+
+def test_dry_run_reports_diff_without_writing(reservation_repo, retuned):
+    before = rates(reservation_repo)
+
+    report = RescoringService(reservation_repo, retuned).rescore_active_queues(dry_run=True)
+
+    assert rates(reservation_repo) == before
+    assert [(c.reservation_id, c.animal_id, c.adopter_id) for c in report.changes] == [
+        (1, 1, 1), (3, 2, 1)
+    ]
+    assert all(c.old_rate == before[c.reservation_id] and c.delta < 0 for c in report.changes)
+
+
+def test_invalid_batch_size_raises(reservation_repo):
+    with pytest.raises(ValueError):
+        RescoringService(reservation_repo).rescore_active_queues(batch_size=0)
+
+
+def test_running_application_sees_rescored_queues(reservation_repo, db_session, engine):
+    service = ReservationService(
+        reservation_repo=reservation_repo,
+        animal_repo=AnimalRepository(db_session),
+        adopter_repo=AdopterRepository(db_session),
+        adoption_repo=AdoptionRepository(db_session),
+        table_version_repo=TableVersionRepository(db_session)
+    )
+    service.load_queue_index()
+    assert service.queue_index.head(1).adopter_id == 2
+
+    # Passa a favorecer quem já tem outros animais (Alice)
+    compatibility = CompatibilityService()
+    scores = dict(settings.compatibility_scores, has_other_animals={"true": 100, "false": 0})
+    compatibility.load_settings(replace(settings.current, compatibility_scores=scores))
+
+    # O job roda em outro processo, com a própria sessão
+    job_session = sessionmaker(bind=engine)()
+    RescoringService(ReservationQueueRepository(job_session), compatibility).rescore_active_queues()
+    job_session.close()
+
+    # Próxima requisição da aplicação: a leitura do índice confere o contador
+    db_session.rollback()
+    service.get_queue_ending_time(1)
+
+    assert service.queue_index.head(1).adopter_id == 1
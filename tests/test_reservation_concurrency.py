@@ -0,0 +1,214 @@
+import random
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker, scoped_session
+
+from infrastructure.database.db_connection import Base, apply_storage_profile, migrate_columns
+from infrastructure.repositories import (
+    AnimalRepository, AdopterRepository, ReservationQueueRepository, AdoptionRepository
+)
+from services.reservation_service import ReservationService
+from services.animal_service import AnimalService
+from domain.adoptions.reservation_queue import ReservationQueue
+from domain.enums.animal_status import AnimalStatus
+from domain.exceptions import InvalidStatusTransitionError
+
+ANIMALS = 20
+ADOPTERS = 50
+
+# ---------------------------------------------------------
+# COMPARE-AND-SWAP E MIGRAÇÃO
+# ---------------------------------------------------------
+def test_compare_and_set_status_rejects_stale_version(db_session, make_dog):
+    repo = AnimalRepository(db_session)
+    repo.save(make_dog())
+
+    status, version = repo.get_status_version(1)
+
+    assert repo.compare_and_set_status(1, version, AnimalStatus.RESERVED)
+    assert not repo.compare_and_set_status(1, version, AnimalStatus.AVAILABLE)
+    assert repo.get_status_version(1) == (AnimalStatus.RESERVED, version + 1)
+
+
+def test_update_status_bumps_version(db_session, make_dog):
+    repo = AnimalRepository(db_session)
+    repo.save(make_dog())
+
+    repo.update_status(id=1, new_status=AnimalStatus.RESERVED)
+    repo.update_status(id=1, new_status=AnimalStatus.AVAILABLE)
+
+    assert repo.get_status_version(1) == (AnimalStatus.AVAILABLE, 2)
+
+
+def test_enqueue_rejects_unavailable_animal(db_session, make_dog, make_adopter):
+    AnimalRepository(db_session).save(make_dog(status=AnimalStatus.ADOPTED))
+    AdopterRepository(db_session).save(make_adopter())
+    repo = ReservationQueueRepository(db_session)
+
+    with pytest.raises(InvalidStatusTransitionError):
+        repo.enqueue(ReservationQueue(animal_id=1, adopter_id=1, compatibility_rate=50))
+
+    assert not repo.has_active_reservations(1)
+
+
+def test_update_does_not_revert_concurrent_reservation(engine, db_session, make_dog, make_adopter):
+    animal_repo = AnimalRepository(db_session)
+    animal_repo.save(make_dog())
+    AdopterRepository(db_session).save(make_adopter())
+
+    # Outra requisição reserva o animal logo depois da leitura feita pelo update
+    other_session = sessionmaker(bind=engine)()
+    read = animal_repo.get_by_id
+
+    def get_by_id(id):
+        animal = read(id)
+        ReservationQueueRepository(other_session).enqueue(
+            ReservationQueue(animal_id=id, adopter_id=1, compatibility_rate=50)
+        )
+        return animal
+
+    animal_repo.get_by_id = get_by_id
+    updated = AnimalService(animal_repo, event_repo=None).update(1, name="Thor")
+    other_session.close()
+
+    assert updated.status == AnimalStatus.AVAILABLE     # Lido antes da reserva
+    assert animal_repo.get_status_version(1) == (AnimalStatus.RESERVED, 1)
+    assert read(1).name == "Thor"
+
+
+def test_status_writes_on_missing_animal_raise_value_error(db_session, make_dog, make_adopter):
+    AnimalRepository(db_session).save(make_dog())
+    AdopterRepository(db_session).save(make_adopter())
+    AnimalRepository(db_session).delete_by(1)
+
+    with pytest.raises(ValueError, match="Animal não encontrado"):
+        AnimalRepository(db_session).update_status(id=1, new_status=AnimalStatus.RESERVED)
+
+    with pytest.raises(ValueError, match="Animal não encontrado"):
+        ReservationQueueRepository(db_session).enqueue(
+            ReservationQueue(animal_id=1, adopter_id=1, compatibility_rate=50)
+        )
+
+
+def test_update_missing_animal_returns_false(db_session, make_dog):
+    assert AnimalRepository(db_session).update(make_dog(id=99)) is False
+
+
+def test_migrate_columns_adds_version_to_existing_table():
+    engine = create_engine("sqlite://")
+
+    Base.metadata.create_all(bind=engine)
+
+    # Banco criado antes da coluna de versão
+    with engine.begin() as conn:
+        conn.exec_driver_sql("ALTER TABLE animals DROP COLUMN version")
+        conn.exec_driver_sql(
+            "INSERT INTO animals (species, breed, name, gender, age_months, size, "
+            "status, temperament, timestamp) VALUES ('DOG', 'SRD', 'Rex', 'MALE', 12, "
+            "'MEDIUM', 'AVAILABLE', '[]', '2024-01-01 00:00:00')"
+        )
+
+    migrate_columns(engine)
+    migrate_columns(engine)    # Idempotente
+
+    columns = {c["name"] for c in inspect(engine).get_columns("animals")}
+    assert "version" in columns
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT version FROM animals")).scalar() == 0
+
+# ---------------------------------------------------------
+# TESTE DE ESTRESSE (RESERVAS CONCORRENTES)
+# ---------------------------------------------------------
+@pytest.fixture
+def concurrent_service(tmp_path, make_dog, make_adopter):
+    engine = create_engine(f"sqlite:///{tmp_path / 'stress.db'}", pool_size=16, max_overflow=0)
+    apply_storage_profile(engine, {
+        "enabled": True,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 0,
+        "cache_size": -2000,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000
+    })
+    Base.metadata.create_all(bind=engine)
+
+    # Uma sessão por thread, como nas requisições do Flask
+    session = scoped_session(sessionmaker(bind=engine))
+
+    animal_repo = AnimalRepository(session)
+    adopter_repo = AdopterRepository(session)
+    animal_repo.save_many([make_dog(name=f"Rex {i}") for i in range(ANIMALS)])
+    adopter_repo.save_many([make_adopter(name=f"Adotante {i}") for i in range(ADOPTERS)])
+
+    service = ReservationService(
+        reservation_repo=ReservationQueueRepository(session),
+        animal_repo=animal_repo,
+        adopter_repo=adopter_repo,
+        adoption_repo=AdoptionRepository(session)
+    )
+    yield service, session
+
+    session.remove()
+    engine.dispose()
+
+
+def test_concurrent_reservations_keep_status_and_queues_consistent(concurrent_service):
+    service, session = concurrent_service
+    rng = random.Random(15)
+
+    pairs = [(a, b) for a in range(1, ANIMALS + 1) for b in range(1, ADOPTERS + 1)]
+    rng.shuffle(pairs)
+    assert len(pairs) == 1000
+
+    def reserve(pair):
+        try:
+            service.create_reservation(animal_id=pair[0], adopter_id=pair[1])
+            return True
+        except ValueError:
+            return False
+        finally:
+            session.remove()
+
+    def cancel(reservation_id):
+        try:
+            service.cancel_reservation(reservation_id)
+        finally:
+            session.remove()
+
+    # Reservas duplicadas disputam o mesmo par e apenas uma pode vencer
+    requests = pairs + rng.sample(pairs, 100)
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(reserve, requests))
+
+    assert sum(results) == len(pairs)
+
+    # Cancela todas as reservas de metade dos animais e parte das demais
+    reservation_ids = [r.id for r in service.reservation_repo.iter_all()]
+    released_animals = set(range(1, ANIMALS + 1, 2))
+    to_cancel = [
+        r.id for r in service.reservation_repo.iter_all()
+        if r.animal_id in released_animals or rng.random() < 0.2
+    ]
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(cancel, to_cancel))
+
+    session.remove()
+    remaining = list(service.reservation_repo.iter_all())
+    active = {r.id for r in remaining if not r.is_canceled}
+
+    assert active == set(reservation_ids) - set(to_cancel)
+
+    for animal_id in range(1, ANIMALS + 1):
+        has_queue = service.reservation_repo.has_active_reservations(animal_id)
+        status = service.animal_repo.get_by_id(animal_id).status
+
+        assert status == (AnimalStatus.RESERVED if has_queue else AnimalStatus.AVAILABLE)
+
+        if animal_id in released_animals:
+            assert not has_queue
+            assert not any(r.animal_id == animal_id for r in remaining)
@@ -155,11 +155,8 @@ def test_reservation_same_compatibility_older_first():
 # ---------------------------------------------------------
 # TESTES DE EXPIRAÇÃO
 # ---------------------------------------------------------
-def test_reservation_not_expired(monkeypatch):
-    monkeypatch.setattr(
-        "domain.adoptions.reservation_queue.duration_hours",
-        2
-    )
+def test_reservation_not_expired(override_settings):
+    override_settings(reservation_duration=timedelta(hours=2))
 
     rq = ReservationQueue(
         animal_id=1,
@@ -171,11 +168,8 @@ def test_reservation_not_expired(monkeypatch):
     assert rq.check_expiration() is False
 
 
-def test_reservation_expired(monkeypatch):
-    monkeypatch.setattr(
-        "domain.adoptions.reservation_queue.duration_hours",
-        1
-    )
+def test_reservation_expired(override_settings):
+    override_settings(reservation_duration=timedelta(hours=1))
 
     past_time = datetime.now(timezone.utc) - timedelta(hours=2)
 
@@ -0,0 +1,223 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure.repositories import (
+    AnimalRepository, AdopterRepository, ReservationQueueRepository, AdoptionRepository,
+    TableVersionRepository
+)
+from services.reservation_queue_index import ReservationQueueIndex
+from services.reservation_service import ReservationService
+from config import settings
+from domain.adoptions.reservation_queue import ReservationQueue
+from domain.enums.animal_status import AnimalStatus
+
+START = datetime(2024, 1, 1)
+
+def reservation(id, animal_id=1, rate=50, minutes=0, is_canceled=False):
+    return ReservationQueue(
+        id=id,
+        animal_id=animal_id,
+        adopter_id=id,
+        compatibility_rate=rate,
+        is_canceled=is_canceled,
+        timestamp=START + timedelta(minutes=minutes)
+    )
+
+# ---------------------------------------------------------
+# TESTES DO ÍNDICE
+# ---------------------------------------------------------
+def test_head_follows_reservation_order():
+    rng = random.Random(7)
+    reservations = [
+        reservation(i, rate=rng.choice([40, 60, 80]), minutes=rng.randint(0, 30))
+        for i in range(1, 41)
+    ]
+    index = ReservationQueueIndex()
+    index.rebuild(reservations)
+
+    expected = sorted(reservations)    # Using __lt__
+    heads = []
+    for _ in expected:
+        head = index.head(1)
+        heads.append(head)
+        index.discard(head)
+
+    assert heads == expected
+    assert index.head(1) is None
+    assert index.size(1) == 0
+
+
+def test_discard_is_lazy_and_idempotent():
+    index = ReservationQueueIndex()
+    index.rebuild([reservation(1, rate=90), reservation(2, rate=70), reservation(3, rate=80)])
+
+    index.discard(reservation(1))
+    index.discard(reservation(1))
+
+    assert index.size(1) == 2
+    assert index.head(1).id == 3
+
+
+def test_rebuild_skips_canceled_but_keeps_queue_start():
+    index = ReservationQueueIndex()
+    index.rebuild([
+        reservation(1, minutes=0, is_canceled=True),
+        reservation(2, minutes=10),
+        reservation(3, animal_id=2, minutes=5),
+    ])
+
+    assert index.size(1) == 1
+    assert index.head(1).id == 2
+    assert index.started_at(1) == START
+    assert index.started_at(2) == START + timedelta(minutes=5)
+
+
+def test_push_and_clear():
+    index = ReservationQueueIndex()
+    index.push(reservation(1, rate=60, minutes=5))
+    index.push(reservation(2, rate=60, minutes=1))
+
+    assert index.head(1).id == 2
+    assert index.started_at(1) == START + timedelta(minutes=1)
+
+    index.clear(1)
+
+    assert index.size(1) == 0
+    assert index.head(1) is None
+    assert index.started_at(1) is None
+
+# ---------------------------------------------------------
+# TESTES DE INTEGRAÇÃO COM O ReservationService
+# ---------------------------------------------------------
+@pytest.fixture
+def service(db_session, make_dog, make_adopter):
+    animal_repo = AnimalRepository(db_session)
+    adopter_repo = AdopterRepository(db_session)
+
+    for i in range(2):
+        animal_repo.save(make_dog(name=f"Rex {i}"))
+    for i in range(4):
+        adopter_repo.save(make_adopter(name=f"Adotante {i}", age=20 + 15 * i))
+
+    service = ReservationService(
+        reservation_repo=ReservationQueueRepository(db_session),
+        animal_repo=animal_repo,
+        adopter_repo=adopter_repo,
+        adoption_repo=AdoptionRepository(db_session)
+    )
+    service.load_queue_index()
+    return service
+
+
+def test_index_stays_in_sync_with_database(service):
+    for adopter_id in range(1, 5):
+        service.create_reservation(animal_id=1, adopter_id=adopter_id)
+    service.create_reservation(animal_id=2, adopter_id=1)
+
+    head = service.queue_index.head(1)
+    service.cancel_reservation(head.id)
+
+    for animal_id in (1, 2):
+        queue = service.reservation_repo.list_active_queue(animal_id)
+        assert service.queue_index.size(animal_id) == len(queue)
+        assert service.queue_index.head(animal_id).id == queue[0].id
+
+    rebuilt = ReservationQueueIndex()
+    rebuilt.rebuild(service.reservation_repo.iter_all())
+    assert rebuilt.head(1).id == service.queue_index.head(1).id
+
+
+def test_status_change_is_committed(service, db_session):
+    service.create_reservation(animal_id=1, adopter_id=1)
+
+    # A sessão da requisição é descartada ao fim dela (Session.remove)
+    db_session.rollback()
+
+    assert service.animal_repo.get_by_id(1).status == AnimalStatus.RESERVED
+
+
+def test_cancel_last_reservation_clears_index(service):
+    service.create_reservation(animal_id=1, adopter_id=1)
+
+    service.cancel_reservation(service.queue_index.head(1).id)
+
+    assert service.queue_index.started_at(1) is None
+    assert service.get_queue_ending_time(1) is None
+    assert service.animal_repo.get_by_id(1).status == AnimalStatus.AVAILABLE
+
+
+def test_confirm_adoption_clears_index(service):
+    service.create_reservation(animal_id=1, adopter_id=1)
+
+    service.confirm_adoption(service.queue_index.head(1).id)
+
+    assert service.queue_index.size(1) == 0
+    assert service.queue_index.head(1) is None
+
+
+def test_finalize_queue_reads_only_the_index(service, statements, monkeypatch):
+    service.create_reservation(animal_id=1, adopter_id=1)
+    service.create_reservation(animal_id=1, adopter_id=2)
+    expected = service.reservation_repo.list_active_queue(1)[0]
+
+    later = datetime.now() + settings.reservation_duration + timedelta(seconds=1)
+    monkeypatch.setattr(
+        "services.reservation_service.datetime",
+        type("FrozenDatetime", (datetime,), {"now": staticmethod(lambda: later)})
+    )
+    statements.clear()
+
+    selected = service.finalize_queue(animal_id=1)
+
+    assert selected.id == expected.id
+    assert statements == []
+
+
+# ---------------------------------------------------------
+# TESTES DE ATUALIZAÇÃO PELO CONTADOR DE ALTERAÇÕES
+# ---------------------------------------------------------
+@pytest.fixture
+def versioned_service(service, db_session):
+    service.table_version_repo = TableVersionRepository(db_session)
+    service.load_queue_index()
+    return service
+
+
+@pytest.fixture
+def other_process(engine):
+    """Repositório de reservas com sessão própria, como o de outro worker ou job."""
+    session = sessionmaker(bind=engine)()
+    yield ReservationQueueRepository(session)
+    session.close()
+
+
+def test_own_writes_do_not_rebuild_index(versioned_service, monkeypatch):
+    for adopter_id in (1, 2, 3):
+        versioned_service.create_reservation(animal_id=1, adopter_id=adopter_id)
+    versioned_service.cancel_reservation(versioned_service.queue_index.head(1).id)
+
+    def rebuild():
+        raise AssertionError("índice reconstruído")
+
+    monkeypatch.setattr(versioned_service.reservation_repo, "iter_all", rebuild)
+
+    versioned_service.get_queue_ending_time(1)
+    assert versioned_service.queue_index.size(1) == 2
+
+
+def test_writes_from_another_process_rebuild_index(versioned_service, other_process, db_session):
+    versioned_service.create_reservation(animal_id=1, adopter_id=1)
+    versioned_service.create_reservation(animal_id=1, adopter_id=2)
+    first, second = versioned_service.reservation_repo.list_active_queue(1)
+
+    # A sessão da requisição é descartada ao fim dela (Session.remove)
+    db_session.rollback()
+
+    # Outro processo reabre a fila do animal 2 e recalcula as taxas (rescore_queues)
+    other_process.enqueue(ReservationQueue(animal_id=2, adopter_id=3, compatibility_rate=50))
+    other_process.update_compatibility_rates([(first.id, 0)])
+
+    assert versioned_service.get_queue_ending_time(2) > datetime.now()
+    assert versioned_service.queue_index.head(1).id == second.id
@@ -0,0 +1,130 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure.database.db_connection import Base
+from infrastructure.db_models import (
+    adopter_model,
+    animal_model,
+    adoption_model,
+    reservation_queue_model,
+    adoption_return_model,
+    event_model
+)
+from infrastructure.repositories import (
+    AnimalRepository, AdopterRepository, ReservationQueueRepository
+)
+from domain.animals.dog import Dog
+from domain.people.adopter import Adopter, HousingType
+from domain.adoptions.reservation_queue import ReservationQueue
+from domain.enums.animal_enums import Species, Gender, Size
+from domain.enums.animal_status import AnimalStatus
+
+# ---------------------------------------------------------
+# FIXTURES (BANCO SQLITE EM MEMÓRIA)
+# ---------------------------------------------------------
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+@pytest.fixture
+def session(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def statements(engine):
+    """Registra todas as instruções SQL executadas no engine."""
+    executed = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield executed
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def populate(session, n_queues: int, reservations_per_queue: int = 3):
+    animal_repo = AnimalRepository(session)
+    adopter_repo = AdopterRepository(session)
+    reservation_repo = ReservationQueueRepository(session)
+    now = datetime.now()
+
+    for i in range(reservations_per_queue):
+        adopter_repo.save(Adopter(
+            name=f"Adotante {i}",
+            age=30 + i,
+            housing_type=HousingType.HOUSE,
+            usable_area=60,
+            has_pet_experience=True,
+            has_children_at_home=False,
+            has_other_animals=False,
+            timestamp=now
+        ))
+
+    for a in range(n_queues):
+        animal_repo.save(Dog(
+            species=Species.DOG,
+            breed="Vira-lata",
+            name=f"Rex {a}",
+            gender=Gender.MALE,
+            age_months=12,
+            size=Size.MEDIUM,
+            temperament=["Calmo"],
+            status=AnimalStatus.RESERVED,
+            needs_walk=True,
+            timestamp=now
+        ))
+
+        for i in range(reservations_per_queue):
+            reservation_repo.save(ReservationQueue(
+                animal_id=a + 1,
+                adopter_id=i + 1,
+                compatibility_rate=50 + i,
+                timestamp=now - timedelta(minutes=i)
+            ))
+
+    return reservation_repo
+
+# ---------------------------------------------------------
+# TESTES list_active_with_parties
+# ---------------------------------------------------------
+def test_list_active_with_parties_skips_canceled(session):
+    reservation_repo = populate(session, n_queues=2)
+    reservation_repo.cancel_reservation(1)
+
+    rows = reservation_repo.list_active_with_parties()
+
+    assert len(rows) == 5
+    assert all(not r.is_canceled for r, _, _ in rows)
+    assert all(r.animal_id == animal.id for r, animal, _ in rows)
+    assert all(r.adopter_id == adopter.id for r, _, adopter in rows)
+
+
+def test_list_active_with_parties_reuses_domain_objects(session):
+    reservation_repo = populate(session, n_queues=2)
+
+    rows = reservation_repo.list_active_with_parties()
+    animals_by_id = {}
+
+    for _, animal, _ in rows:
+        assert animals_by_id.setdefault(animal.id, animal) is animal
+
+
+@pytest.mark.parametrize("n_queues", [1, 5, 25])
+def test_list_active_with_parties_statement_count_is_constant(session, statements, n_queues):
+    reservation_repo = populate(session, n_queues=n_queues)
+    session.expire_all()
+    statements.clear()
+
+    rows = reservation_repo.list_active_with_parties()
+
+    assert len(rows) == n_queues * 3
+    assert len(statements) == 1
@@ -0,0 +1,216 @@
+import pytest
+import random
+from datetime import datetime, timedelta
+from sqlalchemy import text
+
+from infrastructure.database.db_connection import Base
+from infrastructure.repositories import (
+    AnimalRepository, AdopterRepository, ReservationQueueRepository
+)
+from domain.adoptions.reservation_queue import ReservationQueue
+from domain.adoptions.queue_stats import QueueStats
+
+NOW = datetime.now()
+
+# ---------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------
+@pytest.fixture
+def repo(db_session, make_dog, make_adopter):
+    """Dois animais disponíveis e três adotantes, sem reservas."""
+    AnimalRepository(db_session).save_many([make_dog(name=f"Rex {i}") for i in range(2)])
+    AdopterRepository(db_session).save_many([make_adopter(name=f"Adotante {i}") for i in range(3)])
+    return ReservationQueueRepository(db_session)
+
+
+def reserve(repo, animal_id: int, adopter_id: int, rate: float, hours_ago: float = 0) -> ReservationQueue:
+    reservation, _ = repo.enqueue(ReservationQueue(
+        animal_id=animal_id,
+        adopter_id=adopter_id,
+        compatibility_rate=rate,
+        timestamp=NOW - timedelta(hours=hours_ago)
+    ))
+    return reservation
+
+
+def summary(stats: QueueStats | None) -> tuple | None:
+    if stats is None:
+        return None
+    return stats.active_count, stats.best_compatibility_rate, stats.first_timestamp
+
+# ---------------------------------------------------------
+# TESTES MANUTENÇÃO PELAS ESCRITAS
+# ---------------------------------------------------------
+def test_enqueue_updates_stats(repo):
+    assert repo.get_queue_stats(1) is None
+
+    reserve(repo, 1, 1, 60, hours_ago=2)
+    reserve(repo, 1, 2, 80, hours_ago=1)
+
+    assert summary(repo.get_queue_stats(1)) == (2, 80, NOW - timedelta(hours=2))
+    assert repo.get_queue_stats(2) is None
+
+
+def test_cancel_keeps_queue_start(repo):
+    first = reserve(repo, 1, 1, 90, hours_ago=2)
+    reserve(repo, 1, 2, 70, hours_ago=1)
+
+    repo.cancel_reservation(first.id)
+
+    # A fila continua começando na primeira reserva, mesmo cancelada
+    assert summary(repo.get_queue_stats(1)) == (1, 70, NOW - timedelta(hours=2))
+
+
+def test_all_canceled_queue_has_no_best_rate(repo):
+    reserve(repo, 1, 1, 90)
+    repo.cancel_reservation(1)
+
+    assert summary(repo.get_queue_stats(1)) == (0, None, NOW)
+
+
+def test_cancel_and_release_removes_stats(repo):
+    reserve(repo, 1, 1, 90)
+
+    _, released = repo.cancel_and_release(1)
+
+    assert released is True
+    assert repo.get_queue_stats(1) is None
+
+
+def test_rescoring_and_clear_queue(repo):
+    reserve(repo, 1, 1, 50)
+    reserve(repo, 1, 2, 60)
+    reserve(repo, 2, 1, 40)
+
+    repo.update_compatibility_rates([(1, 95), (3, 45)])
+
+    assert repo.get_queue_stats(1).best_compatibility_rate == 95
+    assert repo.get_queue_stats(2).best_compatibility_rate == 45
+
+    repo.clear_queue(1)
+
+    assert [stats.animal_id for stats in repo.list_queue_stats()] == [2]
+
+
+def test_rescoring_keeps_best_rate(repo):
+    for adopter_id, rate in ((1, 80), (2, 80), (3, 50)):
+        reserve(repo, 1, adopter_id, rate)
+
+    # Empate: a outra reserva continua com a maior taxa
+    repo.update_compatibility_rates([(1, 10)])
+    assert repo.get_queue_stats(1).best_compatibility_rate == 80
+
+    repo.update_compatibility_rates([(2, 20)])
+    assert repo.get_queue_stats(1).best_compatibility_rate == 50
+
+    repo.update_compatibility_rates([(3, 90)])
+    assert repo.get_queue_stats(1).best_compatibility_rate == 90
+
+    # Reservas canceladas não contam, mesmo com taxa maior
+    repo.cancel_reservation(3)
+    repo.update_compatibility_rates([(3, 100)])
+    assert repo.get_queue_stats(1).best_compatibility_rate == 20
+    assert repo.check_queue_stats() == []
+
+
+def test_inherited_writes_update_stats(repo):
+    repo.save(ReservationQueue(animal_id=1, adopter_id=1, compatibility_rate=70, timestamp=NOW))
+    reservation = repo.get_by_id(1)
+    reservation.compatibility_rate = 20
+    repo.update(reservation)
+
+    assert repo.get_queue_stats(1).best_compatibility_rate == 20
+
+    repo.delete_by(1)
+
+    assert repo.get_queue_stats(1) is None
+    assert repo.check_queue_stats() == []
+
+
+def test_random_writes_match_stats_from_scratch(repo):
+    rng = random.Random(25)
+    pairs = [(animal_id, adopter_id) for animal_id in (1, 2) for adopter_id in (1, 2, 3)]
+
+    for _ in range(40):
+        animal_id, adopter_id = rng.choice(pairs)
+        reservation = ReservationQueue(
+            animal_id=animal_id, adopter_id=adopter_id, compatibility_rate=rng.randint(0, 100),
+            is_canceled=rng.random() < 0.3, timestamp=NOW - timedelta(minutes=rng.randint(0, 60))
+        )
+        existing = repo.session.query(repo.model_class.id).filter_by(
+            animal_id=animal_id, adopter_id=adopter_id
+        ).scalar()
+
+        if existing is None:
+            repo.save(reservation)
+        elif rng.random() < 0.5:
+            repo.delete_by(existing)
+        else:
+            repo.update_compatibility_rates([(existing, reservation.compatibility_rate)])
+
+        assert repo.check_queue_stats() == []
+
+# ---------------------------------------------------------
+# TESTES LEITURAS
+# ---------------------------------------------------------
+def test_deadline_follows_configured_duration(repo, override_settings):
+    reserve(repo, 1, 1, 50, hours_ago=3)
+    stats = repo.get_queue_stats(1)
+
+    override_settings(reservation_duration=timedelta(hours=4))
+    assert stats.deadline == NOW + timedelta(hours=1)
+    assert stats.is_expired() is False
+
+    override_settings(reservation_duration=timedelta(hours=2))
+    assert stats.is_expired() is True
+
+
+def test_expiry_reads_queue_start(repo):
+    first = reserve(repo, 1, 1, 50, hours_ago=30)
+    reserve(repo, 1, 2, 60, hours_ago=1)
+    reserve(repo, 2, 3, 70, hours_ago=1)
+    repo.cancel_reservation(first.id)
+
+    assert repo.is_queue_expired(1, 24) is True
+    assert repo.is_queue_expired(2, 24) is False
+    assert [bid[:3] for bid in repo.list_expired_bids(24)] == [(2, 1, 2)]
+    assert dict(repo.list_queue_starts()) == {
+        1: NOW - timedelta(hours=30), 2: NOW - timedelta(hours=1)
+    }
+
+# ---------------------------------------------------------
+# TESTES CONFERÊNCIA E RECONSTRUÇÃO
+# ---------------------------------------------------------
+def test_check_and_rebuild(engine, repo):
+    reserve(repo, 1, 1, 50)
+    reserve(repo, 2, 2, 60)
+
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE reservation_queue_stats SET active_count = 5 WHERE animal_id = 1"))
+        conn.execute(text("DELETE FROM reservation_queue_stats WHERE animal_id = 2"))
+
+    assert repo.check_queue_stats() == [1, 2]
+
+    repo.rebuild_queue_stats()
+
+    assert repo.check_queue_stats() == []
+    assert summary(repo.get_queue_stats(1)) == (1, 50, NOW)
+
+
+def test_stats_are_built_for_existing_queues(engine, repo):
+    reserve(repo, 1, 1, 50)
+
+    # Simula um banco criado antes das estatísticas existirem
+    with engine.begin() as conn:
+        for name in ("insert", "delete", "rate", "change", "move"):
+            conn.execute(text(f"DROP TRIGGER reservation_queue_stats_{name}"))
+        conn.execute(text("DROP TABLE reservation_queue_stats"))
+
+    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    assert summary(repo.get_queue_stats(1)) == (1, 50, NOW)
+
+    reserve(repo, 1, 2, 90)
+    assert repo.get_queue_stats(1).best_compatibility_rate == 90
+
@@ -3,9 +3,12 @@ from unittest.mock import MagicMock
 from datetime import datetime, timedelta
 
 from services.reservation_service import ReservationService
+from config import settings
 from domain.adoptions.reservation_queue import ReservationQueue
+from domain.adoptions.queue_stats import QueueStats
 from domain.enums.animal_status import AnimalStatus
 from domain.adoptions.adoption import Adoption
+from domain.exceptions import InvalidStatusTransitionError
 
 # ---------------------------------------------------------
 # FIXTURES DE REPOSITÓRIOS MOCKADOS
@@ -63,15 +66,25 @@ def test_list_reservations_groups_finished_and_ongoing(
         timestamp=now - timedelta(hours=4)
     )
 
-    reservation_repo.list_all.return_value = [r1, r2]
-    animal_repo.get_by_id.return_value = MagicMock()
-    adopter_repo.get_by_id.return_value = MagicMock()
+    animal = MagicMock()
+    reservation_repo.list_active_with_parties.return_value = [
+        (r2, animal, "adopter_101"),
+        (r1, animal, "adopter_100"),
+    ]
 
     result = service.list_reservations()
 
     assert "finished" in result
     assert "ongoing" in result
 
+    queue = result["finished"][10]
+    assert queue["animal"] is animal
+    assert queue["queue_ending"] > r1.timestamp
+    assert [r["adopter"] for r in queue["reservations"]] == ["adopter_100", "adopter_101"]
+
+    animal_repo.get_by_id.assert_not_called()
+    adopter_repo.get_by_id.assert_not_called()
+
 # ---------------------------------------------------------
 # TESTES prepare_reservation_form
 # ---------------------------------------------------------
@@ -98,11 +111,10 @@ def test_prepare_form_with_selected_ids(service, animal_repo, adopter_repo):
 # ---------------------------------------------------------
 # TESTES create_reservation
 # ---------------------------------------------------------
-def test_create_reservation_first_reservation_updates_status(
+def test_create_reservation_enqueues_reservation(
     service, reservation_repo, animal_repo, adopter_repo, monkeypatch
 ):
-    reservation_repo.has_active_reservations.return_value = False
-    reservation_repo.save.return_value = True
+    reservation_repo.enqueue.side_effect = lambda r: (r, True)
 
     animal_repo.get_by_id.return_value = MagicMock()
     adopter_repo.get_by_id.return_value = MagicMock()
@@ -114,16 +126,16 @@ def test_create_reservation_first_reservation_updates_status(
 
     service.create_reservation(animal_id=1, adopter_id=2)
 
-    animal_repo.update_status.assert_called_once_with(
-        id=1,
-        new_status=AnimalStatus.RESERVED
-    )
+    # A transição para RESERVED acontece na mesma transação (enqueue)
+    reservation = reservation_repo.enqueue.call_args.args[0]
+    assert (reservation.animal_id, reservation.adopter_id) == (1, 2)
+    assert reservation.compatibility_rate == 85
+    reservation_repo.save.assert_not_called()
 
 def test_create_reservation_duplicate_raises_error(
     service, reservation_repo, animal_repo, adopter_repo, monkeypatch
 ):
-    reservation_repo.save.return_value = False
-    reservation_repo.has_active_reservations.return_value = True
+    reservation_repo.enqueue.return_value = None
 
     animal_repo.get_by_id.return_value = MagicMock()
     adopter_repo.get_by_id.return_value = MagicMock()
@@ -133,38 +145,58 @@ def test_create_reservation_duplicate_raises_error(
         lambda self, a, b: 50
     )
 
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="Reserva já existente"):
+        service.create_reservation(animal_id=1, adopter_id=2)
+
+def test_create_reservation_unavailable_animal_raises_error(
+    service, reservation_repo, animal_repo, adopter_repo, monkeypatch
+):
+    reservation_repo.enqueue.side_effect = InvalidStatusTransitionError("ADOPTED -> RESERVED")
+
+    animal_repo.get_by_id.return_value = MagicMock()
+    adopter_repo.get_by_id.return_value = MagicMock()
+
+    monkeypatch.setattr(
+        "services.reservation_service.CompatibilityService.calculate_rate",
+        lambda self, a, b: 50
+    )
+
+    with pytest.raises(ValueError, match="indisponível"):
         service.create_reservation(animal_id=1, adopter_id=2)
 
 # ---------------------------------------------------------
 # TESTES get_queue_ending_time
 # ---------------------------------------------------------
 def test_get_queue_ending_time(service, reservation_repo):
-    first = MagicMock(timestamp=datetime(2024, 1, 1, 10, 0))
-    reservation_repo.get_first_reservation.return_value = first
+    first = datetime(2024, 1, 1, 10, 0)
+    reservation_repo.get_queue_stats.return_value = QueueStats(
+        animal_id=1, active_count=2, best_compatibility_rate=80, first_timestamp=first
+    )
 
     ending = service.get_queue_ending_time(animal_id=1)
 
-    assert isinstance(ending, datetime)
+    assert ending == first + settings.reservation_duration
+
+
+def test_get_queue_ending_time_without_queue(service, reservation_repo):
+    reservation_repo.get_queue_stats.return_value = None
+
+    assert service.get_queue_ending_time(animal_id=1) is None
 
 # ---------------------------------------------------------
 # TESTES cancel_reservation
 # ---------------------------------------------------------
-def test_cancel_reservation_clears_queue_and_updates_status(
+def test_cancel_reservation_cancels_and_releases_atomically(
     service, reservation_repo, animal_repo
 ):
-    reservation = MagicMock(animal_id=1)
-
-    reservation_repo.get_by_id.return_value = reservation
-    reservation_repo.all_canceled.return_value = True
+    reservation_repo.cancel_and_release.return_value = (MagicMock(animal_id=1), True)
 
     service.cancel_reservation(reservation_id=10)
 
-    reservation_repo.clear_queue.assert_called_once_with(1)
-    animal_repo.update_status.assert_called_once_with(
-        id=1,
-        new_status=AnimalStatus.AVAILABLE
-    )
+    # A limpeza da fila e a volta para AVAILABLE ocorrem na mesma transação
+    reservation_repo.cancel_and_release.assert_called_once_with(10)
+    reservation_repo.clear_queue.assert_not_called()
+    animal_repo.update_status.assert_not_called()
 
 # ---------------------------------------------------------
 # TESTES finalize_queue
@@ -196,6 +228,45 @@ def test_finalize_queue_returns_first(service, reservation_repo):
 
     assert result == "reservation"
 
+def test_finalize_queues_collects_selected_reservations(service, reservation_repo):
+    reservation_repo.is_queue_expired.side_effect = lambda animal_id, _: animal_id != 2
+    reservation_repo.list_active_queue.side_effect = lambda animal_id: [f"head {animal_id}"]
+
+    result = service.finalize_queues([1, 2, 3])
+
+    assert result == {1: "head 1", 3: "head 3"}
+
+# ---------------------------------------------------------
+# TESTES start_expiry_scheduler
+# ---------------------------------------------------------
+def test_expiry_scheduler_loads_existing_queues(service, reservation_repo):
+    first = datetime(2024, 1, 1, 10, 0)
+    reservation_repo.list_queue_starts.return_value = [(1, first)]
+
+    scheduler = service.start_expiry_scheduler()
+    scheduler.stop()
+
+    assert scheduler.next_deadline() == first + settings.reservation_duration
+
+def test_create_reservation_schedules_new_queue(
+    service, reservation_repo, animal_repo, adopter_repo, monkeypatch
+):
+    reservation_repo.list_queue_starts.return_value = []
+    reservation_repo.enqueue.side_effect = lambda r: (r, True)
+
+    monkeypatch.setattr(
+        "services.reservation_service.CompatibilityService.calculate_rate",
+        lambda self, a, b: 85
+    )
+
+    scheduler = service.start_expiry_scheduler()
+    scheduler.stop()
+
+    before = datetime.now()
+    service.create_reservation(animal_id=1, adopter_id=2)
+
+    assert scheduler.next_deadline() >= before + settings.reservation_duration
+
 
 # ---------------------------------------------------------
 # TESTES confirm_adoption
@@ -0,0 +1,133 @@
+import gc
+import json
+import os
+import shutil
+import pytest
+from datetime import timedelta
+
+from config import Settings, settings
+from services.compatibility_service import CompatibilityService
+from services.adoption_fee_service import AdoptionFeeService
+
+# ---------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------
+@pytest.fixture
+def settings_file(tmp_path):
+    path = tmp_path / "settings.json"
+    shutil.copy("settings.json", path)
+    return path
+
+
+def edit(path, change) -> None:
+    """Altera o arquivo e garante um mtime diferente do anterior."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    change(data)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def global_settings(monkeypatch, settings_file):
+    """Aponta a configuração global para uma cópia temporária do settings.json."""
+    monkeypatch.setattr(settings, "current", settings.current)
+    monkeypatch.setattr(settings, "path", str(settings_file))
+    return settings_file
+
+# ---------------------------------------------------------
+# SNAPSHOT
+# ---------------------------------------------------------
+def test_derived_structures(settings_file):
+    edit(settings_file, lambda d: d["policies"].update(
+        reservation_duration_hours=2,
+        wary_animal_temperaments=[" arisco", "Reativo", ""]
+    ))
+
+    snapshot = Settings(str(settings_file)).current
+
+    assert snapshot.reservation_duration == timedelta(hours=2)
+    assert snapshot.wary_temperaments == frozenset({"Arisco", "Reativo"})
+    assert snapshot.area_thresholds == (15.0, 35.0, 50.0)
+
+    with pytest.raises(TypeError):
+        snapshot.compatibility_weights["adopter_age"] = 1
+
+
+def test_attributes_are_read_from_current_snapshot(settings_file):
+    config = Settings(str(settings_file))
+
+    assert config.minimum_adopter_age == config.current.minimum_adopter_age
+
+    with pytest.raises(AttributeError):
+        config.missing_setting
+
+# ---------------------------------------------------------
+# RECARGA
+# ---------------------------------------------------------
+def test_refresh_applies_changes_and_notifies(settings_file):
+    config = Settings(str(settings_file))
+    received = []
+    config.on_change(received.append)
+
+    assert config.refresh(force=True) is False
+
+    edit(settings_file, lambda d: d["policies"].update(minimum_adopter_age=21))
+
+    assert config.refresh() is False    # Dentro de CHECK_INTERVAL
+    assert config.refresh(force=True) is True
+    assert config.minimum_adopter_age == 21
+    assert received == [config.current]
+
+
+def test_invalid_file_keeps_previous_settings(settings_file):
+    config = Settings(str(settings_file))
+    previous = config.current
+
+    settings_file.write_text("{", encoding="utf-8")
+    os.utime(settings_file, ns=(0, 1))
+
+    assert config.refresh(force=True) is False
+    assert config.current is previous
+
+
+def test_bound_method_callbacks_are_weak(settings_file):
+    config = Settings(str(settings_file))
+    calls = []
+
+    class Listener:
+        def update(self, snapshot):
+            calls.append(snapshot)
+
+    listener = Listener()
+    config.on_change(listener.update)
+    config.reload()
+
+    del listener
+    gc.collect()
+    config.reload()
+
+    assert len(calls) == 1
+
+# ---------------------------------------------------------
+# RECONSTRUÇÃO DOS SERVIÇOS
+# ---------------------------------------------------------
+def test_services_rebuild_on_reload(global_settings, make_dog, make_adopter):
+    compatibility = CompatibilityService()
+    fees = AdoptionFeeService()
+
+    dog = make_dog(age_months=12 * 10)
+    adopter = make_adopter(has_other_animals=True)
+    rate = compatibility.calculate_rate(dog, adopter)
+
+    def change(data):
+        data["compatibility"]["scores"]["has_other_animals"]["true"] = 0
+        data["policies"]["adoption_fee"]["age_adjustments"]["senior_pet"] = 0
+
+    edit(global_settings, change)
+    assert settings.refresh(force=True) is True
+
+    weight = settings.compatibility_weights["other_animals"]
+    assert compatibility.calculate_rate(dog, adopter) == pytest.approx(rate - 85 * weight)
+    assert fees.calculate_fee(dog) == settings.adoption_fee["base_fee"]
@@ -0,0 +1,102 @@
+import pytest
+from datetime import datetime
+
+from infrastructure.repositories import (
+    AnimalRepository,
+    AdopterRepository,
+    ReservationQueueRepository,
+    TableVersionRepository
+)
+from domain.adoptions.reservation_queue import ReservationQueue
+from domain.enums.animal_status import AnimalStatus
+
+# ---------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------
+@pytest.fixture
+def versions(db_session):
+    repo = TableVersionRepository(db_session)
+    return lambda *tables: repo.read(tables)[0]
+
+# ---------------------------------------------------------
+# TESTES read / bump
+# ---------------------------------------------------------
+def test_read_unknown_tables(db_session):
+    repo = TableVersionRepository(db_session)
+
+    assert repo.read(("animals", "adopters")) == ((0, 0), None)
+
+
+def test_bump_increments_in_order(db_session, versions):
+    repo = TableVersionRepository(db_session)
+
+    repo.bump("animals", "adopters")
+    repo.bump("adopters")
+    _, last_modified = repo.read(("adopters", "animals"))
+
+    assert versions("adopters", "animals", "events") == (2, 1, 0)
+    assert isinstance(last_modified, datetime)
+
+    with pytest.raises(ValueError):
+        repo.bump()
+
+# ---------------------------------------------------------
+# TESTES ESCRITAS DOS REPOSITÓRIOS
+# ---------------------------------------------------------
+def test_crud_bumps_own_table(db_session, versions, make_adopter):
+    repo = AdopterRepository(db_session)
+
+    repo.save(make_adopter(name="Ana"))
+    repo.save_many([make_adopter(name="Bia"), make_adopter(name="Caio")])
+    assert versions("adopters", "animals") == (2, 0)
+
+    adopter = repo.get_by_id(1)
+    adopter.name = "Ana Maria"
+    repo.update(adopter)
+    repo.delete_by(2)
+
+    assert versions("adopters") == (4,)
+
+
+def test_failed_writes_do_not_bump(db_session, versions, make_adopter, make_dog):
+    adopter_repo = AdopterRepository(db_session)
+    animal_repo = AnimalRepository(db_session)
+    timestamp = datetime(2024, 1, 1)
+
+    adopter_repo.save(make_adopter(name="Ana", timestamp=timestamp))
+    assert adopter_repo.save(make_adopter(name="Ana", timestamp=timestamp)) is False
+    assert adopter_repo.save_many([make_adopter(name="Ana", timestamp=timestamp)]) == [0]
+    assert adopter_repo.delete_by(99) is False
+
+    animal_repo.save(make_dog())
+    assert animal_repo.compare_and_set_status(1, 99, AnimalStatus.RESERVED) is False
+
+    assert versions("adopters", "animals") == (1, 1)
+
+
+def test_status_and_queue_writes_bump_both_tables(db_session, versions, make_adopter, make_dog):
+    AnimalRepository(db_session).save(make_dog())
+    AdopterRepository(db_session).save_many([make_adopter(name="Ana"), make_adopter(name="Bia")])
+    reservation_repo = ReservationQueueRepository(db_session)
+
+    def changed(write) -> tuple[bool, bool]:
+        before = versions("animals", "reservation_queue")
+        write()
+        after = versions("animals", "reservation_queue")
+        return tuple(a > b for a, b in zip(after, before))
+
+    def reservation(adopter_id: int) -> ReservationQueue:
+        return ReservationQueue(
+            animal_id=1, adopter_id=adopter_id, compatibility_rate=80, timestamp=datetime.now()
+        )
+
+    assert changed(lambda: reservation_repo.enqueue(reservation(1))) == (True, True)
+    assert changed(lambda: reservation_repo.update_compatibility_rates([(1, 90)])) == (False, True)
+    assert changed(lambda: reservation_repo.cancel_reservation(1)) == (False, True)
+    assert changed(lambda: reservation_repo.enqueue(reservation(2))) == (True, True)
+    assert changed(lambda: reservation_repo.cancel_and_release(2)) == (True, True)
+    assert changed(lambda: reservation_repo.clear_queue(1)) == (False, True)
+    assert changed(
+        lambda: reservation_repo.animal_mapper.update_status(1, AnimalStatus.UNADOPTABLE)
+    ) == (True, False)
+    assert versions("adopters") == (1,)
@@ -0,0 +1,97 @@
+import pytest
+from datetime import datetime, timedelta
+
+from infrastructure.repositories import (
+    AnimalRepository, AdopterRepository, AdoptionRepository,
+    AdoptionReturnRepository, EventRepository
+)
+from services.timeline_service import TimelineService
+from domain.adoptions.adoption import Adoption
+from domain.adoptions.adoption_return import AdoptionReturn
+from domain.events.animal_events import VaccineEvent
+from domain.enums.animal_status import AnimalStatus
+from domain.enums.event_type import EventType
+
+START = datetime(2024, 1, 1)
+
+# ---------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------
+@pytest.fixture
+def service(db_session):
+    return TimelineService(
+        adoption_repo=AdoptionRepository(db_session),
+        adoption_return_repo=AdoptionReturnRepository(db_session),
+        event_repo=EventRepository(db_session),
+        adopter_repo=AdopterRepository(db_session)
+    )
+
+
+@pytest.fixture
+def populate(db_session, make_dog, make_adopter):
+    def factory(n_vaccines: int) -> None:
+        AnimalRepository(db_session).save(make_dog(status=AnimalStatus.RETURNED))
+        AdopterRepository(db_session).save(make_adopter())
+
+        event_repo = EventRepository(db_session)
+        adoption_repo = AdoptionRepository(db_session)
+        return_repo = AdoptionReturnRepository(db_session)
+
+        # Vacinas registradas fora de ordem cronológica
+        for i in reversed(range(n_vaccines)):
+            event_repo.save(VaccineEvent(
+                id=None,
+                animal_id=1,
+                timestamp=START + timedelta(days=2 * i),
+                vaccine_name=f"Vacina {i}",
+                veterinarian="Dra. Ana"
+            ))
+
+        adoption_repo.save(Adoption(
+            animal_id=1, adopter_id=1, fee=100, timestamp=START + timedelta(days=3)
+        ))
+        return_repo.save(AdoptionReturn(
+            adoption_id=1, reason="Mudança", timestamp=START + timedelta(days=5)
+        ))
+        adoption_repo.save(Adoption(
+            animal_id=1, adopter_id=1, fee=100, timestamp=START + timedelta(days=7)
+        ))
+
+    return factory
+
+# ---------------------------------------------------------
+# TESTES build_animal_timeline
+# ---------------------------------------------------------
+def test_timeline_is_chronological(service, populate):
+    populate(n_vaccines=5)
+
+    timeline = service.build_animal_timeline(animal_id=1)
+    timestamps = [e.timestamp for e in timeline]
+
+    assert len(timeline) == 8
+    assert timestamps == sorted(timestamps)
+    assert [e.event_type for e in timeline if e.event_type != EventType.VACCINE] == [
+        EventType.ADOPTION, EventType.RETURN, EventType.ADOPTION
+    ]
+
+
+def test_timeline_includes_adopter_and_return_reason(service, populate):
+    populate(n_vaccines=0)
+
+    adoption, returned, _ = service.build_animal_timeline(animal_id=1)
+
+    assert adoption.adopter.name == "Alice"
+    assert returned.reason == "Mudança"
+
+
+@pytest.mark.parametrize("n_vaccines", [1, 10, 50])
+def test_timeline_statement_count_is_constant(
+    db_session, statements, service, populate, n_vaccines
+):
+    populate(n_vaccines=n_vaccines)
+    db_session.expire_all()
+    statements.clear()
+
+    service.build_animal_timeline(animal_id=1)
+
+    assert len(statements) == 2
@@ -0,0 +1,103 @@
+import pytest
+from datetime import datetime
+
+from infrastructure.repositories import (
+    AnimalRepository, AdopterRepository, AdoptionRepository, ReservationQueueRepository
+)
+from domain.animals.cat import Cat
+from domain.animals.dog import Dog
+from domain.people.adopter import Adopter, HousingType
+from domain.adoptions.adoption import Adoption
+from domain.adoptions.reservation_queue import ReservationQueue
+from domain.enums.animal_enums import Species, Gender, Size
+from domain.enums.animal_status import AnimalStatus
+from domain.exceptions import InvalidStatusTransitionError
+
+NOW = datetime(2024, 1, 1, 12, 0)
+
+ANIMAL_ARGS = dict(
+    breed="Siamês",
+    name="Mia",
+    gender=Gender.FEMALE,
+    age_months=30,
+    size=Size.SMALL,
+    temperament=["Calmo", "Tímido"],
+    status=AnimalStatus.RESERVED,
+    id=7,
+    timestamp=NOW
+)
+
+def state(obj) -> dict:
+    """Valores de todos os slots preenchidos da instância."""
+    slots = {
+        name if not name.startswith("__") else f"_{cls.__name__}{name}"
+        for cls in type(obj).__mro__
+        for name in getattr(cls, "__slots__", ())
+    }
+    return {name: getattr(obj, name) for name in slots if hasattr(obj, name)}
+
+# ---------------------------------------------------------
+# EQUIVALÊNCIA ENTRE from_row E O CONSTRUTOR
+# ---------------------------------------------------------
+@pytest.mark.parametrize("cls, args", [
+    (Cat, dict(ANIMAL_ARGS, species=Species.CAT, is_hypoallergenic=True)),
+    (Dog, dict(ANIMAL_ARGS, species=Species.DOG, needs_walk=True)),
+    (Adopter, dict(
+        name="Alice", age=30, housing_type=HousingType.HOUSE, usable_area=80.0,
+        has_pet_experience=True, has_children_at_home=False, has_other_animals=True,
+        id=3, timestamp=NOW
+    )),
+    (Adoption, dict(animal_id=1, adopter_id=2, fee=150.0, id=4, timestamp=NOW)),
+    (ReservationQueue, dict(
+        animal_id=1, adopter_id=2, compatibility_rate=85.0, is_canceled=False,
+        id=5, timestamp=NOW
+    )),
+])
+def test_from_row_matches_constructor(cls, args):
+    assert state(cls.from_row(**args)) == state(cls(**args))
+
+
+def test_from_row_entities_keep_validating_setters():
+    dog = Dog.from_row(**dict(ANIMAL_ARGS, species=Species.DOG, needs_walk=False))
+
+    dog.status = AnimalStatus.ADOPTED
+
+    with pytest.raises(InvalidStatusTransitionError):
+        dog.status = AnimalStatus.RESERVED
+
+    with pytest.raises(TypeError):
+        dog.needs_walk = "sim"
+
+    assert dog.vaccines == [] and dog.trainings == []
+
+# ---------------------------------------------------------
+# REPOSITÓRIOS
+# ---------------------------------------------------------
+def test_repositories_hydrate_with_from_row(db_session, make_dog, make_adopter, monkeypatch):
+    AnimalRepository(db_session).save(make_dog(temperament=["Calmo"]))
+    AnimalRepository(db_session).save(make_dog(name="Bob", temperament=["Calmo"]))
+    AdopterRepository(db_session).save(make_adopter())
+    AdoptionRepository(db_session).save(Adoption(animal_id=1, adopter_id=1, fee=100.0))
+    ReservationQueueRepository(db_session).save(
+        ReservationQueue(animal_id=2, adopter_id=1, compatibility_rate=60, timestamp=NOW)
+    )
+    db_session.expire_all()
+
+    # O construtor validante não deve ser chamado ao carregar do banco
+    for cls in (Dog, Adopter, Adoption, ReservationQueue):
+        monkeypatch.setattr(cls, "__init__", lambda self, *a, **k: pytest.fail(cls.__name__))
+
+    rex, bob = AnimalRepository(db_session).list_all()
+    adopter = AdopterRepository(db_session).get_by_id(1)
+    adoption = AdoptionRepository(db_session).get_by_id(1)
+    reservation = ReservationQueueRepository(db_session).get_by_id(1)
+
+    assert (rex.name, rex.temperament, rex.status) == ("Rex", ["Calmo"], AnimalStatus.AVAILABLE)
+
+    # Temperamentos iguais são decodificados uma vez, mas cada animal tem a própria lista
+    rex.temperament.append("Brincalhão")
+    assert bob.temperament == ["Calmo"]
+
+    assert adopter.name == "Alice" and adopter.housing_type == HousingType.HOUSE
+    assert (adoption.animal_id, adoption.fee) == (1, 100.0)
+    assert (reservation.compatibility_rate, reservation.timestamp) == (60.0, NOW)